@@ -3,93 +3,255 @@
 고급 키워드 분석기 - 실제 데이터 기반 정량화
 """
 import os
+import copy
 import json
-import requests
-from datetime import datetime, timedelta
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
 from dotenv import load_dotenv
 import pandas as pd
+import requests
+from naver_client import naver_client, NaverSearchClient, NaverAPIError
+from rate_limiter import QuotaExceededError
+from search_volume_store import search_volumes
+from blog_recency import BlogRecencyScanner
+from keyword_scoring import score_metrics
+from metrics_history import metrics_history, snapshot_from_metrics
 
 load_dotenv()
 
+# 소스별 수집 타임아웃 (초) 및 병렬 수집 스레드 수
+SOURCE_TIMEOUT = float(os.getenv('ANALYZE_SOURCE_TIMEOUT', 15))
+MAX_WORKERS = int(os.getenv('ANALYZE_MAX_WORKERS', 8))
+
+# 소스 수집 실패로 보는 오류 (429 등 API 오류, 할당량 초과, 네트워크 오류)
+# 소스별 메트릭 함수는 이 오류를 그대로 전달하고 fetch_source가 기본값 + 실패로 처리
+SOURCE_ERRORS = (NaverAPIError, QuotaExceededError, requests.RequestException)
+
+# 소스별 기본(빈) 메트릭 - 수집 실패/타임아웃 시 사용
+EMPTY_METRICS = {
+    'shopping_data': {
+        'total_products': 0,
+        'avg_price': 0,
+        'price_range': {'min': 0, 'max': 0},
+        'top_categories': [],
+        'brand_diversity': 0
+    },
+    'blog_data': {
+        'total_posts': 0,
+        'recent_posts_24h': 0,
+        'recent_posts_7d': 0,
+        'recent_posts_30d': 0,
+        'posts_per_day': 0.0,
+        'is_lower_bound': False,
+        'posting_frequency': 'unknown'
+    },
+    'cafe_data': {'total_articles': 0, 'community_interest': 'unknown'},
+    'news_data': {'total_news': 0, 'recent_news_24h': 0, 'media_attention': 'unknown'}
+}
+
 class AdvancedKeywordAnalyzer:
-    def __init__(self):
-        self.config = {
-            'naver_client_id': os.getenv('NAVER_CLIENT_ID'),
-            'naver_client_secret': os.getenv('NAVER_CLIENT_SECRET')
+    # 프로세스 공용 스레드 풀 (처음 사용할 때 생성)
+    _executor = None
+    
+    def __init__(self, client: NaverSearchClient = None, score_weights: Dict = None):
+        self.client = client or naver_client
+        self.score_weights = score_weights
+        self.volumes = search_volumes
+        self.recency_scanner = BlogRecencyScanner(self.client)
+        self.history = metrics_history
+        self.source_fetchers = {
+            'shopping_data': self.get_shopping_metrics,
+            'blog_data': self.get_blog_metrics,
+            'cafe_data': self.get_cafe_metrics,
+            'news_data': self.get_news_metrics
         }
+    
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """소스 병렬 수집용 스레드 풀"""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                                               thread_name_prefix='analyzer')
+        return cls._executor
+    
+    @staticmethod
+    def empty_metrics(source: str) -> Dict:
+        """소스별 기본 메트릭 사본"""
+        return copy.deepcopy(EMPTY_METRICS[source])
+        
+    def analyze_keyword_metrics(self, keyword: str, concurrent: bool = False,
+                                timeout: float = SOURCE_TIMEOUT,
+                                on_source: Callable[[str, Dict, bool], None] = None) -> Dict:
+        """키워드의 실제 메트릭 수집
         
-    def analyze_keyword_metrics(self, keyword: str) -> Dict:
-        """키워드의 실제 메트릭 수집"""
+        concurrent=True 이면 쇼핑/블로그/카페/뉴스를 동시에 수집한다.
+        timeout 안에 끝나지 않은 소스는 기본값으로 채우고 failed_sources에 기록한다.
+        on_source(소스, 메트릭, 성공여부)는 소스 하나가 끝날 때마다 호출된다 (진행 상황 표시용).
+        """
         print(f"\n📊 '{keyword}' 상세 분석 중...")
         
+        if concurrent:
+            source_results = self.iter_source_metrics(keyword, timeout)
+        else:
+            source_results = ((source, *self.fetch_source(source, keyword))
+                              for source in self.source_fetchers)
+        return self.assemble_metrics(keyword, source_results, on_source)
+    
+    def assemble_metrics(self, keyword: str, source_results: Iterable[Tuple[str, Dict, bool]],
+                         on_source: Callable[[str, Dict, bool], None] = None) -> Dict:
+        """소스별 (소스, 메트릭, 성공여부) 결과를 모아 최종 메트릭 구성 (동기/병렬/비동기 수집 공용)"""
         metrics = {
             'keyword': keyword,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M'),
-            'shopping_data': self.get_shopping_metrics(keyword),
-            'blog_data': self.get_blog_metrics(keyword),
-            'cafe_data': self.get_cafe_metrics(keyword),
-            'news_data': self.get_news_metrics(keyword),
-            'datalab_trend': self.get_datalab_trend(keyword),
-            'weekly_comparison': self.get_weekly_comparison(keyword)
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M')
         }
+        failed_sources = []
+        for source, data, ok in source_results:
+            metrics[source] = data
+            if not ok:
+                failed_sources.append(source)
+            if on_source:
+                on_source(source, data, ok)
+        if failed_sources:
+            metrics['failed_sources'] = failed_sources
+        
+        return self.finalize_metrics(metrics)
+    
+    def finalize_metrics(self, metrics: Dict) -> Dict:
+        """소스 메트릭이 채워진 결과에 트렌드/주간 비교/종합 점수 추가 후 이력 저장"""
+        keyword = metrics['keyword']
         
         # 종합 점수 계산
         metrics['total_score'] = self.calculate_total_score(metrics)
         
+        # 저장된 이력과 비교 (추가 API 호출 없음)
+        snapshot = snapshot_from_metrics(
+            dict(metrics, blog_data=self.normalize_blog_metrics(metrics['blog_data'])))
+        metrics['datalab_trend'] = self.get_datalab_trend(keyword, snapshot)
+        metrics['weekly_comparison'] = self.get_weekly_comparison(keyword, snapshot)
+        
+        # 일부 소스가 실패한 결과는 이력을 왜곡하므로 저장하지 않음
+        if not metrics.get('failed_sources'):
+            try:
+                self.history.record(keyword, snapshot)
+            except Exception as e:
+                print(f"  ⚠️ 이력 저장 실패: {e}")
+        
         return metrics
     
+    @staticmethod
+    def normalize_blog_metrics(blog_data: Dict) -> Dict:
+        """예전 형식의 블로그 메트릭("100+" 같은 문자열)을 숫자 + 하한 여부로 변환한 사본 반환
+        
+        캐시에 남아 있는 이전 분석 결과를 그대로 표시/점수 계산할 수 있도록 한다.
+        """
+        normalized = dict(blog_data)
+        for field in ('recent_posts_24h', 'recent_posts_7d', 'recent_posts_30d'):
+            value = normalized.get(field, 0)
+            if isinstance(value, str):
+                digits = ''.join(ch for ch in value if ch.isdigit())
+                normalized[field] = int(digits) if digits else 0
+                if field == 'recent_posts_7d' and value.endswith('+'):
+                    normalized['is_lower_bound'] = True
+        normalized.setdefault('is_lower_bound', False)
+        normalized.setdefault('posts_per_day', round(normalized.get('recent_posts_7d', 0) / 7, 2))
+        return normalized
+    
+    def fetch_source(self, source: str, keyword: str) -> Tuple[Dict, bool]:
+        """소스 하나 수집 - (메트릭, 성공 여부)
+        
+        API 오류(429 등)/할당량 초과/네트워크 오류는 기본값으로 채우고 실패로 표시한다
+        (실패한 결과는 캐시/이력/저널에 남기지 않음).
+        """
+        try:
+            return self.source_fetchers[source](keyword), True
+        except SOURCE_ERRORS as e:
+            print(f"  ❌ {source} 수집 실패: {e}")
+            return self.empty_metrics(source), False
+    
+    def iter_source_metrics(self, keyword: str,
+                            timeout: float = SOURCE_TIMEOUT) -> Iterator[Tuple[str, Dict, bool]]:
+        """소스별 메트릭을 병렬 수집하여 끝나는 순서대로 (소스, 메트릭, 성공여부) 반환
+        
+        타임아웃은 소스 수집이 실제로 시작된 시점부터 잰다 (공용 스레드 풀 대기 시간은 제외).
+        타임아웃된 소스는 기본값으로 채우고, 끝나면 아직 시작하지 않은 수집은 취소한다.
+        """
+        executor = self.get_executor()
+        started = {}
+        
+        def fetch(source):
+            started[source] = time.monotonic()
+            return self.fetch_source(source, keyword)
+        
+        futures = {executor.submit(fetch, source): source for source in self.source_fetchers}
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+                deadlines = {future: started[futures[future]] + timeout
+                             for future in pending if futures[future] in started}
+                
+                # 타임아웃된 소스는 기본값으로 채움 (부분 결과 반환)
+                for future, deadline in deadlines.items():
+                    if deadline <= now:
+                        pending.discard(future)
+                        future.cancel()
+                        source = futures[future]
+                        print(f"  ⏱️ {source} 수집 타임아웃 ({timeout}초)")
+                        yield source, self.empty_metrics(source), False
+                if not pending:
+                    break
+                
+                # 시작 전인 소스는 시작되면 최소 timeout만큼 기다리므로 그 안에 다시 확인
+                remaining = min((deadline - now for deadline in deadlines.values() if deadline > now),
+                                default=timeout)
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    data, ok = future.result()
+                    yield futures[future], data, ok
+        finally:
+            for future in pending:
+                future.cancel()
+    
     def get_shopping_metrics(self, keyword: str) -> Dict:
         """쇼핑 검색 메트릭"""
-        url = "https://openapi.naver.com/v1/search/shop.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        
-        metrics = {
-            'total_products': 0,
-            'avg_price': 0,
-            'price_range': {'min': 0, 'max': 0},
-            'top_categories': [],
-            'brand_diversity': 0
-        }
+        metrics = self.empty_metrics('shopping_data')
         
         try:
             # 첫 페이지로 전체 상품 수 확인
-            params = {"query": keyword, "display": 100, "sort": "sim"}
-            response = requests.get(url, headers=headers, params=params)
+            data = self.client.shop(keyword, display=100, sort="sim")
+            metrics['total_products'] = data.get('total', 0)
+            self.volumes.record(keyword, shop_total=metrics['total_products'])
             
-            if response.status_code == 200:
-                data = response.json()
-                metrics['total_products'] = data.get('total', 0)
+            items = data.get('items', [])
+            if items:
+                prices = [int(item['lprice']) for item in items if item.get('lprice')]
+                if prices:
+                    metrics['avg_price'] = sum(prices) / len(prices)
+                    metrics['price_range'] = {
+                        'min': min(prices),
+                        'max': max(prices)
+                    }
                 
-                items = data.get('items', [])
-                if items:
-                    prices = [int(item['lprice']) for item in items if item.get('lprice')]
-                    if prices:
-                        metrics['avg_price'] = sum(prices) / len(prices)
-                        metrics['price_range'] = {
-                            'min': min(prices),
-                            'max': max(prices)
-                        }
-                    
-                    # 브랜드 다양성
-                    brands = set(item.get('brand', 'unknown') for item in items)
-                    metrics['brand_diversity'] = len(brands)
-                    
-                    # 카테고리 분포
-                    categories = {}
-                    for item in items:
-                        cat = item.get('category1', 'unknown')
-                        categories[cat] = categories.get(cat, 0) + 1
-                    
-                    metrics['top_categories'] = sorted(
-                        categories.items(), 
-                        key=lambda x: x[1], 
-                        reverse=True
-                    )[:5]
-                    
+                # 브랜드 다양성
+                brands = set(item.get('brand', 'unknown') for item in items)
+                metrics['brand_diversity'] = len(brands)
+                
+                # 카테고리 분포
+                categories = {}
+                for item in items:
+                    cat = item.get('category1', 'unknown')
+                    categories[cat] = categories.get(cat, 0) + 1
+                
+                metrics['top_categories'] = sorted(
+                    categories.items(), 
+                    key=lambda x: x[1], 
+                    reverse=True
+                )[:5]
+                
+        except SOURCE_ERRORS:
+            raise
         except Exception as e:
             print(f"  ❌ 쇼핑 메트릭 수집 실패: {e}")
             
@@ -97,118 +259,45 @@ class AdvancedKeywordAnalyzer:
     
     def get_blog_metrics(self, keyword: str) -> Dict:
         """블로그 검색 메트릭"""
-        url = "https://openapi.naver.com/v1/search/blog.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        
-        metrics = {
-            'total_posts': 0,
-            'recent_posts_24h': 0,
-            'recent_posts_7d': 0,
-            'recent_posts_30d': 0,
-            'posting_frequency': 'unknown'
-        }
+        metrics = self.empty_metrics('blog_data')
         
         try:
-            # 전체 포스트 수
-            params = {"query": keyword, "display": 1}
-            response = requests.get(url, headers=headers, params=params)
+            # 최근 포스트 분석 (날짜순으로 30일을 덮을 때까지만 페이지 조회)
+            # 전체 포스트 수는 공용 검색량 저장소에 있으면 재사용, 없으면 첫 페이지 응답의 total 사용
+            total = self.volumes.lookup(keyword, 'blog_total')
+            recency = self.recency_scanner.scan(keyword, total=total)
+            if total is None:
+                self.volumes.record(keyword, blog_total=recency['total'])
+            metrics['total_posts'] = recency['total']
+            posts_24h, posts_7d, posts_30d = (recency['counts'][days] for days in (1, 7, 30))
             
-            if response.status_code == 200:
-                data = response.json()
-                metrics['total_posts'] = data.get('total', 0)
-                
-                # 최근 포스트 분석 (날짜 기준)
-                params = {"query": keyword, "display": 100, "sort": "date"}
-                response = requests.get(url, headers=headers, params=params)
-                
-                if response.status_code == 200:
-                    items = response.json().get('items', [])
-                    now = datetime.now()
-                    
-                    # 실제 날짜 계산
-                    posts_24h = 0
-                    posts_7d = 0
-                    posts_30d = 0
-                    
-                    print(f"  📊 최근 블로그 {len(items)}개 분석 중...")
-                    
-                    for i, item in enumerate(items):
-                        # 포스트 날짜 파싱 (예: 20240801)
-                        post_date_str = item.get('postdate', '')
-                        if post_date_str and len(post_date_str) == 8:
-                            try:
-                                post_date = datetime.strptime(post_date_str, '%Y%m%d')
-                                days_diff = (now - post_date).days
-                                
-                                # 디버그: 첫 5개 항목 날짜 출력
-                                if i < 5:
-                                    print(f"    - 포스트 {i+1}: {post_date_str} ({days_diff}일 전)")
-                                
-                                if days_diff <= 1:
-                                    posts_24h += 1
-                                if days_diff <= 7:
-                                    posts_7d += 1
-                                else:
-                                    # 7일 이상 된 포스트를 만나면 중단 (이미 날짜순 정렬)
-                                    break
-                                if days_diff <= 30:
-                                    posts_30d += 1
-                            except Exception as e:
-                                print(f"    ❌ 날짜 파싱 오류: {post_date_str} - {e}")
-                                pass
-                    
-                    # 100개 제한에 대한 추정치 계산
-                    if len(items) == 100:
-                        # 마지막 항목의 날짜 확인
-                        last_date_str = items[-1].get('postdate', '')
-                        if last_date_str:
-                            try:
-                                last_date = datetime.strptime(last_date_str, '%Y%m%d')
-                                last_days_diff = (now - last_date).days
-                                
-                                print(f"    ℹ️ API 제한: 마지막 포스트가 {last_days_diff}일 전")
-                                
-                                if last_days_diff == 0:
-                                    # 100개 모두 오늘 = 하루 100개 이상
-                                    posts_24h = "100+"
-                                    posts_7d = "700+"  # 대략 추정
-                                    posts_30d = "3000+"
-                                elif last_days_diff <= 1:
-                                    # 100개가 이틀 내 = 이틀에 100개
-                                    posts_7d = "350+"  # 대략 추정
-                                    posts_30d = "1500+"
-                                elif last_days_diff <= 7:
-                                    # 100개 모두 7일 이내
-                                    posts_7d = f"{posts_7d}+"
-                                    posts_30d = f"{int(posts_30d * 30/7)}+"  # 비율로 추정
-                                elif last_days_diff <= 30:
-                                    # 100개가 30일 이내
-                                    posts_30d = f"{posts_30d}+"
-                            except:
-                                pass
-                    
-                    metrics['recent_posts_24h'] = posts_24h
-                    metrics['recent_posts_7d'] = posts_7d
-                    metrics['recent_posts_30d'] = posts_30d
-                    
-                    # 포스팅 빈도 계산
-                    if isinstance(posts_7d, str):
-                        # 문자열인 경우 (100+ 등)
-                        metrics['posting_frequency'] = '매우 높음'
-                    elif posts_7d > 50:
-                        metrics['posting_frequency'] = '매우 높음'
-                    elif posts_7d > 20:
-                        metrics['posting_frequency'] = '높음'
-                    elif posts_7d > 10:
-                        metrics['posting_frequency'] = '보통'
-                    else:
-                        metrics['posting_frequency'] = '낮음'
-                    
-                    print(f"  📝 블로그 메트릭 - 24h: {posts_24h}, 7d: {posts_7d}, 30d: {posts_30d}")
+            print(f"  📊 최근 블로그 {recency['scanned']}개 분석 ({recency['pages']}페이지)")
+            estimated = [days for days, exact in recency['exact'].items() if not exact]
+            if estimated:
+                print(f"    ℹ️ API 조회 한도로 {estimated}일 구간은 게시 속도"
+                      f"({recency['posts_per_day']}개/일)로 추정")
+            
+            metrics['recent_posts_24h'] = posts_24h
+            metrics['recent_posts_7d'] = posts_7d
+            metrics['recent_posts_30d'] = posts_30d
+            metrics['posts_per_day'] = recency['posts_per_day']
+            # 조회 한도로 7일 구간을 다 세지 못했으면 실제 값은 이보다 클 수 있음
+            metrics['is_lower_bound'] = not recency['exact'][7]
+            
+            # 포스팅 빈도 계산
+            if posts_7d > 50:
+                metrics['posting_frequency'] = '매우 높음'
+            elif posts_7d > 20:
+                metrics['posting_frequency'] = '높음'
+            elif posts_7d > 10:
+                metrics['posting_frequency'] = '보통'
+            else:
+                metrics['posting_frequency'] = '낮음'
+            
+            print(f"  📝 블로그 메트릭 - 24h: {posts_24h}, 7d: {posts_7d}, 30d: {posts_30d}")
                         
+        except SOURCE_ERRORS:
+            raise
         except Exception as e:
             print(f"  ❌ 블로그 메트릭 수집 실패: {e}")
             
@@ -216,32 +305,23 @@ class AdvancedKeywordAnalyzer:
     
     def get_cafe_metrics(self, keyword: str) -> Dict:
         """카페 검색 메트릭"""
-        url = "https://openapi.naver.com/v1/search/cafearticle.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        
-        metrics = {'total_articles': 0, 'community_interest': 'unknown'}
+        metrics = self.empty_metrics('cafe_data')
         
         try:
-            params = {"query": keyword, "display": 1}
-            response = requests.get(url, headers=headers, params=params)
+            metrics['total_articles'] = self.volumes.get_total(keyword, 'cafe_total', self.client)
             
-            if response.status_code == 200:
-                data = response.json()
-                metrics['total_articles'] = data.get('total', 0)
-                
-                # 커뮤니티 관심도
-                if metrics['total_articles'] > 10000:
-                    metrics['community_interest'] = '매우 높음'
-                elif metrics['total_articles'] > 5000:
-                    metrics['community_interest'] = '높음'
-                elif metrics['total_articles'] > 1000:
-                    metrics['community_interest'] = '보통'
-                else:
-                    metrics['community_interest'] = '낮음'
+            # 커뮤니티 관심도
+            if metrics['total_articles'] > 10000:
+                metrics['community_interest'] = '매우 높음'
+            elif metrics['total_articles'] > 5000:
+                metrics['community_interest'] = '높음'
+            elif metrics['total_articles'] > 1000:
+                metrics['community_interest'] = '보통'
+            else:
+                metrics['community_interest'] = '낮음'
                     
+        except SOURCE_ERRORS:
+            raise
         except Exception as e:
             print(f"  ❌ 카페 메트릭 수집 실패: {e}")
             
@@ -249,117 +329,56 @@ class AdvancedKeywordAnalyzer:
     
     def get_news_metrics(self, keyword: str) -> Dict:
         """뉴스 검색 메트릭"""
-        url = "https://openapi.naver.com/v1/search/news.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        
-        metrics = {'total_news': 0, 'recent_news_24h': 0, 'media_attention': 'unknown'}
+        metrics = self.empty_metrics('news_data')
         
         try:
-            params = {"query": keyword, "display": 100, "sort": "date"}
-            response = requests.get(url, headers=headers, params=params)
+            data = self.client.news(keyword, display=100, sort="date")
+            metrics['total_news'] = data.get('total', 0)
+            self.volumes.record(keyword, news_total=metrics['total_news'])
             
-            if response.status_code == 200:
-                data = response.json()
-                metrics['total_news'] = data.get('total', 0)
-                
-                # 24시간 내 뉴스
-                items = data.get('items', [])
-                now = datetime.now()
+            # 24시간 내 뉴스
+            items = data.get('items', [])
+            now = datetime.now()
+            
+            for item in items:
+                pub_date = item.get('pubDate', '')
+                # 뉴스 날짜는 다른 형식일 수 있음
+                # 실제 구현 시 날짜 파싱 로직 필요
                 
-                for item in items:
-                    pub_date = item.get('pubDate', '')
-                    # 뉴스 날짜는 다른 형식일 수 있음
-                    # 실제 구현 시 날짜 파싱 로직 필요
-                    
-                # 미디어 관심도
-                if metrics['total_news'] > 100:
-                    metrics['media_attention'] = '높음'
-                elif metrics['total_news'] > 30:
-                    metrics['media_attention'] = '보통'
-                else:
-                    metrics['media_attention'] = '낮음'
+            # 미디어 관심도
+            if metrics['total_news'] > 100:
+                metrics['media_attention'] = '높음'
+            elif metrics['total_news'] > 30:
+                metrics['media_attention'] = '보통'
+            else:
+                metrics['media_attention'] = '낮음'
                     
+        except SOURCE_ERRORS:
+            raise
         except Exception as e:
             print(f"  ❌ 뉴스 메트릭 수집 실패: {e}")
             
         return metrics
     
-    def get_datalab_trend(self, keyword: str) -> Dict:
-        """데이터랩 트렌드 (시뮬레이션)"""
-        # 실제로는 네이버 데이터랩 API 사용
-        # 여기서는 쇼핑 데이터 기반으로 추정
-        
-        return {
-            'trend_direction': '상승',  # 상승/하락/유지
-            'trend_strength': 75,  # 0-100
-            'seasonality': '계절성 있음'
-        }
+    def get_datalab_trend(self, keyword: str, current: Dict = None) -> Dict:
+        """트렌드 - 저장된 이력의 블로그 게시 속도 변화로 계산 (이력이 없으면 '데이터 부족')"""
+        current = current or self.history.get_snapshot(keyword, date.today())
+        if current is None:
+            return {'trend_direction': '데이터 부족', 'trend_strength': 0, 'seasonality': '데이터 부족'}
+        return self.history.trend(keyword, current)
     
-    def get_weekly_comparison(self, keyword: str) -> Dict:
-        """주간 비교 데이터"""
-        # 실제로는 일주일 전 데이터와 비교
-        # 여기서는 시뮬레이션
-        
-        return {
-            'search_volume_change': '+23%',
-            'posting_change': '+15%',
-            'price_change': '-5%'
-        }
+    def get_weekly_comparison(self, keyword: str, current: Dict = None) -> Dict:
+        """주간 비교 데이터 - 1주 전 저장된 스냅샷과의 변화율"""
+        current = current or self.history.get_snapshot(keyword, date.today())
+        if current is None:
+            return {'search_volume_change': 'N/A', 'posting_change': 'N/A',
+                    'price_change': 'N/A', 'compared_with': None}
+        return self.history.weekly_comparison(keyword, current)
     
     def calculate_total_score(self, metrics: Dict) -> float:
-        """종합 점수 계산"""
-        score = 0
-        
-        # 쇼핑 상품 수 (0-30점)
-        products = metrics['shopping_data']['total_products']
-        score += min(30, products / 100)
-        
-        # 블로그 활성도 (0-25점)
-        blog_posts = metrics['blog_data']['recent_posts_7d']
-        if isinstance(blog_posts, str):
-            # "100+" 같은 문자열인 경우
-            if "100+" in str(blog_posts):
-                score += 25  # 최고점
-            elif "+" in str(blog_posts):
-                # 숫자 부분만 추출
-                try:
-                    num = int(blog_posts.replace("+", ""))
-                    score += min(25, num / 4)
-                except:
-                    score += 20  # 기본 높은 점수
-            else:
-                score += 20
-        else:
-            # 숫자인 경우
-            score += min(25, blog_posts / 4)
-        
-        # 가격대 (0-20점) - 중간 가격대가 좋음
-        avg_price = metrics['shopping_data']['avg_price']
-        if 10000 <= avg_price <= 100000:
-            score += 20
-        elif 5000 <= avg_price <= 200000:
-            score += 15
-        else:
-            score += 10
-            
-        # 브랜드 다양성 (0-15점)
-        brands = metrics['shopping_data']['brand_diversity']
-        score += min(15, brands * 1.5)
-        
-        # 커뮤니티 관심도 (0-10점)
-        if metrics['cafe_data']['community_interest'] == '매우 높음':
-            score += 10
-        elif metrics['cafe_data']['community_interest'] == '높음':
-            score += 7
-        elif metrics['cafe_data']['community_interest'] == '보통':
-            score += 5
-        else:
-            score += 2
-            
-        return round(score, 1)
+        """종합 점수 계산 (배점은 keyword_scoring.DEFAULT_SCORE_WEIGHTS, 대량 재채점과 같은 계산)"""
+        blog_data = self.normalize_blog_metrics(metrics['blog_data'])
+        return score_metrics(dict(metrics, blog_data=blog_data), self.score_weights)
     
     def display_detailed_metrics(self, metrics: Dict):
         """상세 메트릭 표시"""
@@ -380,8 +399,10 @@ class AdvancedKeywordAnalyzer:
         blog = metrics['blog_data']
         print(f"\n📝 블로그 활동:")
         print(f"  • 총 포스트: {blog['total_posts']:,}개")
-        print(f"  • 24시간 내: {blog['recent_posts_24h']}개")
-        print(f"  • 7일 내: {blog['recent_posts_7d']}개")
+        lower_bound = '+' if blog['is_lower_bound'] else ''
+        print(f"  • 24시간 내: {blog['recent_posts_24h']:,}개")
+        print(f"  • 7일 내: {blog['recent_posts_7d']:,}{lower_bound}개")
+        print(f"  • 하루 평균: {blog['posts_per_day']:,}개")
         print(f"  • 포스팅 빈도: {blog['posting_frequency']}")
         
         # 커뮤니티 & 뉴스
@@ -410,17 +431,22 @@ class AdvancedKeywordAnalyzer:
         else:
             print("  ⚠️ 추천도: 낮음 - 다른 키워드 고려")
     
-    def analyze_multiple_keywords(self, keywords: List[str]) -> pd.DataFrame:
-        """여러 키워드 비교 분석"""
-        results = []
+    def analyze_multiple_keywords(self, keywords: List[str], concurrency: int = None) -> pd.DataFrame:
+        """여러 키워드 비교 분석 (비동기 엔진으로 동시 수집)"""
+        from async_keyword_analyzer import AsyncKeywordAnalyzer, DEFAULT_CONCURRENCY
         
-        for keyword in keywords:
-            metrics = self.analyze_keyword_metrics(keyword)
+        with AsyncKeywordAnalyzer(self, concurrency=concurrency or DEFAULT_CONCURRENCY) as engine:
+            analyzed = engine.analyze_all(keywords)
+        
+        results = []
+        for metrics in analyzed:
+            keyword = metrics['keyword']
             results.append({
                 '키워드': keyword,
                 '상품수': metrics['shopping_data']['total_products'],
                 '평균가격': f"{metrics['shopping_data']['avg_price']:,.0f}",
                 '7일포스팅': metrics['blog_data']['recent_posts_7d'],
+                '일평균포스팅': metrics['blog_data']['posts_per_day'],
                 '포스팅빈도': metrics['blog_data']['posting_frequency'],
                 '커뮤니티관심도': metrics['cafe_data']['community_interest'],
                 '종합점수': metrics['total_score']
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+비동기 대량 키워드 분석 엔진
+- N개 키워드 × M개 소스를 동시에 수집 (동시 실행 수 제한)
+- 전역 요청 속도 제한 (naver_client 공용 제한기)
+- 키워드별 결과를 끝나는 순서대로 반환
+"""
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Tuple, Union
+from advanced_keyword_analyzer import AdvancedKeywordAnalyzer
+
+# 동시에 진행할 소스 수집 요청 수
+DEFAULT_CONCURRENCY = int(os.getenv('SWEEP_CONCURRENCY', 8))
+
+
+class AsyncKeywordAnalyzer:
+    def __init__(self, analyzer: AdvancedKeywordAnalyzer = None,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        self.analyzer = analyzer or AdvancedKeywordAnalyzer()
+        self.concurrency = max(1, concurrency)
+
+        # 동기 풀 클라이언트(커넥션 재사용, 공용 속도 제한)를 그대로 쓰기 위한 I/O 스레드
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency,
+                                           thread_name_prefix='sweep')
+        self._semaphore = None
+
+    def close(self):
+        """I/O 스레드 풀 종료 (진행 중인 수집은 끝까지 기다림)"""
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def _fetch_source(self, source: str, keyword: str) -> Tuple[Dict, bool]:
+        """소스 하나 수집 (동시 실행 수 제한) - (메트릭, 성공 여부) 반환"""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self.analyzer.fetch_source,
+                                              source, keyword)
+
+    async def analyze_keyword(self, keyword: str) -> Dict:
+        """키워드 하나의 모든 소스를 동시에 수집하여 메트릭 반환"""
+        sources = list(self.analyzer.source_fetchers)
+        results = await asyncio.gather(
+            *(self._fetch_source(source, keyword) for source in sources)
+        )
+        return self.analyzer.assemble_metrics(
+            keyword, ((source, data, ok) for source, (data, ok) in zip(sources, results)))
+
+    async def iter_analyze(self, keywords: List[str]) -> AsyncIterator[Dict]:
+        """여러 키워드를 동시에 분석하고 끝나는 순서대로 결과 반환"""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        tasks = [asyncio.ensure_future(self.analyze_keyword(keyword))
+                 for keyword in dict.fromkeys(keywords)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def analyze_all(self, keywords: List[str], callback=None) -> Union[List[Dict], int]:
+        """동기 코드용 래퍼 - 전체 결과 목록 반환
+
+        callback이 주어지면 결과를 모으지 않고 끝나는 순서대로 callback(metrics) 호출 후
+        분석한 키워드 수만 반환 (대량 분석 시 메모리 사용량 일정)
+        """
+        async def run():
+            results = []
+            completed = 0
+            async for metrics in self.iter_analyze(keywords):
+                completed += 1
+                if callback:
+                    callback(metrics)
+                else:
+                    results.append(metrics)
+            return completed if callback else results
+
+        return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    from expanded_keyword_list import get_all_keywords
+
+    keywords = get_all_keywords()
+    started = datetime.now()
+
+    def report(metrics):
+        print(f"✅ {metrics['keyword']}: {metrics['total_score']}점")
+
+    with AsyncKeywordAnalyzer() as engine:
+        completed = engine.analyze_all(keywords, callback=report)
+    elapsed = (datetime.now() - started).total_seconds()
+    print(f"\n🏁 {completed}개 키워드 분석 완료 ({elapsed:.1f}초)")
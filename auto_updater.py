@@ -2,19 +2,32 @@
 """
 자동 업데이트 시스템
 - 트렌드 키워드: 주 1회 자동 업데이트
-- 캐시 데이터: 24시간 후 자동 만료
+- 캐시 데이터: 24시간 후 자동 만료 (워커 간 공유 저장소)
+  만료 후에도 엔드포인트별 허용 기간 동안은 이전 값을 즉시 반환하고 백그라운드에서 갱신
 - 인기 키워드: 매일 새벽 자동 수집
+- 캐시 예열: 매일 새벽 인기/트렌드 키워드 분석 결과를 미리 캐시 (API 예산 내)
+- 배치 작업은 별도 스케줄러 프로세스에서만 실행 (python -m auto_updater --scheduler)
 """
 import os
 import json
-import requests
-import schedule
 import time
+import signal
+import argparse
 import threading
-from datetime import datetime, timedelta
-from typing import Dict, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import logging
+from naver_client import naver_client
+from cache_store import create_cache_store, LocalLRUCache
+from search_volume_store import search_volumes
+from blog_recency import BlogRecencyScanner
+from cache_warmer import CacheWarmer, WARM_AT
+from scheduler import JobScheduler
+from job_queue import JobQueue
+from trend_terms import count_terms, top_terms
 
 load_dotenv()
 
@@ -29,45 +42,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 캐시 키 접두어별 stale 허용 기간 (초) - 만료 후 이 기간 동안은 이전 값을 바로 반환
+MAX_STALE_WINDOWS = {
+    'analysis_': int(os.getenv('ANALYZE_MAX_STALE', 86400)),
+    'products_': int(os.getenv('PRODUCTS_MAX_STALE', 21600)),
+    'refine_': int(os.getenv('REFINE_MAX_STALE', 86400))
+}
+
+# 백그라운드 갱신 스레드 수 / 동시에 대기할 수 있는 갱신 작업 수
+REVALIDATE_WORKERS = int(os.getenv('REVALIDATE_WORKERS', 2))
+REVALIDATE_MAX_PENDING = int(os.getenv('REVALIDATE_MAX_PENDING', 32))
+
+# 쇼핑 트렌드 수집 대상 (네이버 쇼핑 1분류) / 카테고리당 조회 페이지 수(100개씩) / 카테고리당 트렌드 단어 수
+SHOPPING_CATEGORIES = {
+    '50000000': '패션의류', '50000001': '패션잡화', '50000002': '화장품/미용',
+    '50000003': '디지털/가전', '50000004': '가구/인테리어', '50000005': '출산/육아',
+    '50000006': '식품', '50000007': '스포츠/레저', '50000008': '생활/건강',
+    '50000009': '여가/생활편의'
+}
+TREND_PAGES = int(os.getenv('TREND_PAGES', 3))
+TREND_TERMS_PER_CATEGORY = 5
+
+# 인기 키워드 업데이트 시 동시 조회 수 (요청 간격은 공용 속도 제한으로 관리)
+POPULAR_WORKERS = int(os.getenv('POPULAR_WORKERS', 8))
+
 class AutoUpdater:
     def __init__(self):
-        self.headers = {
-            "X-Naver-Client-Id": os.getenv('NAVER_CLIENT_ID'),
-            "X-Naver-Client-Secret": os.getenv('NAVER_CLIENT_SECRET')
-        }
+        self.client = naver_client
         self.trend_keywords_file = 'data/trend_keywords.json'
         self.popular_keywords_file = 'data/popular_keywords.json'
-        self.cache_file = 'data/cache_data.json'
+        self.legacy_cache_file = 'data/cache_data.json'
         
         # 데이터 디렉토리 생성
         os.makedirs('data', exist_ok=True)
         
+        # 워커 간 공유 캐시 (CACHE_BACKEND: sqlite | redis | memory)
+        self.cache = create_cache_store()
+        # 인기 분석 결과는 프로세스 내부 LRU에서 바로 응답
+        self.local_cache = LocalLRUCache()
+        self.local_cache_prefixes = ('analysis_',)
+        
+        # stale 항목 백그라운드 갱신용
+        self.revalidate_executor = ThreadPoolExecutor(max_workers=REVALIDATE_WORKERS,
+                                                      thread_name_prefix='revalidate')
+        self._revalidating = set()
+        self._revalidate_lock = threading.Lock()
+        
+        # 인기 키워드 조회 (분석기와 같은 최근 포스트 스캐너)
+        self.recency_scanner = BlogRecencyScanner(self.client)
+        self._popular_executor = None
+        self._job_queue = None
+        
+        # 인기/트렌드 키워드 캐시 예열
+        self.warmer = CacheWarmer(self)
+        
         # 초기 데이터 로드
         self.load_data()
     
     def load_data(self):
         """저장된 데이터 로드"""
-        # 트렌드 키워드
-        if os.path.exists(self.trend_keywords_file):
-            with open(self.trend_keywords_file, 'r', encoding='utf-8') as f:
-                self.trend_keywords = json.load(f)
-        else:
-            self.trend_keywords = self.get_default_keywords()
-            
-        # 인기 키워드
-        if os.path.exists(self.popular_keywords_file):
-            with open(self.popular_keywords_file, 'r', encoding='utf-8') as f:
-                self.popular_keywords = json.load(f)
-        else:
-            self.popular_keywords = {}
+        self.trend_keywords = self.get_default_keywords()
+        self.popular_keywords = {}
+        self._file_mtimes = {}
+        self.reload_if_changed()
             
-        # 캐시 데이터
-        if os.path.exists(self.cache_file):
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                self.cache_data = json.load(f)
-            self.clean_expired_cache()
-        else:
-            self.cache_data = {}
+        # 이전 JSON 캐시 파일은 공유 캐시 저장소로 한 번만 옮김
+        if os.path.exists(self.legacy_cache_file):
+            try:
+                imported = self.cache.import_json(self.legacy_cache_file)
+                os.replace(self.legacy_cache_file, self.legacy_cache_file + '.migrated')
+                logger.info(f"JSON 캐시 {imported}개 항목 이전 완료")
+            except Exception as e:
+                logger.error(f"JSON 캐시 이전 실패: {e}")
+        self.clean_expired_cache()
+    
+    def reload_if_changed(self):
+        """다른 워커가 갱신한 트렌드/인기 키워드 파일 다시 읽기 (수정 시각 비교)"""
+        for attr, path in (('trend_keywords', self.trend_keywords_file),
+                           ('popular_keywords', self.popular_keywords_file)):
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if self._file_mtimes.get(path) != mtime:
+                with open(path, 'r', encoding='utf-8') as f:
+                    setattr(self, attr, json.load(f))
+                self._file_mtimes[path] = mtime
     
     def get_default_keywords(self) -> Dict:
         """기본 키워드 세트"""
@@ -136,6 +196,8 @@ class AutoUpdater:
             
             # 기존 키워드와 병합
             self.trend_keywords['시즌추천'] = seasonal_keywords[:10]
+            if new_trends:
+                self.trend_keywords['쇼핑트렌드'] = new_trends
             
             # 파일 저장
             with open(self.trend_keywords_file, 'w', encoding='utf-8') as f:
@@ -147,84 +209,56 @@ class AutoUpdater:
             logger.error(f"트렌드 키워드 업데이트 실패: {e}")
     
     def collect_shopping_trends(self) -> List[str]:
-        """쇼핑 트렌드 수집"""
+        """쇼핑 트렌드 수집 - 카테고리별 최신 상품명에서 자주 나오는 단어/복합명사 추출"""
         trends = []
         
-        # 인기 검색어 수집 (네이버 쇼핑 API)
-        categories = ['50000000', '50000001', '50000002']  # 패션, 뷰티, 생활
-        
-        for cat_id in categories:
-            try:
-                url = "https://openapi.naver.com/v1/search/shop.json"
-                params = {
-                    "query": " ",  # 전체 검색
-                    "display": 100,
-                    "sort": "date",
-                    "filter": f"category:{cat_id}"
-                }
-                
-                response = requests.get(url, headers=self.headers, params=params)
-                if response.status_code == 200:
-                    items = response.json().get('items', [])
-                    # 카테고리별 상위 키워드 추출
-                    keywords = {}
-                    for item in items:
-                        title_words = item['title'].split()
-                        for word in title_words:
-                            if len(word) > 1:
-                                keywords[word] = keywords.get(word, 0) + 1
-                    
-                    # 상위 5개 키워드
-                    top_keywords = sorted(keywords.items(), key=lambda x: x[1], reverse=True)[:5]
-                    trends.extend([kw[0] for kw in top_keywords])
-                    
-            except Exception as e:
-                logger.error(f"카테고리 {cat_id} 트렌드 수집 실패: {e}")
+        # 인기 검색어 수집 (네이버 쇼핑 API, 카테고리별 최신 상품 TREND_PAGES × 100개)
+        for cat_id, cat_name in SHOPPING_CATEGORIES.items():
+            counter = Counter()
+            for page in range(TREND_PAGES):
+                try:
+                    data = self.client.shop(
+                        " ",  # 전체 검색
+                        display=100,
+                        start=page * 100 + 1,
+                        sort="date",
+                        filter=f"category:{cat_id}"
+                    )
+                except Exception as e:
+                    logger.error(f"카테고리 {cat_name}({cat_id}) 트렌드 수집 실패: {e}")
+                    break
+                items = data.get('items', [])
+                count_terms((item['title'] for item in items), counter=counter)
+                if len(items) < 100:
+                    break
+            
+            # 카테고리별 상위 키워드 (카테고리 이름 자체는 제외)
+            trends.extend(top_terms(counter, n=TREND_TERMS_PER_CATEGORY, exclude=cat_name.split('/')))
         
-        return trends
+        return list(dict.fromkeys(trends))
     
     def update_popular_keywords(self):
-        """인기 키워드 업데이트 (매일 새벽)"""
+        """인기 키워드 업데이트 (매일 새벽)
+        
+        트렌드 키워드 전체를 키워드당 블로그 검색 1회(날짜순 100건)로 동시에 조회한다.
+        전체 포스트 수는 같은 응답의 total을 사용하고, 7일 포스트 수는 분석기와 같은 스캐너로 센다.
+        """
         logger.info("인기 키워드 업데이트 시작")
         
         try:
-            popular = {}
-            
-            # 모든 카테고리의 키워드 검색량 확인
-            all_keywords = []
-            for category, keywords in self.trend_keywords.items():
-                all_keywords.extend(keywords)
+            # 모든 카테고리의 키워드 (중복 제외)
+            all_keywords = list(dict.fromkeys(
+                keyword for keywords in self.trend_keywords.values() if isinstance(keywords, list)
+                for keyword in keywords))
             
-            for keyword in all_keywords[:50]:  # API 제한으로 상위 50개만
+            popular = {}
+            executor = self.get_popular_executor()
+            futures = {executor.submit(self.fetch_popularity, keyword): keyword
+                       for keyword in all_keywords}
+            for future in as_completed(futures):
+                keyword = futures[future]
                 try:
-                    # 블로그 검색량 확인
-                    url = "https://openapi.naver.com/v1/search/blog.json"
-                    params = {
-                        "query": keyword,
-                        "display": 1,
-                        "sort": "date"
-                    }
-                    
-                    response = requests.get(url, headers=self.headers, params=params)
-                    if response.status_code == 200:
-                        total = response.json().get('total', 0)
-                        
-                        # 최근 포스팅 수 확인
-                        params['display'] = 100
-                        response = requests.get(url, headers=self.headers, params=params)
-                        if response.status_code == 200:
-                            items = response.json().get('items', [])
-                            recent_count = len([i for i in items if self.is_recent_post(i)])
-                            
-                            popular[keyword] = {
-                                'total_posts': total,
-                                'recent_7days': recent_count,
-                                'score': total * 0.3 + recent_count * 100,
-                                'last_updated': datetime.now().isoformat()
-                            }
-                    
-                    time.sleep(0.1)  # API 제한 방지
-                    
+                    popular[keyword] = future.result()
                 except Exception as e:
                     logger.error(f"키워드 '{keyword}' 분석 실패: {e}")
             
@@ -242,90 +276,182 @@ class AutoUpdater:
             with open(self.popular_keywords_file, 'w', encoding='utf-8') as f:
                 json.dump(self.popular_keywords, f, ensure_ascii=False, indent=2)
             
-            logger.info(f"인기 키워드 업데이트 완료: {len(sorted_popular)}개")
+            logger.info(f"인기 키워드 업데이트 완료: {len(popular)}개 중 상위 {len(sorted_popular)}개")
             
         except Exception as e:
             logger.error(f"인기 키워드 업데이트 실패: {e}")
     
-    def is_recent_post(self, post: Dict) -> bool:
-        """최근 7일 이내 포스트인지 확인"""
-        try:
-            post_date = post.get('postdate', '')
-            if post_date and len(post_date) == 8:
-                post_datetime = datetime.strptime(post_date, '%Y%m%d')
-                days_diff = (datetime.now() - post_datetime).days
-                return days_diff <= 7
-        except:
-            pass
-        return False
+    def get_popular_executor(self) -> ThreadPoolExecutor:
+        """인기 키워드 동시 조회용 스레드 풀 (첫 업데이트 때 생성)"""
+        if self._popular_executor is None:
+            self._popular_executor = ThreadPoolExecutor(max_workers=POPULAR_WORKERS,
+                                                        thread_name_prefix='popular')
+        return self._popular_executor
+    
+    def fetch_popularity(self, keyword: str) -> Dict:
+        """키워드 하나의 블로그 인기도 (API 1회)"""
+        recency = self.recency_scanner.scan(keyword, windows=(7,), max_pages=1)
+        total = recency['total']
+        recent_count = recency['counts'][7]
+        # 분석 화면의 전체 포스트 수 조회에서 재사용
+        search_volumes.record(keyword, blog_total=total)
+        return {
+            'total_posts': total,
+            'recent_7days': recent_count,
+            # 100건으로 7일을 다 덮지 못한 경우 게시 속도로 추정한 값
+            'recent_7days_estimated': not recency['exact'][7],
+            'score': total * 0.3 + recent_count * 100,
+            'last_updated': datetime.now().isoformat()
+        }
     
     def clean_expired_cache(self):
         """만료된 캐시 정리 (24시간)"""
         logger.info("캐시 정리 시작")
         
-        now = datetime.now()
-        expired_keys = []
+        removed = self.cache.clean_expired()
+        self.local_cache.purge_expired()
+        search_volumes.clean_expired()
+        purged_jobs = self.get_job_queue().purge()
+        if removed:
+            logger.info(f"캐시 정리 완료: {removed}개 항목 삭제")
+        if purged_jobs:
+            logger.info(f"작업 이력 정리: {purged_jobs}개 삭제")
+
+    def get_job_queue(self) -> JobQueue:
+        """보관 기간이 지난 작업 정리용 (작업 실행은 웹 워커의 큐가 담당, 첫 정리 때 생성)"""
+        if self._job_queue is None:
+            self._job_queue = JobQueue(max_workers=1)
+        return self._job_queue
+    
+    def get_max_stale(self, key: str) -> int:
+        """키 접두어에 해당하는 stale 허용 기간"""
+        for prefix, window in MAX_STALE_WINDOWS.items():
+            if key.startswith(prefix):
+                return window
+        return 0
+    
+    def add_to_cache(self, key: str, data: Dict):
+        """캐시에 데이터 추가 (stale 허용 기간만큼 더 보관)"""
+        self.cache.set(key, data, ttl=self.cache.ttl + self.get_max_stale(key))
+        if key.startswith(self.local_cache_prefixes):
+            self.local_cache.set(key, data, time.time() + self.cache.ttl)
+    
+    def get_from_cache(self, key: str) -> Dict:
+        """캐시에서 데이터 가져오기 (24시간 이내 항목만)"""
+        if key.startswith(self.local_cache_prefixes):
+            data = self.local_cache.get(key)
+            if data is not None:
+                return data
+        
+        entry = self.cache.get_entry(key)
+        if entry is None:
+            return None
+        data, created_at, _ = entry
+        fresh_until = created_at + self.cache.ttl
+        if fresh_until <= time.time():
+            return None
+        if key.startswith(self.local_cache_prefixes):
+            self.local_cache.set(key, data, fresh_until)
+        return data
+    
+    def fresh_for(self, key: str) -> Optional[float]:
+        """캐시 항목이 만료(신선 기간 종료)까지 남은 시간 (초, 이미 지났으면 음수, 없으면 None)"""
+        entry = self.cache.get_entry(key)
+        if entry is None:
+            return None
+        _, created_at, _ = entry
+        return created_at + self.cache.ttl - time.time()
+    
+    def get_with_staleness(self, key: str) -> Optional[Tuple[Dict, bool]]:
+        """(데이터, stale 여부) 반환 - stale 허용 기간도 지났으면 None"""
+        data = self.get_from_cache(key)
+        if data is not None:
+            return data, False
         
-        for key, value in self.cache_data.items():
-            if 'timestamp' in value:
-                cache_time = datetime.fromisoformat(value['timestamp'])
-                if (now - cache_time) > timedelta(hours=24):
-                    expired_keys.append(key)
+        entry = self.cache.get_entry(key)
+        if entry is None:
+            return None
+        data, created_at, _ = entry
+        if created_at + self.cache.ttl + self.get_max_stale(key) <= time.time():
+            return None
+        return data, True
+    
+    def get_or_revalidate(self, key: str, loader: Callable[[], Dict],
+                          cacheable: Callable[[Dict], bool] = None) -> Tuple[Dict, bool]:
+        """stale-while-revalidate 조회
         
-        # 만료된 캐시 삭제
-        for key in expired_keys:
-            del self.cache_data[key]
+        - 신선한 항목: 그대로 반환
+        - stale 항목: 즉시 반환하고 백그라운드에서 loader로 갱신
+        - 없음: loader 호출 후 저장하여 반환
+        cacheable(data)가 False인 결과(부분 실패 등)는 캐시하지 않는다.
+        """
+        cached = self.get_with_staleness(key)
+        if cached is not None:
+            data, is_stale = cached
+            if is_stale:
+                self.schedule_revalidation(key, loader, cacheable)
+            return data, is_stale
         
-        if expired_keys:
-            # 파일 저장
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache_data, f, ensure_ascii=False, indent=2)
-            
-            logger.info(f"캐시 정리 완료: {len(expired_keys)}개 항목 삭제")
+        data = loader()
+        if cacheable is None or cacheable(data):
+            self.add_to_cache(key, data)
+        return data, False
     
-    def add_to_cache(self, key: str, data: Dict):
-        """캐시에 데이터 추가"""
-        self.cache_data[key] = {
-            'data': data,
-            'timestamp': datetime.now().isoformat()
-        }
+    def schedule_revalidation(self, key: str, loader: Callable[[], Dict],
+                              cacheable: Callable[[Dict], bool] = None) -> bool:
+        """백그라운드 갱신 예약 (같은 키는 한 번만, 대기열이 가득 차면 건너뜀)"""
+        with self._revalidate_lock:
+            if key in self._revalidating or len(self._revalidating) >= REVALIDATE_MAX_PENDING:
+                return False
+            self._revalidating.add(key)
         
-        # 파일 저장
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(self.cache_data, f, ensure_ascii=False, indent=2)
+        def refresh():
+            try:
+                data = loader()
+                if cacheable is None or cacheable(data):
+                    self.add_to_cache(key, data)
+                    logger.info(f"캐시 갱신 완료: {key}")
+            except Exception as e:
+                logger.error(f"캐시 갱신 실패 '{key}': {e}")
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(key)
+        
+        self.revalidate_executor.submit(refresh)
+        return True
     
-    def get_from_cache(self, key: str) -> Dict:
-        """캐시에서 데이터 가져오기"""
-        if key in self.cache_data:
-            cache_entry = self.cache_data[key]
-            # 24시간 이내인지 확인
-            cache_time = datetime.fromisoformat(cache_entry['timestamp'])
-            if (datetime.now() - cache_time) < timedelta(hours=24):
-                return cache_entry['data']
-        return None
+    def remove_from_cache(self, key: str):
+        """캐시 항목 삭제 (내부 LRU 포함)"""
+        self.cache.delete(key)
+        self.local_cache.delete(key)
     
-    def start_scheduler(self):
-        """스케줄러 시작"""
+    def create_scheduler(self) -> JobScheduler:
+        """배치 작업 스케줄러 생성 (실행은 python -m auto_updater --scheduler 프로세스에서만)"""
+        scheduler = JobScheduler()
+        
         # 주 1회 트렌드 업데이트 (매주 월요일 새벽 3시)
-        schedule.every().monday.at("03:00").do(self.update_trend_keywords)
+        scheduler.register('trends', self.update_trend_keywords, every='week', weekday=0, at='03:00')
         
         # 매일 새벽 인기 키워드 업데이트 (매일 새벽 4시)
-        schedule.every().day.at("04:00").do(self.update_popular_keywords)
-        
-        # 매시간 캐시 정리
-        schedule.every().hour.do(self.clean_expired_cache)
+        scheduler.register('popular', self.update_popular_keywords, every='day', at='04:00')
         
-        # 스케줄러 실행
-        def run_scheduler():
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # 1분마다 체크
+        # 매일 새벽 인기/트렌드 키워드 캐시 예열 (인기 키워드 갱신 후)
+        scheduler.register('warm', self.warm_cache, every='day', at=WARM_AT)
         
-        # 백그라운드 스레드로 실행
-        scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-        scheduler_thread.start()
+        # 매시간 캐시 정리
+        scheduler.register('cache', self.clean_expired_cache, every='hour')
         
-        logger.info("자동 업데이트 스케줄러 시작")
+        # 관리자 화면의 전체 업데이트 요청
+        scheduler.register('all', self.force_update_all)
+        return scheduler
+    
+    def warm_cache(self) -> Dict:
+        """인기/트렌드 키워드 캐시 예열"""
+        try:
+            return self.warmer.warm()
+        except Exception as e:
+            logger.error(f"캐시 예열 실패: {e}")
+            return {}
     
     def force_update_all(self):
         """모든 데이터 강제 업데이트"""
@@ -333,13 +459,30 @@ class AutoUpdater:
         self.update_trend_keywords()
         self.update_popular_keywords()
         self.clean_expired_cache()
+        self.warm_cache()
         logger.info("전체 데이터 강제 업데이트 완료")
 
 # 싱글톤 인스턴스
 updater = AutoUpdater()
 
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="자동 업데이트 (배치 작업)")
+    parser.add_argument('--scheduler', action='store_true',
+                        help="스케줄러 프로세스로 실행 (여러 개 실행해도 리더 하나만 작업 실행)")
+    args = parser.parse_args(argv)
+    
+    if not args.scheduler:
+        # 전체 업데이트 한 번 실행
+        print("자동 업데이트 시스템 테스트")
+        updater.force_update_all()
+        print("완료!")
+        return
+    
+    scheduler = updater.create_scheduler()
+    # docker stop 등 종료 신호 시 현재 작업을 마치고 임대 반납
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: scheduler.stop())
+    scheduler.run_forever()
+
 if __name__ == "__main__":
-    # 테스트 실행
-    print("자동 업데이트 시스템 테스트")
-    updater.force_update_all()
-    print("완료!")
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -18,11 +18,12 @@ import openai
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 import schedule
-import time
+from naver_client import naver_client
 
 class BlogAutomation:
     def __init__(self):
         self.config = self.load_config()
+        self.client = naver_client
         self.setup_apis()
         
     def load_config(self):
@@ -83,37 +84,24 @@ class BlogAutomation:
         """네이버 쇼핑 상품 검색"""
         print(f"🛍️ '{keyword}' 상품 검색 중...")
         
-        url = "https://openapi.naver.com/v1/search/shop.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        params = {
-            "query": keyword,
-            "display": 10,
-            "sort": "review"  # 리뷰 많은 순
-        }
-        
         try:
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                products = []
-                
-                for item in data['items'][:3]:  # 상위 3개 상품
-                    product = {
-                        'title': item['title'].replace('<b>', '').replace('</b>', ''),
-                        'link': item['link'],
-                        'price': item['lprice'],
-                        'mall': item['mallName'],
-                        'review_count': item.get('reviewCount', 0)
-                    }
-                    products.append(product)
-                    
-                return {
-                    'keyword': keyword,
-                    'products': products
+            data = self.client.shop(keyword, display=10, sort="review")  # 리뷰 많은 순
+            products = []
+            
+            for item in data['items'][:3]:  # 상위 3개 상품
+                product = {
+                    'title': item['title'].replace('<b>', '').replace('</b>', ''),
+                    'link': item['link'],
+                    'price': item['lprice'],
+                    'mall': item['mallName'],
+                    'review_count': item.get('reviewCount', 0)
                 }
+                products.append(product)
+                
+            return {
+                'keyword': keyword,
+                'products': products
+            }
         except Exception as e:
             print(f"❌ 상품 검색 실패: {e}")
             return {'keyword': keyword, 'products': []}
@@ -226,8 +214,6 @@ class BlogAutomation:
                 if content:
                     # 저장
                     self.save_to_google_docs(content, keyword)
-                    
-            time.sleep(2)  # API 제한 방지
             
         # 3. 성과 분석
         self.analyze_performance()
@@ -4,13 +4,12 @@
 """
 import os
 import json
-import requests
 from datetime import datetime
 from typing import List, Dict
 import pandas as pd
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-import time
+from naver_client import naver_client
 
 # .env 파일 로드
 load_dotenv()
@@ -21,6 +20,7 @@ class BlogAutomationSimple:
             'naver_client_id': os.getenv('NAVER_CLIENT_ID'),
             'naver_client_secret': os.getenv('NAVER_CLIENT_SECRET'),
         }
+        self.client = naver_client
         
     def collect_trending_keywords(self) -> List[str]:
         """네이버 쇼핑 인기 키워드 수집"""
@@ -41,39 +41,26 @@ class BlogAutomationSimple:
         """네이버 쇼핑 상품 검색"""
         print(f"🛍️ '{keyword}' 상품 검색 중...")
         
-        url = "https://openapi.naver.com/v1/search/shop.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        params = {
-            "query": keyword,
-            "display": 5,
-            "sort": "sim"  # 정확도순으로 변경
-        }
-        
         try:
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ 검색 성공! 총 {data.get('total', 0)}개 결과")
-                products = []
+            data = self.client.shop(keyword, display=5, sort="sim")  # 정확도순
+            print(f"   ✅ 검색 성공! 총 {data.get('total', 0)}개 결과")
+            products = []
+            
+            if 'items' in data and data['items']:
+                for item in data['items'][:3]:
+                    product = {
+                        'title': item['title'].replace('<b>', '').replace('</b>', ''),
+                        'link': item['link'],
+                        'price': int(item['lprice']),
+                        'mall': item['mallName'],
+                        'image': item['image']
+                    }
+                    products.append(product)
                 
-                if 'items' in data and data['items']:
-                    for item in data['items'][:3]:
-                        product = {
-                            'title': item['title'].replace('<b>', '').replace('</b>', ''),
-                            'link': item['link'],
-                            'price': int(item['lprice']),
-                            'mall': item['mallName'],
-                            'image': item['image']
-                        }
-                        products.append(product)
-                    
-                return {
-                    'keyword': keyword,
-                    'products': products
-                }
+            return {
+                'keyword': keyword,
+                'products': products
+            }
         except Exception as e:
             print(f"❌ 상품 검색 실패: {e}")
         
@@ -202,8 +189,6 @@ _이 포스팅은 쿠팡 파트너스 활동의 일환으로, 일정액의 수
                 if content:
                     # 저장
                     self.save_content(content, keyword)
-                    
-            time.sleep(1)  # API 제한 방지
         
         print(f"\n✅ 자동화 완료! blog_posts 폴더를 확인하세요.")
         print(f"{'='*50}\n")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+블로그 최근 포스팅 수 스캐너
+- 날짜순(sort=date) 검색 결과를 필요한 만큼만 페이지 단위로 조회 (start 1~1000)
+- 기간(24시간/7일/30일)을 모두 덮으면 즉시 중단하고 정확한 개수 반환
+- 1000건 한도로 덮을 수 없는 기간은 조회한 구간의 게시 속도로 추정
+- 전체 포스트 수(total)를 알면 첫 페이지 크기를 맞춰 저빈도 키워드는 한 번에 끝냄
+  모르면 첫 응답의 total을 함께 반환 (별도 display=1 조회 불필요)
+
+기간 기준은 기존 분석기와 같다: 게시일이 오늘로부터 N일 이내(날짜 차이 <= N)인 포스트.
+"""
+from datetime import datetime, time as dt_time
+from typing import Dict, Iterable, Optional
+from naver_client import naver_client, NaverSearchClient
+
+PAGE_SIZE = 100          # 검색 API 최대 display
+MAX_START = 1000         # 검색 API 최대 start (최대 1000건까지 조회 가능)
+DEFAULT_WINDOWS = (1, 7, 30)
+PAGE_MARGIN = 10         # total 값이 조금 늦게 갱신됐을 때를 대비한 첫 페이지 여유분
+MIN_SPAN_DAYS = 1 / 24   # 자정 직후 조회 시 게시 속도가 과대 추정되지 않도록 하는 최소 구간 (1시간)
+# 1회 스캔 최대 API 호출 수 (첫 페이지를 total에 맞춰 줄이면 1페이지 더 필요할 수 있음)
+MAX_PAGES = -(-MAX_START // PAGE_SIZE) + 1
+
+
+class BlogRecencyScanner:
+    def __init__(self, client: NaverSearchClient = None):
+        self.client = client or naver_client
+
+    @staticmethod
+    def post_age(item: Dict, today) -> Optional[int]:
+        """게시일(postdate, 예: 20240801)로부터 지난 일수 (파싱 실패 시 None)"""
+        post_date_str = item.get('postdate', '')
+        if len(post_date_str) != 8:
+            return None
+        try:
+            post_date = datetime.strptime(post_date_str, '%Y%m%d').date()
+        except ValueError:
+            return None
+        return max(0, (today - post_date).days)
+
+    def scan(self, keyword: str, total: Optional[int] = None,
+             windows: Iterable[int] = DEFAULT_WINDOWS, now: datetime = None,
+             max_pages: Optional[int] = None) -> Dict:
+        """기간별 최근 포스트 수 조회 (max_pages: 최대 API 호출 수)
+
+        반환값:
+            counts: {기간(일): 포스트 수} - exact가 False인 기간은 게시 속도로 추정한 값
+            exact: {기간(일): 정확한 개수 여부}
+            posts_per_day: 하루 평균 포스트 수 (정확한 기간이 없으면 하한 추정치)
+            scanned / pages: 조회한 포스트 수 / API 호출 수
+            total: 전체 포스트 수 (인자로 받은 값 또는 첫 응답의 total)
+        """
+        now = now or datetime.now()
+        today = now.date()
+        # 오늘 자정 이후 지난 시간(일) - 날짜 단위 게시일을 실제 경과 시간으로 환산할 때 사용
+        today_elapsed = max(MIN_SPAN_DAYS,
+                            (now - datetime.combine(today, dt_time.min)).total_seconds() / 86400)
+
+        windows = sorted(set(windows))
+        target = windows[-1]
+        ages = []
+        fetched = 0
+        pages = 0
+        exhausted = total == 0
+        start = 1
+        display = PAGE_SIZE if total is None else min(PAGE_SIZE, total + PAGE_MARGIN)
+
+        while not exhausted and start <= MAX_START:
+            data = self.client.blog(keyword, display=display, start=start, sort="date")
+            items = data.get('items', [])
+            if total is None:
+                total = data.get('total', 0)
+            pages += 1
+            fetched += len(items)
+            ages.extend(age for age in (self.post_age(item, today) for item in items)
+                        if age is not None)
+
+            # 요청보다 적게 받음 = 결과 끝 → 모든 기간 정확
+            if len(items) < display:
+                exhausted = True
+                break
+
+            oldest = max(ages, default=0)
+            if oldest > target or pages == max_pages:
+                break
+
+            # 남은 한도(MAX_START건)로 덮을 수 있는 가장 긴 기간까지만 계속 조회
+            projected_days = (today_elapsed + oldest) * MAX_START / fetched
+            reachable = [days for days in windows if today_elapsed + days <= projected_days]
+            if not reachable or oldest > reachable[-1]:
+                break
+            target = reachable[-1]
+
+            start += display
+            display = PAGE_SIZE
+
+        oldest = max(ages, default=0)
+        exact = {days: exhausted or oldest > days for days in windows}
+        counts = {days: sum(1 for age in ages if age <= days) for days in windows}
+
+        # 게시 속도: 정확한 가장 긴 기간 기준, 없으면 조회 구간 기준 (실제보다 낮게 잡히는 하한값)
+        exact_windows = [days for days in windows if exact[days]]
+        if exact_windows:
+            days = exact_windows[-1]
+            posts_per_day = counts[days] / (today_elapsed + days)
+        else:
+            posts_per_day = fetched / (today_elapsed + oldest) if fetched else 0.0
+
+        for days in windows:
+            if not exact[days]:
+                counts[days] = max(counts[days], round(posts_per_day * (today_elapsed + days)))
+
+        return {
+            'counts': counts,
+            'exact': exact,
+            'posts_per_day': round(posts_per_day, 2),
+            'scanned': fetched,
+            'pages': pages,
+            'total': total
+        }
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+분석 결과 캐시 저장소 - 모든 gunicorn 워커가 같은 캐시를 공유
+- sqlite (기본): 로컬 파일, 만료 시각 인덱스 + LRU 제거, WAL 모드로 다중 프로세스 사용
+- redis: Redis 호환 서버 (REDIS_URL), 만료는 서버 TTL로 처리
+- memory: 프로세스 내부 dict (테스트/단일 프로세스용)
+
+프로세스 내부 LRU(LocalLRUCache)는 자주 조회되는 항목을 공유 저장소 앞단에서 바로 반환한다.
+"""
+import os
+import json
+import math
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+from sqlite_store import SQLiteDatabase
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'sqlite')        # sqlite | redis | memory
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+CACHE_DB_PATH = os.getenv('CACHE_DB_PATH', 'data/cache.db')
+CACHE_TTL = int(os.getenv('CACHE_TTL', 86400))              # 24시간
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 5000))
+LOCAL_CACHE_TTL = int(os.getenv('LOCAL_CACHE_TTL', 300))     # 프로세스 내부 LRU 유지 시간
+LOCAL_CACHE_SIZE = int(os.getenv('LOCAL_CACHE_SIZE', 256))
+
+# 조회 시각 갱신 최소 간격 (초) - 읽기마다 쓰기 잠금을 잡지 않도록
+TOUCH_INTERVAL = 60
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache (expires_at);
+CREATE INDEX IF NOT EXISTS idx_cache_access ON cache (last_access);
+
+-- 항목 수를 트리거로 관리 (COUNT(*) 전체 스캔 방지)
+CREATE TABLE IF NOT EXISTS cache_meta (id INTEGER PRIMARY KEY CHECK (id = 1), entries INTEGER NOT NULL);
+INSERT OR IGNORE INTO cache_meta (id, entries) VALUES (1, 0);
+CREATE TRIGGER IF NOT EXISTS cache_count_insert AFTER INSERT ON cache
+    BEGIN UPDATE cache_meta SET entries = entries + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS cache_count_delete AFTER DELETE ON cache
+    BEGIN UPDATE cache_meta SET entries = entries - 1 WHERE id = 1; END;
+"""
+
+
+class CacheStore:
+    """캐시 저장소 공통 인터페이스"""
+    ttl = CACHE_TTL
+
+    def get_entry(self, key: str) -> Optional[Tuple[Dict, float, float]]:
+        """만료되지 않은 항목의 (값, 저장 시각, 만료 시각) 반환 (없으면 None)"""
+        raise NotImplementedError
+
+    def get(self, key: str) -> Optional[Dict]:
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def set(self, key: str, value: Dict, ttl: int = None, created_at: float = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clean_expired(self) -> int:
+        """만료 항목 삭제 후 삭제 개수 반환"""
+        return 0
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def import_json(self, path: str) -> int:
+        """기존 JSON 캐시 파일(cache_data.json) 가져오기"""
+        with open(path, 'r', encoding='utf-8') as f:
+            legacy = json.load(f)
+
+        imported = 0
+        for key, entry in legacy.items():
+            try:
+                created_at = datetime.fromisoformat(entry['timestamp']).timestamp()
+            except (KeyError, ValueError):
+                continue
+            if created_at + self.ttl > time.time():
+                self.set(key, entry['data'], created_at=created_at)
+                imported += 1
+        return imported
+
+
+class SQLiteCacheStore(CacheStore):
+    def __init__(self, path: str = CACHE_DB_PATH, ttl: int = CACHE_TTL,
+                 max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.db = SQLiteDatabase(path, CACHE_SCHEMA)
+
+    def get_entry(self, key: str) -> Optional[Tuple[Dict, float, float]]:
+        now = time.time()
+        row = self.db.connection().execute(
+            """SELECT value, created_at, expires_at, last_access FROM cache
+               WHERE key = ? AND expires_at > ?""",
+            (key, now)).fetchone()
+        if row is None:
+            return None
+
+        value, created_at, expires_at, last_access = row
+        if now - last_access > TOUCH_INTERVAL:
+            with self.db.transaction() as conn:
+                conn.execute("UPDATE cache SET last_access = ? WHERE key = ?", (now, key))
+        return json.loads(value), created_at, expires_at
+
+    def set(self, key: str, value: Dict, ttl: int = None, created_at: float = None):
+        """항목 저장 (같은 키는 덮어씀)"""
+        now = time.time()
+        created_at = created_at or now
+        expires_at = created_at + (ttl or self.ttl)
+        payload = json.dumps(value, ensure_ascii=False)
+
+        with self.db.transaction() as conn:
+            conn.execute(
+                """INSERT INTO cache (key, value, created_at, expires_at, last_access)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(key) DO UPDATE SET value = excluded.value,
+                       created_at = excluded.created_at, expires_at = excluded.expires_at,
+                       last_access = excluded.last_access""",
+                (key, payload, created_at, expires_at, now))
+            self._evict(conn)
+
+    def _evict(self, conn):
+        """최대 항목 수 초과분을 오래 조회되지 않은 순으로 삭제"""
+        entries = conn.execute("SELECT entries FROM cache_meta WHERE id = 1").fetchone()[0]
+        overflow = entries - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                """DELETE FROM cache WHERE key IN (
+                       SELECT key FROM cache ORDER BY last_access LIMIT ?)""",
+                (overflow,))
+
+    def delete(self, key: str):
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clean_expired(self) -> int:
+        """만료 항목 삭제 후 삭제 개수 반환"""
+        with self.db.transaction() as conn:
+            return conn.execute("DELETE FROM cache WHERE expires_at <= ?",
+                                (time.time(),)).rowcount
+
+    def clear(self):
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        return self.db.connection().execute(
+            "SELECT entries FROM cache_meta WHERE id = 1").fetchone()[0]
+
+
+class RedisCacheStore(CacheStore):
+    """Redis 호환 서버 캐시 (만료/메모리 제한은 서버 설정에 위임)"""
+    prefix = 'naverblog:cache:'
+
+    def __init__(self, client=None, url: str = REDIS_URL, ttl: int = CACHE_TTL):
+        if client is None:
+            if redis is None:
+                raise RuntimeError("CACHE_BACKEND=redis 사용 시 redis 패키지가 필요합니다 (pip install redis)")
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.ttl = ttl
+
+    def get_entry(self, key: str) -> Optional[Tuple[Dict, float, float]]:
+        payload = self.client.get(self.prefix + key)
+        if payload is None:
+            return None
+        remaining = self.client.ttl(self.prefix + key)
+        entry = json.loads(payload)
+        return entry['value'], entry['created_at'], time.time() + max(remaining, 0)
+
+    def set(self, key: str, value: Dict, ttl: int = None, created_at: float = None):
+        created_at = created_at or time.time()
+        remaining = created_at + (ttl or self.ttl) - time.time()
+        if remaining > 0:
+            payload = {'value': value, 'created_at': created_at}
+            self.client.setex(self.prefix + key, math.ceil(remaining),
+                              json.dumps(payload, ensure_ascii=False))
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def _keys(self) -> Iterator:
+        return self.client.scan_iter(match=self.prefix + '*')
+
+    def clear(self):
+        for key in list(self._keys()):
+            self.client.delete(key)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._keys())
+
+
+class FakeRedis:
+    """테스트용 최소 Redis 대역 (get/setex/delete/scan_iter)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def _alive(self, key: str) -> bool:
+        entry = self._data.get(key)
+        if entry and entry[1] <= time.time():
+            del self._data[key]
+            return False
+        return entry is not None
+
+    def get(self, key: str):
+        with self._lock:
+            return self._data[key][0] if self._alive(key) else None
+
+    def setex(self, key: str, seconds: int, value):
+        with self._lock:
+            self._data[key] = (value.encode() if isinstance(value, str) else value,
+                               time.time() + seconds)
+
+    def ttl(self, key: str) -> int:
+        with self._lock:
+            return math.ceil(self._data[key][1] - time.time()) if self._alive(key) else -2
+
+    def delete(self, *keys) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def scan_iter(self, match: str = '*'):
+        prefix = match.rstrip('*')
+        with self._lock:
+            keys = [key for key in list(self._data) if key.startswith(prefix) and self._alive(key)]
+        return iter(keys)
+
+
+class LocalLRUCache:
+    """프로세스 내부 LRU (항목별 만료 시각, 적중/실패/제거 카운터)"""
+
+    def __init__(self, max_entries: int = LOCAL_CACHE_SIZE, ttl: int = LOCAL_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: Dict, expires_at: float = None):
+        """저장 - 공유 저장소의 만료 시각보다 오래 유지하지 않음"""
+        local_expiry = time.time() + self.ttl
+        if expires_at is not None:
+            local_expiry = min(local_expiry, expires_at)
+        with self._lock:
+            self._entries[key] = (value, local_expiry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0
+        }
+
+
+def create_cache_store(backend: str = CACHE_BACKEND) -> CacheStore:
+    """환경 설정(CACHE_BACKEND)에 맞는 캐시 저장소 생성"""
+    if backend == 'redis':
+        return RedisCacheStore()
+    if backend == 'memory':
+        return RedisCacheStore(client=FakeRedis())
+    return SQLiteCacheStore()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+캐시 예열
+- 인기 키워드/트렌드 키워드 상위 N개의 분석, 상품 목록, 키워드 세분화 결과를 미리 계산해 캐시에 저장
+- 사용자가 처음 클릭해도 캐시에서 바로 응답
+- 만료가 가까운 항목은 만료 전에 미리 갱신, 아직 신선한 항목은 건너뜀
+- 1회 예열에 쓰는 API 호출 수를 예산(WARM_BUDGET)과 일일 할당량 여유분(WARM_QUOTA_RESERVE)으로 제한
+"""
+import os
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+from naver_client import naver_client, NaverSearchClient
+from product_catalog import search_product_listing
+from blog_recency import MAX_PAGES
+
+logger = logging.getLogger(__name__)
+
+WARM_AT = os.getenv('WARM_AT', '05:00')                              # 매일 예열 시각 (한가한 새벽)
+WARM_TOP_N = int(os.getenv('WARM_TOP_N', 30))                        # 예열할 키워드 수
+WARM_BUDGET = int(os.getenv('WARM_BUDGET', 2000))                    # 1회 예열 최대 API 호출 수
+WARM_QUOTA_RESERVE = int(os.getenv('WARM_QUOTA_RESERVE', 5000))      # 사용자 요청용으로 남겨둘 일일 할당량
+WARM_REFRESH_BEFORE = int(os.getenv('WARM_REFRESH_BEFORE', 10800))   # 만료까지 이 시간(초) 이내면 미리 갱신
+
+# 예열 작업 (우선순위 순) 과 작업당 예상 API 호출 수 - 남은 예산이 이보다 적으면 중단
+# 분석: 블로그 최근 포스트 스캔(최대 MAX_PAGES) + 쇼핑/카페/뉴스 각 1회
+WARM_TASKS = ('analysis', 'products', 'refine')
+ESTIMATED_CALLS = {'analysis': MAX_PAGES + 3, 'products': 1, 'refine': 20}
+
+
+def is_complete_analysis(metrics: Dict) -> bool:
+    """모든 소스 수집에 성공한 분석 결과만 캐시"""
+    return not metrics.get('failed_sources')
+
+
+def has_refined_volume(refined: Dict) -> bool:
+    """검색량 조회가 하나라도 성공한 세분화 결과만 캐시 (전부 0이면 API 오류로 간주)"""
+    return any(keyword['actual_volume'] for keyword in refined.get('refined_keywords', []))
+
+
+class CacheWarmer:
+    def __init__(self, updater, client: NaverSearchClient = None, top_n: int = WARM_TOP_N,
+                 budget: int = WARM_BUDGET, reserve: int = WARM_QUOTA_RESERVE,
+                 refresh_before: int = WARM_REFRESH_BEFORE):
+        self.updater = updater
+        self.client = client or naver_client
+        self.top_n = top_n
+        self.budget = budget
+        self.reserve = reserve
+        self.refresh_before = refresh_before
+        self.last_run = None
+
+        # 분석기/세분화기는 첫 예열 때 생성 (웹 워커 시작 시간에 영향 없음)
+        self._analyzer = None
+        self._refiner = None
+
+    @property
+    def analyzer(self):
+        if self._analyzer is None:
+            from advanced_keyword_analyzer import AdvancedKeywordAnalyzer
+            self._analyzer = AdvancedKeywordAnalyzer(self.client)
+        return self._analyzer
+
+    @property
+    def refiner(self):
+        if self._refiner is None:
+            from keyword_refiner import KeywordRefiner
+            self._refiner = KeywordRefiner(self.client)
+        return self._refiner
+
+    def loader(self, task: str, keyword: str) -> Tuple[Callable[[], Dict], Callable[[Dict], bool]]:
+        """작업별 (계산 함수, 캐시 가능 여부 판단 함수) - 웹 요청과 같은 계산/캐시 기준"""
+        if task == 'analysis':
+            return (lambda: self.analyzer.analyze_keyword_metrics(keyword, concurrent=True),
+                    is_complete_analysis)
+        if task == 'products':
+            return lambda: search_product_listing(keyword, self.client), None
+        if task == 'refine':
+            return lambda: self.refiner.get_related_keywords(keyword), has_refined_volume
+        raise ValueError(f"알 수 없는 예열 작업: {task}")
+
+    def target_keywords(self) -> List[str]:
+        """예열 대상: 인기 키워드(점수순) 다음 트렌드 키워드, 중복 제외 상위 N개"""
+        self.updater.reload_if_changed()
+        keywords = list(self.updater.popular_keywords.get('keywords', {}))
+        for values in self.updater.trend_keywords.values():
+            if isinstance(values, list):
+                keywords.extend(values)
+        return list(dict.fromkeys(keywords))[:self.top_n]
+
+    def needs_refresh(self, key: str) -> bool:
+        """캐시에 없거나 만료가 가까운(또는 지난) 항목인지"""
+        fresh_for = self.updater.fresh_for(key)
+        return fresh_for is None or fresh_for < self.refresh_before
+
+    def api_budget(self) -> int:
+        """이번 예열에 쓸 수 있는 API 호출 수"""
+        remaining = self.client.rate_limiter.remaining_quota() - self.reserve
+        return max(0, min(self.budget, remaining))
+
+    def warm(self) -> Dict:
+        """예열 실행 후 결과 요약 반환"""
+        keywords = self.target_keywords()
+        budget = self.api_budget()
+        quota = self.client.rate_limiter.quota
+        used_before = quota.used()
+        stats = {'keywords': len(keywords), 'budget': budget, 'warmed': 0, 'fresh': 0,
+                 'failed': 0, 'api_calls': 0, 'budget_exhausted': False}
+        logger.info(f"캐시 예열 시작: 키워드 {len(keywords)}개, API 예산 {budget}회")
+
+        for task in WARM_TASKS:
+            for keyword in keywords:
+                key = f'{task}_{keyword}'
+                if not self.needs_refresh(key):
+                    stats['fresh'] += 1
+                    continue
+
+                # 다른 워커의 호출도 포함되므로 실제보다 많게 잡힐 수 있음 (예산 초과 방지 쪽으로 보수적)
+                stats['api_calls'] = quota.used() - used_before
+                if stats['api_calls'] + ESTIMATED_CALLS[task] > budget:
+                    stats['budget_exhausted'] = True
+                    break
+
+                load, cacheable = self.loader(task, keyword)
+                try:
+                    data = load()
+                    if cacheable is None or cacheable(data):
+                        self.updater.add_to_cache(key, data)
+                        stats['warmed'] += 1
+                    else:
+                        stats['failed'] += 1
+                except Exception as e:
+                    logger.error(f"캐시 예열 실패 '{key}': {e}")
+                    stats['failed'] += 1
+            if stats['budget_exhausted']:
+                logger.warning("API 예산 소진으로 캐시 예열 중단")
+                break
+
+        stats['api_calls'] = quota.used() - used_before
+        stats['finished_at'] = datetime.now().isoformat()
+        self.last_run = stats
+        logger.info(f"캐시 예열 완료: {stats['warmed']}개 저장, {stats['fresh']}개 신선, "
+                    f"{stats['failed']}개 실패, API {stats['api_calls']}회 사용")
+        return stats
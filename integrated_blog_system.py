@@ -6,13 +6,22 @@
 - 선택적 콘텐츠 생성
 """
 import os
+import sys
+import argparse
 from datetime import datetime
+from typing import Callable, Dict, List
 from advanced_keyword_analyzer import AdvancedKeywordAnalyzer
+from async_keyword_analyzer import AsyncKeywordAnalyzer, DEFAULT_CONCURRENCY
 from google_sheets_integration import GoogleSheetsManager
+from keyword_dataset import DATASET_PATH
+from result_writer import ResultWriter, OUTPUT_FORMATS
+from sweep_journal import SweepJournal, JOURNAL_PATH
 from expanded_keyword_list import get_all_keywords, KEYWORDS
-import time
 
 class IntegratedBlogSystem:
+    # 대량 분석 시 Google Sheets에는 점수 상위 결과만 저장 (전체는 로컬 파일)
+    SHEETS_TOP_N = 100
+    
     def __init__(self):
         self.analyzer = AdvancedKeywordAnalyzer()
         try:
@@ -22,99 +31,141 @@ class IntegratedBlogSystem:
             print("⚠️ Google Sheets 연동 실패. 로컬 저장만 사용합니다.")
             self.use_sheets = False
     
-    def analyze_category(self, category_name: str):
-        """카테고리별 키워드 분석"""
+    def analyze_category(self, category_name: str, concurrency: int = DEFAULT_CONCURRENCY,
+                         journal: SweepJournal = None, resume: bool = False,
+                         on_result: Callable[[Dict], None] = None):
+        """카테고리별 키워드 분석 (키워드/소스 동시 수집)
+        
+        journal이 주어지면 키워드마다 결과를 바로 기록하고,
+        resume=True 이면 저널에 TTL 이내 결과가 있는 키워드는 다시 분석하지 않는다.
+        on_result가 주어지면 결과를 모으지 않고 완료될 때마다 넘긴다 (반환값은 빈 리스트).
+        일부 소스 수집에 실패한 키워드(429 등)는 결과에서 빼고 저널에도 남기지 않는다 (재개 시 다시 분석).
+        """
         keywords = KEYWORDS.get(category_name, [])
         if not keywords:
             print(f"❌ '{category_name}' 카테고리를 찾을 수 없습니다.")
-            return
+            return []
         
         print(f"\n📂 [{category_name}] 카테고리 분석 시작")
-        print(f"키워드 {len(keywords)}개 분석 중...")
         
         results = []
-        for i, keyword in enumerate(keywords, 1):
-            print(f"\n[{i}/{len(keywords)}] {keyword} 분석 중...")
-            metrics = self.analyzer.analyze_keyword_metrics(keyword)
+        emit = on_result or results.append
+        completed = 0
+        if journal and resume:
+            done = journal.load(keywords)
+            for result in done.values():
+                emit(dict(result, category=category_name))
+            completed = len(done)
+            keywords = [keyword for keyword in keywords if keyword not in done]
+            if done:
+                print(f"⏭️ 이전 실행에서 분석한 {len(done)}개 키워드 건너뜀")
+        
+        print(f"키워드 {len(keywords)}개 분석 중...")
+        total = completed + len(keywords)
+        failed = 0
+        
+        def collect(metrics):
+            nonlocal completed, failed
+            completed += 1
+            # 일부 소스가 실패한 결과(429 등)는 0으로 채워진 값이므로 저장/체크포인트하지 않음
+            if metrics.get('failed_sources'):
+                failed += 1
+                print(f"\n[{completed}/{total}] {metrics['keyword']} 수집 실패 "
+                      f"({', '.join(metrics['failed_sources'])}) - 결과 제외")
+                return
             
-            # 결과 정리
+            # 결과 정리 (포스팅 수는 항상 숫자, 조회 한도로 다 세지 못한 값은 posts_lower_bound 표시)
+            blog = metrics['blog_data']
             result = {
-                'keyword': keyword,
+                'keyword': metrics['keyword'],
+                'category': category_name,
                 'total_products': metrics['shopping_data']['total_products'],
                 'avg_price': metrics['shopping_data']['avg_price'],
-                'posts_7d': metrics['blog_data']['recent_posts_7d'],
-                'posts_24h': metrics['blog_data']['recent_posts_24h'],
-                'posting_freq': metrics['blog_data']['posting_frequency'],
+                'brand_diversity': metrics['shopping_data']['brand_diversity'],
+                'posts_7d': blog['recent_posts_7d'],
+                'posts_24h': blog['recent_posts_24h'],
+                'posts_per_day': blog['posts_per_day'],
+                'posts_lower_bound': blog['is_lower_bound'],
+                'posting_freq': blog['posting_frequency'],
                 'community_interest': metrics['cafe_data']['community_interest'],
                 'total_score': metrics['total_score']
             }
-            results.append(result)
-            
-            # API 제한 방지
-            time.sleep(0.5)
+            # 저널 기록 후 전달 (Parquet 추가 표시가 항상 결과 기록보다 뒤에 오도록)
+            if journal:
+                journal.record(result)
+            emit(result)
+            print(f"\n[{completed}/{total}] {metrics['keyword']} 분석 완료")
+        
+        # 요청 간격은 엔진의 전역 속도 제한으로 관리
+        if keywords:
+            with AsyncKeywordAnalyzer(self.analyzer, concurrency=concurrency) as engine:
+                engine.analyze_all(keywords, callback=collect)
+        if failed:
+            print(f"⚠️ [{category_name}] {failed}개 키워드 수집 실패 - --resume 으로 다시 분석할 수 있습니다")
         
         return results
     
-    def run_full_analysis(self):
-        """전체 카테고리 분석"""
+    def run_full_analysis(self, categories: List[str] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                          output_formats: List[str] = ('parquet',), resume: bool = False,
+                          journal_path: str = JOURNAL_PATH, generate_content: bool = False):
+        """카테고리 분석 (기본: 전체 카테고리)
+        
+        키워드마다 저널(journal_path)에 체크포인트를 남기므로 중단되어도 resume=True 로 이어서 실행할 수 있다.
+        결과는 완료될 때마다 파일에 바로 기록하고 메모리에는 상위 결과만 유지한다.
+        """
         print("\n🚀 통합 블로그 키워드 분석 시스템")
         print("="*60)
         
-        all_results = []
-        
-        # 카테고리 선택
-        print("\n분석할 카테고리를 선택하세요:")
-        categories = list(KEYWORDS.keys())
-        for i, cat in enumerate(categories, 1):
-            print(f"{i}. {cat} ({len(KEYWORDS[cat])}개 키워드)")
-        print(f"{len(categories)+1}. 전체 분석")
-        
-        choice = input("\n선택 (번호 입력): ")
+        categories = categories or list(KEYWORDS.keys())
+        journal = SweepJournal(journal_path)
+        if resume:
+            journal.compact()
         
+        # 재개 시 이전 실행에서 Parquet에 이미 추가한 키워드는 다시 추가하지 않음
+        writer = ResultWriter(output_formats, top_n=self.SHEETS_TOP_N,
+                              persisted=journal.persisted() if resume else (),
+                              on_persisted=journal.mark_persisted)
         try:
-            choice_num = int(choice)
-            if choice_num == len(categories) + 1:
-                # 전체 분석
-                for category in categories:
-                    results = self.analyze_category(category)
-                    all_results.extend(results)
-            elif 1 <= choice_num <= len(categories):
-                # 특정 카테고리 분석
-                category = categories[choice_num - 1]
-                all_results = self.analyze_category(category)
-            else:
-                print("❌ 잘못된 선택입니다.")
-                return
-        except:
-            print("❌ 숫자를 입력해주세요.")
-            return
+            for category in categories:
+                self.analyze_category(category, concurrency, journal, resume, on_result=writer.write)
+        finally:
+            # 중단되어도 이미 기록한 행과 인덱스는 남김
+            self.report_saved(writer.close())
         
-        # 결과 저장
-        self.save_results(all_results)
+        top_results = writer.top()
+        self.save_to_sheets(top_results)
         
         # 상위 키워드 표시
-        self.display_top_keywords(all_results)
+        self.display_top_keywords(top_results)
         
-        # 콘텐츠 생성 여부 확인
-        self.generate_content_for_top(all_results)
+        # 콘텐츠 생성 (--generate-content 지정 시)
+        self.generate_content_for_top(top_results, generate_content)
     
-    def save_results(self, results: list):
-        """결과 저장"""
-        # Google Sheets 저장
-        if self.use_sheets:
-            try:
-                sheet_url = self.sheets_manager.save_keyword_analysis(results)
-                print(f"\n✅ Google Sheets 저장 완료!")
-                print(f"🔗 {sheet_url}")
-            except Exception as e:
-                print(f"❌ Sheets 저장 실패: {e}")
-        
-        # 로컬 CSV 저장
-        import pandas as pd
-        df = pd.DataFrame(results)
-        filename = f"keyword_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"💾 로컬 저장: {filename}")
+    def save_results(self, results: list, output_formats: List[str] = ('parquet',)):
+        """결과 목록 저장 (parquet: 로컬 데이터셋에 추가, jsonl/csv: 실행별 파일)"""
+        self.save_to_sheets(results)
+        with ResultWriter(output_formats) as writer:
+            for result in results:
+                writer.write(result)
+        self.report_saved(writer.index())
+    
+    def save_to_sheets(self, results: list):
+        """Google Sheets 저장"""
+        if not self.use_sheets or not results:
+            return
+        try:
+            sheet_url = self.sheets_manager.save_keyword_analysis(results)
+            print(f"\n✅ Google Sheets 저장 완료!")
+            print(f"🔗 {sheet_url}")
+        except Exception as e:
+            print(f"❌ Sheets 저장 실패: {e}")
+    
+    def report_saved(self, index: Dict):
+        """로컬 저장 결과 출력"""
+        for path in index['files'].values():
+            print(f"💾 로컬 저장: {path} ({index['rows']}개 행)")
+        if index['parquet_rows']:
+            print(f"💾 로컬 저장: {DATASET_PATH} ({index['parquet_rows']}개 행 추가)")
     
     def display_top_keywords(self, results: list, top_n: int = 10):
         """상위 키워드 표시"""
@@ -136,34 +187,81 @@ class IntegratedBlogSystem:
             else:
                 recommend = "⚠️ 낮음"
             
+            posts_7d = f"{item['posts_7d']:,}{'+' if item['posts_lower_bound'] else ''}"
             print(f"{i:<4} {item['keyword']:<15} {score:<6.1f} {item['total_products']:<10,} "
-                  f"{item['posts_7d']:<10} {recommend:<10}")
+                  f"{posts_7d:<10} {recommend:<10}")
     
-    def generate_content_for_top(self, results: list):
-        """상위 키워드 콘텐츠 생성"""
+    def generate_content_for_top(self, results: list, generate: bool = False):
+        """상위 키워드 콘텐츠 생성 (generate=True 일 때만)"""
         sorted_results = sorted(results, key=lambda x: x['total_score'], reverse=True)
         top_keywords = [r['keyword'] for r in sorted_results[:5]]
         
         print(f"\n📝 콘텐츠 생성 옵션")
         print(f"상위 5개 키워드: {', '.join(top_keywords)}")
         
-        choice = input("\n콘텐츠를 생성하시겠습니까? (y/n): ")
-        if choice.lower() == 'y':
-            # 기존 blog_automation_no_openai.py의 콘텐츠 생성 로직 활용
-            print("✅ 콘텐츠 생성을 시작합니다...")
-            # 여기에 콘텐츠 생성 로직 추가
-            
-            # Sheets에 로그 저장
-            if self.use_sheets:
-                for keyword in top_keywords[:3]:  # 상위 3개만
-                    self.sheets_manager.save_content_log(
-                        keyword, 
-                        f"blog_posts/{keyword}_{datetime.now().strftime('%Y%m%d')}.md"
-                    )
+        if not generate:
+            print("ℹ️ 콘텐츠를 생성하려면 --generate-content 옵션을 사용하세요.")
+            return
+        
+        # 기존 blog_automation_no_openai.py의 콘텐츠 생성 로직 활용
+        print("✅ 콘텐츠 생성을 시작합니다...")
+        # 여기에 콘텐츠 생성 로직 추가
+        
+        # Sheets에 로그 저장
+        if self.use_sheets:
+            for keyword in top_keywords[:3]:  # 상위 3개만
+                self.sheets_manager.save_content_log(
+                    keyword, 
+                    f"blog_posts/{keyword}_{datetime.now().strftime('%Y%m%d')}.md"
+                )
+
+def resolve_categories(values: List[str]) -> List[str]:
+    """카테고리 이름 또는 번호(1부터) 목록을 카테고리 이름 목록으로 변환"""
+    names = list(KEYWORDS.keys())
+    categories = []
+    for value in values:
+        if value.isdigit() and 1 <= int(value) <= len(names):
+            categories.append(names[int(value) - 1])
+        elif value in KEYWORDS:
+            categories.append(value)
+        else:
+            raise ValueError(f"알 수 없는 카테고리: {value}")
+    return categories
 
-def main():
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="통합 블로그 키워드 분석 (cron 등 비대화형 실행용)")
+    parser.add_argument('-c', '--categories', nargs='+', metavar='CATEGORY',
+                        help="분석할 카테고리 이름 또는 번호 (기본: 전체)")
+    parser.add_argument('--list', action='store_true', help="카테고리 목록만 출력")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"동시 수집 요청 수 (기본: {DEFAULT_CONCURRENCY})")
+    parser.add_argument('--format', dest='output_formats', nargs='+', choices=OUTPUT_FORMATS,
+                        default=['parquet'],
+                        help="결과 저장 형식, 여러 개 지정 가능 (jsonl/csv는 키워드마다 바로 기록, 기본: parquet)")
+    parser.add_argument('--resume', action='store_true',
+                        help="저널에 남은 최근 결과가 있는 키워드는 건너뛰고 이어서 분석")
+    parser.add_argument('--journal', default=JOURNAL_PATH, help=f"체크포인트 저널 경로 (기본: {JOURNAL_PATH})")
+    parser.add_argument('--generate-content', action='store_true', help="상위 키워드 콘텐츠 생성")
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None):
+    args = parse_args(argv)
+    
+    if args.list:
+        for i, category in enumerate(KEYWORDS, 1):
+            print(f"{i}. {category} ({len(KEYWORDS[category])}개 키워드)")
+        return
+    
+    try:
+        categories = resolve_categories(args.categories) if args.categories else None
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    
     system = IntegratedBlogSystem()
-    system.run_full_analysis()
+    system.run_full_analysis(categories, concurrency=args.concurrency,
+                             output_formats=args.output_formats, resume=args.resume,
+                             journal_path=args.journal, generate_content=args.generate_content)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+백그라운드 작업 큐
+- 오래 걸리는 분석/세분화를 요청 스레드 밖(제한된 스레드 풀)에서 실행
+- 작업 상태/진행률/결과를 SQLite에 저장 → 어느 gunicorn 워커에서든 조회, 재시작 후에도 유지
+- 동일한 작업(유형+파라미터)이 진행 중이면 새로 만들지 않고 기존 작업 ID 반환
+- 종료된 워커가 남긴 미완료 작업은 recover()에서 다시 실행
+"""
+import os
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from sqlite_store import SQLiteDatabase
+
+JOB_DB_PATH = os.getenv('JOB_DB_PATH', 'data/jobs.db')
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', 2))               # 워커 프로세스당 동시 실행 작업 수
+JOB_RETENTION = int(os.getenv('JOB_RETENTION', 7 * 86400))   # 끝난 작업 보관 기간 (초)
+JOB_STALE_AFTER = int(os.getenv('JOB_STALE_AFTER', 900))     # 이 시간 동안 갱신 없는 미완료 작업은 버려진 것으로 간주
+
+# 진행률 저장 최소 간격 (초) - 매 호출마다 쓰기 잠금을 잡지 않도록
+PROGRESS_INTERVAL = 0.5
+
+JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    message TEXT,
+    result TEXT,
+    error TEXT,
+    owner_pid INTEGER,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, type);
+CREATE INDEX IF NOT EXISTS idx_jobs_updated ON jobs (updated_at);
+"""
+
+# 상태값
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    """같은 호스트에서 프로세스가 살아 있는지 확인"""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobQueue:
+    def __init__(self, path: str = JOB_DB_PATH, max_workers: int = JOB_WORKERS):
+        self.db = SQLiteDatabase(path, JOB_SCHEMA)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                           thread_name_prefix='job')
+        self.handlers = {}
+
+    def register(self, job_type: str, handler: Callable[[Dict, Callable], Dict]):
+        """작업 유형 등록 - handler(params, progress) 가 JSON 직렬화 가능한 결과를 반환
+
+        progress(비율 0~1, 메시지) 로 진행 상황을 보고할 수 있다.
+        """
+        self.handlers[job_type] = handler
+
+    def submit(self, job_type: str, params: Dict) -> str:
+        """작업 등록 후 ID 반환 (같은 작업이 대기/실행 중이면 그 ID)"""
+        if job_type not in self.handlers:
+            raise ValueError(f"알 수 없는 작업 유형: {job_type}")
+
+        payload = json.dumps(params, ensure_ascii=False, sort_keys=True)
+        now = time.time()
+        with self.db.transaction() as conn:
+            row = conn.execute(
+                """SELECT id FROM jobs WHERE type = ? AND params = ? AND status IN (?, ?)
+                   ORDER BY created_at DESC LIMIT 1""",
+                (job_type, payload, *ACTIVE_STATUSES)).fetchone()
+            if row:
+                return row[0]
+
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                """INSERT INTO jobs (id, type, params, status, owner_pid, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (job_id, job_type, payload, QUEUED, os.getpid(), now, now))
+
+        self.executor.submit(self._run, job_id, job_type, params)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 상태 조회 (없으면 None)"""
+        row = self.db.connection().execute(
+            """SELECT id, type, params, status, progress, message, result, error,
+                      created_at, updated_at FROM jobs WHERE id = ?""",
+            (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        job_id, job_type, params, status, progress, message, result, error, created_at, updated_at = row
+        job = {
+            'job_id': job_id,
+            'type': job_type,
+            'params': json.loads(params),
+            'status': status,
+            'progress': round(progress, 3),
+            'message': message,
+            'created_at': created_at,
+            'updated_at': updated_at
+        }
+        if result is not None:
+            job['result'] = json.loads(result)
+        if error is not None:
+            job['error'] = error
+        return job
+
+    def _update(self, job_id: str, **fields):
+        fields['updated_at'] = time.time()
+        columns = ', '.join(f"{name} = ?" for name in fields)
+        with self.db.transaction() as conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def _run(self, job_id: str, job_type: str, params: Dict):
+        """풀 스레드에서 작업 실행"""
+        self._update(job_id, status=RUNNING, owner_pid=os.getpid())
+        last_saved = [0.0]
+
+        def progress(ratio: float, message: str = None):
+            now = time.time()
+            if now - last_saved[0] >= PROGRESS_INTERVAL:
+                last_saved[0] = now
+                self._update(job_id, progress=min(max(ratio, 0.0), 1.0), message=message)
+
+        try:
+            result = self.handlers[job_type](params, progress)
+            self._update(job_id, status=DONE, progress=1.0, message=None,
+                         result=json.dumps(result, ensure_ascii=False))
+        except Exception as e:
+            print(f"❌ 작업 실패 ({job_type} {job_id}): {e}")
+            self._update(job_id, status=FAILED, error=str(e))
+
+    def recover(self) -> int:
+        """종료된 프로세스가 남긴 미완료 작업을 이 프로세스에서 다시 실행
+
+        컨테이너 재시작 후 PID가 재사용될 수 있어 오래 갱신되지 않은 작업도 회수한다.
+        """
+        rows = self.db.connection().execute(
+            "SELECT id, type, params, owner_pid, updated_at FROM jobs WHERE status IN (?, ?)",
+            ACTIVE_STATUSES).fetchall()
+
+        recovered = 0
+        for job_id, job_type, params, owner_pid, updated_at in rows:
+            if owner_pid == os.getpid() or job_type not in self.handlers:
+                continue
+            abandoned = time.time() - updated_at > JOB_STALE_AFTER
+            if _pid_alive(owner_pid) and not abandoned:
+                continue
+            # 다른 워커가 먼저 가져가지 않았을 때만 소유권 획득
+            with self.db.transaction() as conn:
+                claimed = conn.execute(
+                    """UPDATE jobs SET status = ?, owner_pid = ?, updated_at = ?
+                       WHERE id = ? AND owner_pid IS ? AND status IN (?, ?)""",
+                    (QUEUED, os.getpid(), time.time(), job_id, owner_pid,
+                     *ACTIVE_STATUSES)).rowcount
+            if claimed:
+                self.executor.submit(self._run, job_id, job_type, json.loads(params))
+                recovered += 1
+        return recovered
+
+    def purge(self, older_than: int = JOB_RETENTION) -> int:
+        """보관 기간이 지난 완료/실패 작업 삭제"""
+        with self.db.transaction() as conn:
+            return conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at <= ?",
+                (DONE, FAILED, time.time() - older_than)).rowcount
+
+    def stats(self) -> Dict:
+        """상태별 작업 수"""
+        rows = self.db.connection().execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
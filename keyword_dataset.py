@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+키워드 분석 결과 Parquet 데이터셋
+- 실행마다 새 파일을 추가하는 append-only 데이터셋 (날짜/카테고리별 파티션)
+- 열 타입이 고정된 스키마 (포스팅 수는 항상 정수)
+- 필요한 열/기간/카테고리만 읽는 조회 함수
+
+pyarrow가 필요하다 (pip install pyarrow).
+"""
+import os
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+DATASET_PATH = os.getenv('KEYWORD_DATASET_PATH', 'data/keyword_dataset')
+
+# 열 이름 → pyarrow 타입 (파티션 열 date/category 포함)
+SCHEMA_FIELDS = [
+    ('keyword', 'string'),
+    ('total_products', 'int64'),
+    ('avg_price', 'float64'),
+    ('brand_diversity', 'int32'),
+    ('posts_7d', 'int64'),
+    ('posts_24h', 'int64'),
+    ('posts_per_day', 'float64'),
+    ('posts_lower_bound', 'bool'),
+    ('posting_freq', 'string'),
+    ('community_interest', 'string'),
+    ('total_score', 'float64'),
+    ('analyzed_at', 'timestamp[s]'),
+    ('date', 'string'),
+    ('category', 'string')
+]
+PARTITION_COLUMNS = ['date', 'category']
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("Parquet 데이터셋 사용 시 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+
+
+def dataset_schema():
+    """데이터셋 스키마"""
+    _require_pyarrow()
+    return pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in SCHEMA_FIELDS])
+
+
+def _partitioning():
+    schema = dataset_schema()
+    return ds.partitioning(pa.schema([schema.field(name) for name in PARTITION_COLUMNS]),
+                           flavor='hive')
+
+
+def append_results(results: List[Dict], category: str = None,
+                   path: str = DATASET_PATH, analyzed_at: datetime = None) -> int:
+    """분석 결과 추가 (기존 파일은 건드리지 않고 파티션별 새 파일 작성), 저장 행 수 반환
+
+    결과에 category가 없으면 인자로 받은 category(없으면 '미분류')를 사용한다.
+    """
+    _require_pyarrow()
+    if not results:
+        return 0
+
+    analyzed_at = analyzed_at or datetime.now()
+    schema = dataset_schema()
+    df = pd.DataFrame(results)
+    df['analyzed_at'] = analyzed_at.replace(microsecond=0)
+    df['date'] = analyzed_at.strftime('%Y-%m-%d')
+    if 'category' not in df:
+        df['category'] = category or '미분류'
+    df['category'] = df['category'].fillna(category or '미분류')
+
+    # 스키마에 없는 열은 버리고 빠진 열은 null로 채움
+    df = df.reindex(columns=schema.names)
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+    os.makedirs(path, exist_ok=True)
+    pq.write_to_dataset(table, path, partitioning=_partitioning(),
+                        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                        existing_data_behavior='overwrite_or_ignore')
+    return table.num_rows
+
+
+def load_results(columns: Optional[List[str]] = None, start_date: str = None,
+                 end_date: str = None, categories: Optional[List[str]] = None,
+                 path: str = DATASET_PATH) -> pd.DataFrame:
+    """조건에 맞는 파티션/열만 읽어 DataFrame 반환 (날짜는 'YYYY-MM-DD')"""
+    _require_pyarrow()
+    if not os.path.isdir(path):
+        return pd.DataFrame(columns=columns or dataset_schema().names)
+
+    dataset = ds.dataset(path, schema=dataset_schema(), format='parquet',
+                         partitioning=_partitioning())
+
+    condition = None
+    for expression in (
+        ds.field('date') >= start_date if start_date else None,
+        ds.field('date') <= end_date if end_date else None,
+        ds.field('category').isin(categories) if categories else None
+    ):
+        if expression is not None:
+            condition = expression if condition is None else condition & expression
+
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
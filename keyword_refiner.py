@@ -3,19 +3,25 @@
 키워드 세분화 및 연관 키워드 분석
 """
 import os
-import requests
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict
 from dotenv import load_dotenv
 import json
+from naver_client import naver_client, NaverSearchClient
+from search_volume_store import search_volumes
 
 load_dotenv()
 
+# 검색량 병렬 조회 스레드 수
+MAX_WORKERS = int(os.getenv('REFINE_MAX_WORKERS', 8))
+
 class KeywordRefiner:
-    def __init__(self):
-        self.headers = {
-            "X-Naver-Client-Id": os.getenv('NAVER_CLIENT_ID'),
-            "X-Naver-Client-Secret": os.getenv('NAVER_CLIENT_SECRET')
-        }
+    # 프로세스 공용 스레드 풀 (처음 사용할 때 생성)
+    _executor = None
+    
+    def __init__(self, client: NaverSearchClient = None):
+        self.client = client or naver_client
+        self.volumes = search_volumes
         
         # 카테고리별 세부 키워드 매핑
         self.keyword_mappings = {
@@ -153,8 +159,19 @@ class KeywordRefiner:
             }
         }
     
-    def get_related_keywords(self, main_keyword: str) -> Dict:
-        """연관 키워드 및 세분화된 카테고리 반환"""
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """검색량 병렬 조회용 스레드 풀"""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                                               thread_name_prefix='refiner')
+        return cls._executor
+    
+    def get_related_keywords(self, main_keyword: str, progress: Callable = None) -> Dict:
+        """연관 키워드 및 세분화된 카테고리 반환
+
+        progress(비율, 메시지)가 주어지면 검색량 조회가 끝날 때마다 진행 상황을 보고한다.
+        """
         
         # 1. 자동완성 API로 연관 키워드 수집
         related = self.get_autocomplete_keywords(main_keyword)
@@ -178,38 +195,23 @@ class KeywordRefiner:
             if generated_categories:
                 predefined['categories'] = generated_categories
         
-        # 5. 각 세부 키워드의 검색량 확인
+        # 5. 각 세부 키워드의 검색량 확인 (카테고리 + 자동완성 키워드를 한 번에 병렬 조회)
         refined_keywords = []
         
-        # 최대 검색량 추적
-        max_volume = 0
-        all_keywords_data = []
+        candidates = [(category, '카테고리') for category in predefined.get('categories', [])[:10]]
+        candidates += [(keyword, '연관검색어') for keyword in related[:5]
+                       if keyword != main_keyword and len(keyword) > 2]
+        volumes = self.get_search_volumes([keyword for keyword, _ in candidates], progress)
         
-        # 카테고리별 키워드
-        if predefined.get('categories'):
-            for category in predefined['categories'][:10]:
-                metrics = self.get_search_volume(category)
-                keyword_data = {
-                    'keyword': category,
-                    'type': '카테고리',
-                    'metrics': metrics,
-                    'parent': main_keyword
-                }
-                all_keywords_data.append(keyword_data)
-                max_volume = max(max_volume, metrics['actual_volume'])
+        all_keywords_data = [{
+            'keyword': keyword,
+            'type': keyword_type,
+            'metrics': volumes[keyword],
+            'parent': main_keyword
+        } for keyword, keyword_type in candidates]
         
-        # 자동완성 키워드 추가
-        for keyword in related[:5]:
-            if keyword != main_keyword and len(keyword) > 2:
-                metrics = self.get_search_volume(keyword)
-                keyword_data = {
-                    'keyword': keyword,
-                    'type': '연관검색어',
-                    'metrics': metrics,
-                    'parent': main_keyword
-                }
-                all_keywords_data.append(keyword_data)
-                max_volume = max(max_volume, metrics['actual_volume'])
+        # 최대 검색량 추적
+        max_volume = max((data['metrics']['actual_volume'] for data in all_keywords_data), default=0)
         
         # 상대적 검색량 계산 및 정리
         for kw_data in all_keywords_data:
@@ -229,24 +231,26 @@ class KeywordRefiner:
         # 실제 검색량 기준 정렬
         refined_keywords.sort(key=lambda x: x['actual_volume'], reverse=True)
         
-        # 최소 5개 보장 - 부족하면 기본 조합 추가
+        # 최소 5개 보장 - 부족하면 기본 조합 추가 (최대 10개까지, 한 번에 병렬 조회)
         if len(refined_keywords) < 5:
             basic_combos = ['추천', '베스트', '인기', '최저가', '후기', '비교', '순위']
-            for combo in basic_combos:
-                if len(refined_keywords) >= 10:
-                    break
-                combo_keyword = f"{main_keyword} {combo}"
-                if not any(kw['keyword'] == combo_keyword for kw in refined_keywords):
-                    metrics = self.get_search_volume(combo_keyword)
-                    refined_keywords.append({
-                        'keyword': combo_keyword,
-                        'type': '추천조합',
-                        'search_volume': 50,  # 기본값
-                        'actual_volume': metrics['actual_volume'],
-                        'shop_count': metrics['shop_total'],
-                        'blog_count': metrics['blog_total'],
-                        'parent': main_keyword
-                    })
+            existing = {kw['keyword'] for kw in refined_keywords}
+            combo_keywords = [f"{main_keyword} {combo}" for combo in basic_combos
+                              if f"{main_keyword} {combo}" not in existing]
+            combo_keywords = combo_keywords[:10 - len(refined_keywords)]
+            
+            combo_volumes = self.get_search_volumes(combo_keywords)
+            for combo_keyword in combo_keywords:
+                metrics = combo_volumes[combo_keyword]
+                refined_keywords.append({
+                    'keyword': combo_keyword,
+                    'type': '추천조합',
+                    'search_volume': 50,  # 기본값
+                    'actual_volume': metrics['actual_volume'],
+                    'shop_count': metrics['shop_total'],
+                    'blog_count': metrics['blog_total'],
+                    'parent': main_keyword
+                })
         
         return {
             'main_keyword': main_keyword,
@@ -274,49 +278,59 @@ class KeywordRefiner:
     
     def analyze_shopping_categories(self, keyword: str) -> List[Dict]:
         """쇼핑 검색 결과에서 카테고리 분석"""
-        url = "https://openapi.naver.com/v1/search/shop.json"
-        params = {
-            "query": keyword,
-            "display": 100,
-            "sort": "sim"
-        }
-        
         categories = {}
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code == 200:
-                items = response.json().get('items', [])
-                
-                # 카테고리별 집계
-                for item in items:
-                    cat1 = item.get('category1', '')
-                    cat2 = item.get('category2', '')
-                    cat3 = item.get('category3', '')
-                    cat4 = item.get('category4', '')
-                    
-                    # 가장 구체적인 카테고리 사용
-                    category = cat4 or cat3 or cat2 or cat1
-                    if category:
-                        categories[category] = categories.get(category, 0) + 1
-                
-                # 상위 카테고리 정렬
-                sorted_categories = sorted(
-                    categories.items(), 
-                    key=lambda x: x[1], 
-                    reverse=True
-                )
+            items = self.client.shop(keyword, display=100, sort="sim").get('items', [])
+            
+            # 카테고리별 집계
+            for item in items:
+                cat1 = item.get('category1', '')
+                cat2 = item.get('category2', '')
+                cat3 = item.get('category3', '')
+                cat4 = item.get('category4', '')
                 
-                return [
-                    {'name': cat[0], 'count': cat[1]} 
-                    for cat in sorted_categories[:10]
-                ]
+                # 가장 구체적인 카테고리 사용
+                category = cat4 or cat3 or cat2 or cat1
+                if category:
+                    categories[category] = categories.get(category, 0) + 1
+            
+            # 상위 카테고리 정렬
+            sorted_categories = sorted(
+                categories.items(), 
+                key=lambda x: x[1], 
+                reverse=True
+            )
+            
+            return [
+                {'name': cat[0], 'count': cat[1]} 
+                for cat in sorted_categories[:10]
+            ]
                 
         except Exception as e:
             print(f"카테고리 분석 실패: {e}")
             
         return []
     
+    def get_search_volumes(self, keywords: List[str], progress: Callable = None) -> Dict[str, Dict]:
+        """여러 키워드의 검색량을 병렬 조회 (요청 속도는 공용 클라이언트 제한기가 관리)
+        
+        지연 시간은 조회 횟수의 합이 아니라 가장 느린 조회에 맞춰진다.
+        """
+        unique = list(dict.fromkeys(keywords))
+        volumes = {}
+        if not unique:
+            return volumes
+        
+        futures = {self.get_executor().submit(self.get_search_volume, keyword): keyword
+                   for keyword in unique}
+        for future in as_completed(futures):
+            keyword = futures[future]
+            volumes[keyword] = future.result()
+            if progress:
+                progress(len(volumes) / len(unique), f"{keyword} 검색량 조회")
+        return volumes
+    
     def get_search_volume(self, keyword: str) -> Dict:
         """키워드 검색량 및 관련 메트릭 수집"""
         metrics = {
@@ -327,25 +341,15 @@ class KeywordRefiner:
             'actual_volume': 0
         }
         
-        # 1. 쇼핑 검색 결과 수
-        url = "https://openapi.naver.com/v1/search/shop.json"
-        params = {"query": keyword, "display": 1}
-        
+        # 1. 쇼핑 검색 결과 수 (공용 검색량 저장소에 있으면 재사용)
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code == 200:
-                metrics['shop_total'] = response.json().get('total', 0)
+            metrics['shop_total'] = self.volumes.get_total(keyword, 'shop_total', self.client)
         except:
             pass
         
         # 2. 블로그 검색 결과 수
-        url = "https://openapi.naver.com/v1/search/blog.json"
-        params = {"query": keyword, "display": 1}
-        
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code == 200:
-                metrics['blog_total'] = response.json().get('total', 0)
+            metrics['blog_total'] = self.volumes.get_total(keyword, 'blog_total', self.client)
         except:
             pass
         
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+키워드 종합 점수 계산
+- 가중치(배점/구간)를 설정값으로 분리
+- numpy 벡터 연산으로 수천 개 키워드를 한 번에 계산 (가중치 변경 후 과거 결과 재채점용)
+- 단일 키워드 점수(calculate_total_score)도 같은 계산 함수를 사용해 결과가 항상 일치
+"""
+from typing import Dict, Iterable, List
+import numpy as np
+import pandas as pd
+
+DEFAULT_SCORE_WEIGHTS = {
+    # 쇼핑 상품 수 (0-30점): 상품 수 / 100
+    'products_max': 30,
+    'products_divisor': 100,
+    # 블로그 활성도 (0-25점): 7일 포스팅 수 / 4
+    'blog_max': 25,
+    'blog_divisor': 4,
+    # 가격대 (0-20점) - 중간 가격대가 좋음: [(최소, 최대, 점수), ...] 앞에서부터 적용
+    'price_bands': [(10000, 100000, 20), (5000, 200000, 15)],
+    'price_default': 10,
+    # 브랜드 다양성 (0-15점): 브랜드 수 × 1.5
+    'brand_max': 15,
+    'brand_factor': 1.5,
+    # 커뮤니티 관심도 (0-10점)
+    'community_points': {'매우 높음': 10, '높음': 7, '보통': 5},
+    'community_default': 2
+}
+
+# 채점에 필요한 열 (metrics_frame 결과)
+SCORE_COLUMNS = ['total_products', 'avg_price', 'posts_7d', 'brand_diversity', 'community_interest']
+
+
+def merge_weights(weights: Dict = None) -> Dict:
+    """기본 가중치에 일부 항목만 덮어쓴 가중치 반환"""
+    merged = dict(DEFAULT_SCORE_WEIGHTS)
+    merged.update(weights or {})
+    return merged
+
+
+def score_arrays(total_products, avg_price, posts_7d, brand_diversity, community_interest,
+                 weights: Dict = None) -> np.ndarray:
+    """열 단위 배열로 종합 점수 계산 (소수 첫째 자리 반올림)"""
+    weights = merge_weights(weights)
+    products = np.asarray(total_products, dtype=np.float64)
+    price = np.asarray(avg_price, dtype=np.float64)
+    posts = np.asarray(posts_7d, dtype=np.float64)
+    brands = np.asarray(brand_diversity, dtype=np.float64)
+    community = np.asarray(community_interest, dtype=object)
+
+    score = np.minimum(weights['products_max'], products / weights['products_divisor'])
+    score = score + np.minimum(weights['blog_max'], posts / weights['blog_divisor'])
+
+    price_points = np.full(price.shape, weights['price_default'], dtype=np.float64)
+    for low, high, points in reversed(weights['price_bands']):
+        price_points = np.where((price >= low) & (price <= high), points, price_points)
+    score = score + price_points
+
+    score = score + np.minimum(weights['brand_max'], brands * weights['brand_factor'])
+    levels = weights['community_points']
+    score = score + np.select([community == level for level in levels], list(levels.values()),
+                              weights['community_default'])
+
+    # np.round(x*10)/10 방식은 경계값에서 파이썬 round와 0.1 차이가 나므로 반올림만 round로 처리
+    return np.fromiter((round(value, 1) for value in score.tolist()),
+                       dtype=np.float64, count=score.size)
+
+
+def metrics_row(metrics: Dict) -> Dict:
+    """분석 메트릭(중첩 dict)에서 채점용 열 추출"""
+    return {
+        'keyword': metrics['keyword'],
+        'total_products': metrics['shopping_data']['total_products'],
+        'avg_price': metrics['shopping_data']['avg_price'],
+        'posts_7d': metrics['blog_data']['recent_posts_7d'],
+        'brand_diversity': metrics['shopping_data']['brand_diversity'],
+        'community_interest': metrics['cafe_data']['community_interest']
+    }
+
+
+def metrics_frame(metrics_list: Iterable[Dict]) -> pd.DataFrame:
+    """분석 메트릭 목록을 채점용 열 테이블로 변환"""
+    return pd.DataFrame([metrics_row(metrics) for metrics in metrics_list],
+                        columns=['keyword'] + SCORE_COLUMNS)
+
+
+def score_frame(df: pd.DataFrame, weights: Dict = None) -> pd.Series:
+    """열 테이블(SCORE_COLUMNS 포함) 전체의 종합 점수"""
+    scores = score_arrays(*(df[column].to_numpy() for column in SCORE_COLUMNS), weights=weights)
+    return pd.Series(scores, index=df.index, name='total_score')
+
+
+def score_metrics(metrics: Dict, weights: Dict = None) -> float:
+    """단일 키워드 종합 점수 (score_arrays와 같은 계산)"""
+    row = metrics_row(metrics)
+    return float(score_arrays(*([row[column]] for column in SCORE_COLUMNS), weights=weights)[0])
+
+
+def rescore(records: List[Dict], weights: Dict = None) -> pd.DataFrame:
+    """저장된 결과(SCORE_COLUMNS 포함 dict 목록)를 새 가중치로 재채점"""
+    df = pd.DataFrame(records)
+    df['total_score'] = score_frame(df, weights)
+    return df.sort_values('total_score', ascending=False)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+키워드 메트릭 일별 이력 저장소
+- 분석할 때마다 (키워드, 날짜) 단위로 핵심 수치를 저장 (같은 날은 최신 값으로 덮어씀)
+- 주간 비교/트렌드 방향을 저장된 스냅샷과의 실제 차이로 계산 (추가 API 호출 없음)
+- SQLite 파일이라 gunicorn 워커와 배치 분석이 함께 기록
+"""
+import os
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from sqlite_store import SQLiteDatabase
+
+HISTORY_DB_PATH = os.getenv('METRICS_HISTORY_DB', 'data/metrics_history.db')
+
+# 추세 판단 기준: 비교 시점 대비 변화율이 이 값을 넘으면 상승/하락
+TREND_THRESHOLD = 0.1
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keyword_metrics (
+    keyword TEXT NOT NULL,
+    date TEXT NOT NULL,
+    total_products INTEGER,
+    avg_price REAL,
+    total_posts INTEGER,
+    posts_7d INTEGER,
+    posts_per_day REAL,
+    total_articles INTEGER,
+    total_news INTEGER,
+    total_score REAL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (keyword, date)
+) WITHOUT ROWID;
+"""
+
+SNAPSHOT_COLUMNS = ['total_products', 'avg_price', 'total_posts', 'posts_7d', 'posts_per_day',
+                    'total_articles', 'total_news', 'total_score']
+
+
+def snapshot_from_metrics(metrics: Dict) -> Dict:
+    """분석 메트릭에서 저장할 수치만 추출"""
+    return {
+        'total_products': metrics['shopping_data']['total_products'],
+        'avg_price': metrics['shopping_data']['avg_price'],
+        'total_posts': metrics['blog_data']['total_posts'],
+        'posts_7d': metrics['blog_data']['recent_posts_7d'],
+        'posts_per_day': metrics['blog_data'].get('posts_per_day', 0),
+        'total_articles': metrics['cafe_data']['total_articles'],
+        'total_news': metrics['news_data']['total_news'],
+        'total_score': metrics.get('total_score')
+    }
+
+
+def format_change(current: float, previous: float) -> str:
+    """변화율 문자열 (예: '+23%'), 비교 불가 시 'N/A'"""
+    if current is None or not previous:
+        return 'N/A'
+    return f"{(current - previous) / previous * 100:+.0f}%"
+
+
+class MetricsHistory:
+    def __init__(self, path: str = HISTORY_DB_PATH):
+        self.db = SQLiteDatabase(path, HISTORY_SCHEMA)
+
+    def record(self, keyword: str, snapshot: Dict, day: date = None):
+        """스냅샷 저장 (같은 날짜는 덮어씀)"""
+        day = (day or date.today()).isoformat()
+        columns = ', '.join(SNAPSHOT_COLUMNS)
+        placeholders = ', '.join('?' for _ in SNAPSHOT_COLUMNS)
+        with self.db.transaction() as conn:
+            conn.execute(
+                f"""INSERT OR REPLACE INTO keyword_metrics (keyword, date, {columns}, updated_at)
+                    VALUES (?, ?, {placeholders}, ?)""",
+                (keyword, day, *(snapshot.get(column) for column in SNAPSHOT_COLUMNS), time.time()))
+
+    def get_snapshot(self, keyword: str, on_or_before: date,
+                     not_before: date = None) -> Optional[Dict]:
+        """지정 날짜 이전(포함) 가장 최근 스냅샷 (not_before보다 오래된 것은 제외)"""
+        row = self.db.connection().execute(
+            f"""SELECT date, {', '.join(SNAPSHOT_COLUMNS)} FROM keyword_metrics
+                WHERE keyword = ? AND date <= ? AND date >= ?
+                ORDER BY date DESC LIMIT 1""",
+            (keyword, on_or_before.isoformat(), (not_before or date.min).isoformat())).fetchone()
+        if row is None:
+            return None
+        return dict(zip(['date'] + SNAPSHOT_COLUMNS, row))
+
+    def get_series(self, keyword: str, days: int = 90) -> List[Dict]:
+        """최근 N일 스냅샷 (날짜순)"""
+        since = (date.today() - timedelta(days=days)).isoformat()
+        rows = self.db.connection().execute(
+            f"""SELECT date, {', '.join(SNAPSHOT_COLUMNS)} FROM keyword_metrics
+                WHERE keyword = ? AND date >= ? ORDER BY date""",
+            (keyword, since)).fetchall()
+        return [dict(zip(['date'] + SNAPSHOT_COLUMNS, row)) for row in rows]
+
+    def weekly_comparison(self, keyword: str, current: Dict, today: date = None) -> Dict:
+        """1주 전(5~9일 전 중 가장 가까운) 스냅샷 대비 변화율
+
+        검색량은 네이버가 제공하지 않으므로 쇼핑 검색 결과 상품 수 변화로 대신한다.
+        """
+        today = today or date.today()
+        previous = self.get_snapshot(keyword, today - timedelta(days=5), today - timedelta(days=9))
+        if previous is None:
+            return {
+                'search_volume_change': 'N/A',
+                'posting_change': 'N/A',
+                'price_change': 'N/A',
+                'compared_with': None
+            }
+        return {
+            'search_volume_change': format_change(current['total_products'], previous['total_products']),
+            'posting_change': format_change(current['posts_7d'], previous['posts_7d']),
+            'price_change': format_change(current['avg_price'], previous['avg_price']),
+            'compared_with': previous['date']
+        }
+
+    def trend(self, keyword: str, current: Dict, today: date = None) -> Dict:
+        """블로그 게시 속도(하루 평균 포스트)의 4주 전 대비 변화로 추세 판단"""
+        today = today or date.today()
+        previous = self.get_snapshot(keyword, today - timedelta(days=21), today - timedelta(days=35))
+        if previous is None:
+            previous = self.get_snapshot(keyword, today - timedelta(days=5), today - timedelta(days=20))
+
+        trend = {'trend_direction': '데이터 부족', 'trend_strength': 0,
+                 'seasonality': self.seasonality(keyword, current, today)}
+        if previous is None or not previous['posts_per_day']:
+            return trend
+
+        change = (current['posts_per_day'] - previous['posts_per_day']) / previous['posts_per_day']
+        if change > TREND_THRESHOLD:
+            trend['trend_direction'] = '상승'
+        elif change < -TREND_THRESHOLD:
+            trend['trend_direction'] = '하락'
+        else:
+            trend['trend_direction'] = '유지'
+        trend['trend_strength'] = min(100, round(abs(change) * 100))
+        trend['compared_with'] = previous['date']
+        return trend
+
+    def seasonality(self, keyword: str, current: Dict, today: date) -> str:
+        """1년 전 같은 시기 스냅샷과 최근 1년 평균 비교 (1년치 이력이 없으면 '데이터 부족')"""
+        last_year = self.get_snapshot(keyword, today - timedelta(days=358), today - timedelta(days=372))
+        if last_year is None:
+            return '데이터 부족'
+
+        row = self.db.connection().execute(
+            "SELECT AVG(posts_per_day) FROM keyword_metrics WHERE keyword = ? AND date > ?",
+            (keyword, (today - timedelta(days=365)).isoformat())).fetchone()
+        yearly_mean = row[0] or 0
+        if not yearly_mean:
+            return '데이터 부족'
+        # 지금과 작년 이맘때가 모두 연평균보다 크게 벗어나면 계절성 있음
+        deviations = [(value - yearly_mean) / yearly_mean
+                      for value in (current['posts_per_day'], last_year['posts_per_day'])]
+        if all(abs(deviation) > 0.3 for deviation in deviations) and deviations[0] * deviations[1] > 0:
+            return '계절성 있음'
+        return '계절성 낮음'
+
+
+# 프로세스 공용 인스턴스
+metrics_history = MetricsHistory()
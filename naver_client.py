@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+네이버 검색 Open API 공용 클라이언트
+- keep-alive 커넥션 풀 (TCP/TLS 핸드셰이크 재사용)
+- shop/blog/cafearticle/news 검색 메서드
+- 타임아웃 설정 일원화
+- 공용 속도 제한/일일 할당량 적용
+- 동시에 들어온 동일 요청은 한 번만 호출 (single-flight)
+"""
+import os
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+from rate_limiter import rate_limiter as default_rate_limiter, NaverRateLimiter
+from single_flight import SingleFlight
+
+load_dotenv()
+
+BASE_URL = "https://openapi.naver.com/v1/search"
+
+# (연결 타임아웃, 읽기 타임아웃) 초
+DEFAULT_TIMEOUT = (
+    float(os.getenv('NAVER_API_CONNECT_TIMEOUT', 3.05)),
+    float(os.getenv('NAVER_API_READ_TIMEOUT', 10))
+)
+
+# 커넥션 풀 크기 (gunicorn 스레드 + 분석기 병렬 호출 수 이상)
+DEFAULT_POOL_SIZE = int(os.getenv('NAVER_API_POOL_SIZE', 16))
+
+
+class NaverAPIError(Exception):
+    """네이버 API 비정상 응답"""
+
+    def __init__(self, status_code: int, message: str = ''):
+        self.status_code = status_code
+        super().__init__(message or f"API 오류: {status_code}")
+
+
+class NaverSearchClient:
+    def __init__(self, client_id: str = None, client_secret: str = None,
+                 timeout=DEFAULT_TIMEOUT, pool_size: int = DEFAULT_POOL_SIZE,
+                 rate_limiter: NaverRateLimiter = None):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.single_flight = SingleFlight()
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "X-Naver-Client-Id": client_id or os.getenv('NAVER_CLIENT_ID') or '',
+            "X-Naver-Client-Secret": client_secret or os.getenv('NAVER_CLIENT_SECRET') or ''
+        })
+
+        # 같은 호스트로의 연결을 풀에 유지해 재사용
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+
+    def search(self, endpoint: str, query: str, display: int = 10,
+               start: int = 1, sort: Optional[str] = None, **extra) -> Dict:
+        """검색 API 호출 후 JSON 응답 반환 (200 이외 응답은 NaverAPIError)
+
+        같은 (endpoint, query, display, start, sort) 요청이 진행 중이면 그 응답을 공유한다.
+        """
+        params = {"query": query, "display": display}
+        if start != 1:
+            params["start"] = start
+        if sort:
+            params["sort"] = sort
+        params.update(extra)
+
+        key = (endpoint, query, display, start, sort, tuple(sorted(extra.items())))
+        return self.single_flight.do(key, self._request, endpoint, params)
+
+    def _request(self, endpoint: str, params: Dict) -> Dict:
+        """실제 HTTP 호출"""
+        # 할당량 차감 + 초당 요청 수 제한 (한도 초과 시 QuotaExceededError)
+        self.rate_limiter.acquire()
+        response = self.session.get(f"{BASE_URL}/{endpoint}.json",
+                                    params=params, timeout=self.timeout)
+        if response.status_code != 200:
+            raise NaverAPIError(response.status_code)
+        return response.json()
+
+    def shop(self, query: str, display: int = 10, start: int = 1,
+             sort: Optional[str] = None, **extra) -> Dict:
+        """쇼핑 검색"""
+        return self.search("shop", query, display, start, sort, **extra)
+
+    def blog(self, query: str, display: int = 10, start: int = 1,
+             sort: Optional[str] = None) -> Dict:
+        """블로그 검색"""
+        return self.search("blog", query, display, start, sort)
+
+    def cafearticle(self, query: str, display: int = 10, start: int = 1,
+                    sort: Optional[str] = None) -> Dict:
+        """카페 글 검색"""
+        return self.search("cafearticle", query, display, start, sort)
+
+    def news(self, query: str, display: int = 10, start: int = 1,
+             sort: Optional[str] = None) -> Dict:
+        """뉴스 검색"""
+        return self.search("news", query, display, start, sort)
+
+
+# 프로세스 공용 인스턴스
+naver_client = NaverSearchClient()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+상품 목록 조회 - /api/products 응답과 캐시 예열에서 공용으로 사용
+"""
+from typing import Dict
+from naver_client import naver_client, NaverSearchClient
+
+
+def search_product_listing(keyword: str, client: NaverSearchClient = None, limit: int = 8) -> Dict:
+    """가격 정보가 있는 상위 상품 목록 조회 (API 오류는 호출자에게 전달)"""
+    client = client or naver_client
+    
+    data = client.shop(keyword, display=20, sort="sim")  # 더 많이 가져와서 선별
+    total = data.get('total', 0)
+    items = data.get('items', [])
+    
+    print(f"검색 결과: 총 {total}개, 받은 항목: {len(items)}개")
+    
+    products = []
+    
+    # 가격이 있는 상품만 필터링
+    valid_items = [item for item in items if item.get('lprice') and int(item['lprice']) > 0]
+    
+    for item in valid_items[:limit]:
+        try:
+            product = {
+                'title': item['title'].replace('<b>', '').replace('</b>', ''),
+                'price': f"{int(item['lprice']):,}",
+                'link': item['link'],
+                'image': item.get('image', ''),
+                'mall': item.get('mallName', '네이버쇼핑'),
+                'category': item.get('category1', '')
+            }
+            products.append(product)
+        except Exception as e:
+            print(f"상품 처리 오류: {e}")
+            continue
+    
+    if not products and total > 0:
+        # 상품은 있지만 처리할 수 없는 경우
+        print("⚠️ 상품은 있지만 유효한 데이터가 없습니다.")
+        return {
+            'products': [],
+            'message': '상품 정보를 불러올 수 없습니다. 다른 키워드를 시도해보세요.'
+        }
+    
+    return {'products': products}
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+네이버 API 요청 속도 제한 및 일일 호출량 관리
+- 토큰 버킷: 초당 요청 수 제한 (스레드/asyncio 모두 사용 가능)
+- 일일 할당량: 검색 API 하루 25,000회 사용량 추적
+- 저장소: 프로세스 메모리 또는 SQLite 파일 (gunicorn 워커 간 공유)
+"""
+import os
+import time
+import asyncio
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from zoneinfo import ZoneInfo
+from dotenv import load_dotenv
+from sqlite_store import SQLiteDatabase
+
+load_dotenv()
+
+RATE_LIMIT = float(os.getenv('NAVER_RATE_LIMIT', 10))          # 초당 요청 수
+RATE_BURST = float(os.getenv('NAVER_RATE_BURST', 10))          # 순간 최대 요청 수
+DAILY_QUOTA = int(os.getenv('NAVER_DAILY_QUOTA', 25000))       # 하루 호출 한도
+BACKEND = os.getenv('NAVER_RATE_LIMIT_BACKEND', 'sqlite')      # sqlite | memory
+DB_PATH = os.getenv('NAVER_RATE_LIMIT_DB', 'data/rate_limit.db')
+KST = ZoneInfo('Asia/Seoul')                                   # 일일 한도 기준 시간대
+
+
+class QuotaExceededError(Exception):
+    """일일 호출 한도 초과"""
+
+
+RATE_LIMIT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_bucket (
+    name TEXT PRIMARY KEY, tokens REAL, updated_at REAL);
+CREATE TABLE IF NOT EXISTS daily_usage (
+    day TEXT PRIMARY KEY, used INTEGER);
+"""
+
+
+class TokenBucket:
+    def __init__(self, rate: float = RATE_LIMIT, capacity: float = RATE_BURST,
+                 path: Optional[str] = None, name: str = 'naver_search'):
+        self.rate = rate
+        self.capacity = capacity
+        self.name = name
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated_at = time.time()
+        self._store = SQLiteDatabase(path, RATE_LIMIT_SCHEMA) if path else None
+        self.backend = 'sqlite' if path else 'memory'
+
+    def _refill(self, tokens: float, updated_at: float, now: float) -> float:
+        return min(self.capacity, tokens + (now - updated_at) * self.rate)
+
+    def _take(self, tokens: float) -> float:
+        """토큰을 가져오면 0, 부족하면 기다려야 할 시간(초) 반환"""
+        now = time.time()
+        if self._store is None:
+            with self._lock:
+                available = self._refill(self._tokens, self._updated_at, now)
+                self._updated_at = now
+                if available >= tokens:
+                    self._tokens = available - tokens
+                    return 0.0
+                self._tokens = available
+                return (tokens - available) / self.rate
+
+        with self._store.transaction() as conn:
+            row = conn.execute("SELECT tokens, updated_at FROM token_bucket WHERE name = ?",
+                               (self.name,)).fetchone()
+            available = self._refill(*row, now) if row else self.capacity
+            wait_time = 0.0
+            if available >= tokens:
+                available -= tokens
+            else:
+                wait_time = (tokens - available) / self.rate
+            conn.execute("INSERT OR REPLACE INTO token_bucket (name, tokens, updated_at) VALUES (?, ?, ?)",
+                         (self.name, available, now))
+            return wait_time
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """토큰을 얻을 때까지 대기 (스레드용)"""
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            wait_time = self._take(tokens)
+            if wait_time <= 0:
+                return True
+            if deadline is not None:
+                if time.time() + wait_time > deadline:
+                    return False
+            time.sleep(wait_time)
+
+    async def acquire_async(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """토큰을 얻을 때까지 대기 (asyncio용, SQLite 잠금 대기는 이벤트 루프 밖에서)"""
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            if self._store is None:
+                wait_time = self._take(tokens)
+            else:
+                wait_time = await asyncio.to_thread(self._take, tokens)
+            if wait_time <= 0:
+                return True
+            if deadline is not None:
+                if time.time() + wait_time > deadline:
+                    return False
+            await asyncio.sleep(wait_time)
+
+
+class DailyQuota:
+    def __init__(self, limit: int = DAILY_QUOTA, path: Optional[str] = None):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._usage = {}
+        self._store = SQLiteDatabase(path, RATE_LIMIT_SCHEMA) if path else None
+
+    @staticmethod
+    def _today() -> str:
+        # 네이버 API 일일 한도는 한국 시간 자정에 초기화 (서버 시간대와 무관)
+        return datetime.now(KST).strftime('%Y-%m-%d')
+
+    def consume(self, count: int = 1):
+        """사용량 차감 (한도를 넘으면 QuotaExceededError)"""
+        day = self._today()
+        if self._store is None:
+            with self._lock:
+                used = self._usage.get(day, 0)
+                if used + count > self.limit:
+                    raise QuotaExceededError(f"일일 API 한도 초과 ({used}/{self.limit})")
+                self._usage = {day: used + count}
+            return
+
+        with self._store.transaction() as conn:
+            row = conn.execute("SELECT used FROM daily_usage WHERE day = ?", (day,)).fetchone()
+            used = row[0] if row else 0
+            if used + count > self.limit:
+                raise QuotaExceededError(f"일일 API 한도 초과 ({used}/{self.limit})")
+            conn.execute("INSERT OR REPLACE INTO daily_usage (day, used) VALUES (?, ?)",
+                         (day, used + count))
+
+    def used(self) -> int:
+        """오늘 사용량"""
+        day = self._today()
+        if self._store is None:
+            return self._usage.get(day, 0)
+        row = self._store.connection().execute(
+            "SELECT used FROM daily_usage WHERE day = ?", (day,)).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self) -> int:
+        """오늘 남은 호출 수"""
+        return max(0, self.limit - self.used())
+
+
+class NaverRateLimiter:
+    """토큰 버킷 + 일일 할당량 묶음"""
+
+    def __init__(self, bucket: TokenBucket, quota: DailyQuota):
+        self.bucket = bucket
+        self.quota = quota
+
+    def acquire(self, count: int = 1):
+        """요청 전 호출 - 할당량 차감 후 속도 제한 대기"""
+        self.quota.consume(count)
+        self.bucket.acquire(count)
+
+    async def acquire_async(self, count: int = 1):
+        """asyncio 코드용 acquire"""
+        await asyncio.to_thread(self.quota.consume, count)
+        await self.bucket.acquire_async(count)
+
+    def remaining_quota(self) -> int:
+        return self.quota.remaining()
+
+    def status(self) -> Dict:
+        """관리자 상태 표시용"""
+        return {
+            'daily_quota': self.quota.limit,
+            'used_today': self.quota.used(),
+            'remaining_today': self.quota.remaining(),
+            'rate_limit_per_sec': self.bucket.rate,
+            'backend': self.bucket.backend
+        }
+
+
+def create_rate_limiter(backend: str = BACKEND, path: str = DB_PATH) -> NaverRateLimiter:
+    """환경 설정에 맞는 제한기 생성 (sqlite: 워커 간 공유, memory: 프로세스 단위)"""
+    store_path = path if backend == 'sqlite' else None
+    return NaverRateLimiter(
+        TokenBucket(RATE_LIMIT, RATE_BURST, path=store_path),
+        DailyQuota(DAILY_QUOTA, path=store_path)
+    )
+
+
+# 프로세스 공용 인스턴스
+rate_limiter = create_rate_limiter()
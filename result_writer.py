@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+대량 분석 결과 스트리밍 저장
+- 키워드 분석이 끝날 때마다 한 행씩 JSONL/CSV에 기록 (행 수마다, 그리고 백그라운드 스레드가 일정 간격마다 flush)
+- Parquet은 일정 행 수마다 데이터셋에 배치 추가 (이미 추가한 키워드는 건너뜀, 추가 후 on_persisted로 알림)
+- 전체 결과를 메모리에 모으지 않고 상위 N개만 힙으로 유지 → 1만 개 이상 키워드도 메모리 일정
+- 종료 시 인덱스(행 수, 카테고리별 개수, 점수 평균, 상위 키워드) 기록
+  JSONL은 마지막 줄({"_index": ...}), CSV는 같은 이름의 .index.json 파일
+
+실행 중에도 이미 기록된 행은 늦어도 flush 간격 안에 읽을 수 있다 (결과가 뜸한 429 대기 중에도).
+Parquet은 PARQUET_BATCH 행마다 또는 close() 시에만 추가된다.
+"""
+import os
+import csv
+import json
+import time
+import heapq
+import itertools
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List
+from keyword_dataset import append_results, pa
+
+FLUSH_INTERVAL = float(os.getenv('SWEEP_FLUSH_INTERVAL', 5))   # 최대 flush 간격 (초)
+FLUSH_ROWS = int(os.getenv('SWEEP_FLUSH_ROWS', 50))            # 이 행 수마다 flush
+PARQUET_BATCH = 1000                                           # Parquet 파일 하나에 담을 행 수
+
+RESULT_COLUMNS = ['keyword', 'category', 'total_products', 'avg_price', 'brand_diversity',
+                  'posts_7d', 'posts_24h', 'posts_per_day', 'posts_lower_bound',
+                  'posting_freq', 'community_interest', 'total_score']
+OUTPUT_FORMATS = ('jsonl', 'csv', 'parquet')
+
+
+class ResultWriter:
+    def __init__(self, formats: Iterable[str] = ('jsonl',), directory: str = '.',
+                 name: str = None, top_n: int = 100, flush_interval: float = FLUSH_INTERVAL,
+                 persisted: Iterable[str] = (), on_persisted: Callable[[List[str]], None] = None):
+        """persisted: 이전 실행에서 Parquet 데이터셋에 이미 추가한 키워드 (JSONL/CSV/상위 결과에는 포함)"""
+        self.formats = list(dict.fromkeys(formats))
+        if 'parquet' in self.formats and pa is None:
+            print("⚠️ pyarrow가 없어 Parquet 대신 CSV로 저장합니다.")
+            self.formats = [fmt for fmt in self.formats if fmt != 'parquet'] + ['csv']
+            self.formats = list(dict.fromkeys(self.formats))
+
+        self.name = name or f"keyword_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.directory = directory
+        self.top_n = top_n
+        self.flush_interval = flush_interval
+        self.started_at = datetime.now()
+
+        self._lock = threading.Lock()
+        self._top = []                      # (점수, 순번, 행) 최소 힙
+        self._sequence = itertools.count()
+        self._parquet_buffer = []
+        self.persisted = set(persisted)
+        self.on_persisted = on_persisted
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self.rows = 0
+        self.score_sum = 0.0
+        self.parquet_rows = 0
+        self.categories = {}
+
+        self._closed = threading.Event()
+        self.paths = {}
+        self._jsonl = self._csv_file = self._csv = None
+        if 'jsonl' in self.formats:
+            self.paths['jsonl'] = os.path.join(directory, f"{self.name}.jsonl")
+            self._jsonl = open(self.paths['jsonl'], 'w', encoding='utf-8')
+        if 'csv' in self.formats:
+            self.paths['csv'] = os.path.join(directory, f"{self.name}.csv")
+            self._csv_file = open(self.paths['csv'], 'w', encoding='utf-8-sig', newline='')
+            self._csv = csv.DictWriter(self._csv_file, fieldnames=RESULT_COLUMNS, extrasaction='ignore')
+            self._csv.writeheader()
+
+        if self._jsonl or self._csv_file:
+            threading.Thread(target=self._flush_loop, daemon=True).start()
+
+    def __enter__(self) -> 'ResultWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, result: Dict):
+        """결과 한 행 기록"""
+        with self._lock:
+            if self._jsonl:
+                self._jsonl.write(json.dumps(result, ensure_ascii=False) + '\n')
+            if self._csv:
+                self._csv.writerow(result)
+            if 'parquet' in self.formats and result['keyword'] not in self.persisted:
+                self._parquet_buffer.append(result)
+                if len(self._parquet_buffer) >= PARQUET_BATCH:
+                    self._flush_parquet()
+
+            self.rows += 1
+            self.score_sum += result.get('total_score', 0)
+            category = result.get('category') or '미분류'
+            self.categories[category] = self.categories.get(category, 0) + 1
+
+            entry = (result.get('total_score', 0), next(self._sequence), result)
+            if len(self._top) < self.top_n:
+                heapq.heappush(self._top, entry)
+            elif entry[0] > self._top[0][0]:
+                heapq.heapreplace(self._top, entry)
+
+            self._pending += 1
+            if self._pending >= FLUSH_ROWS or time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_files()
+
+    def _flush_loop(self):
+        """새 행이 들어오지 않아도 flush하지 않은 행을 flush 간격마다 디스크에 반영"""
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if self._pending and not self._closed.is_set():
+                    self._flush_files()
+
+    def _flush_files(self):
+        for f in (self._jsonl, self._csv_file):
+            if f:
+                f.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def _flush_parquet(self):
+        if self._parquet_buffer:
+            self.parquet_rows += append_results(self._parquet_buffer)
+            keywords = [row['keyword'] for row in self._parquet_buffer]
+            self._parquet_buffer = []
+            self.persisted.update(keywords)
+            if self.on_persisted:
+                self.on_persisted(keywords)
+
+    def top(self, n: int = None) -> List[Dict]:
+        """점수 상위 결과 (높은 순)"""
+        with self._lock:
+            ranked = sorted(self._top, key=lambda entry: (-entry[0], entry[1]))
+        return [row for _, _, row in ranked[:n or self.top_n]]
+
+    def index(self) -> Dict:
+        """전체 결과 요약"""
+        return {
+            'rows': self.rows,
+            'categories': self.categories,
+            'score_mean': round(self.score_sum / self.rows, 2) if self.rows else 0,
+            'top_keywords': [row['keyword'] for row in self.top(10)],
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'parquet_rows': self.parquet_rows,
+            'files': self.paths
+        }
+
+    def close(self) -> Dict:
+        """남은 버퍼 기록 후 인덱스 작성, 요약 반환"""
+        self._closed.set()
+        with self._lock:
+            if 'parquet' in self.formats:
+                self._flush_parquet()
+        index = self.index()
+
+        with self._lock:
+            if self._jsonl:
+                self._jsonl.write(json.dumps({'_index': index}, ensure_ascii=False) + '\n')
+                self._jsonl.close()
+                self._jsonl = None
+            if self._csv_file:
+                self._csv_file.close()
+                self._csv_file = self._csv = None
+                with open(os.path.join(self.directory, f"{self.name}.index.json"), 'w',
+                          encoding='utf-8') as f:
+                    json.dump(index, f, ensure_ascii=False, indent=2)
+        return index
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+배치 작업 스케줄러
+- SQLite 임대(lease)로 리더 선출: 여러 프로세스가 떠 있어도 임대를 가진 하나만 작업 실행
+- 작업 실행 이력 저장 (시작/종료 시각, 상태, 오류)
+- 중단된 동안 놓친 실행은 시작 시 한 번 따라잡기 (처음 보는 작업은 따라잡지 않고 다음 예정 시각부터)
+- 관리자 화면의 수동 실행은 요청만 등록하고 스케줄러 프로세스가 실행
+
+웹 워커는 배치 작업을 하지 않는다. 실행: python -m auto_updater --scheduler
+"""
+import os
+import json
+import time
+import socket
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from sqlite_store import SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_DB_PATH = os.getenv('SCHEDULER_DB', 'data/scheduler.db')
+LEASE_TTL = int(os.getenv('SCHEDULER_LEASE_TTL', 120))        # 갱신 없이 이 시간이 지나면 다른 프로세스가 리더가 됨
+POLL_INTERVAL = int(os.getenv('SCHEDULER_POLL_INTERVAL', 15))  # 예정 작업/실행 요청 확인 주기 (초)
+HISTORY_RETENTION = 30 * 86400                                 # 실행 이력 보관 기간 (초)
+
+LEASE_NAME = 'auto_updater'
+
+SCHEDULER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduler_lease (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job TEXT NOT NULL,
+    trigger TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_job_runs_job ON job_runs (job, started_at);
+CREATE TABLE IF NOT EXISTS run_requests (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job TEXT NOT NULL,
+    requested_at REAL NOT NULL,
+    claimed_at REAL
+);
+"""
+
+
+def previous_due(every: str, at: Optional[str], weekday: Optional[int], now: datetime) -> datetime:
+    """현재 시각 이전(포함) 가장 최근 예정 시각
+
+    every: 'hour' | 'day' | 'week', at: 'HH:MM' (day/week), weekday: 0=월요일 (week)
+    """
+    if every == 'hour':
+        return now.replace(minute=0, second=0, microsecond=0)
+
+    hour, minute = (int(part) for part in at.split(':'))
+    due = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if every == 'day':
+        return due if due <= now else due - timedelta(days=1)
+    if every == 'week':
+        due -= timedelta(days=(now.weekday() - weekday) % 7)
+        return due if due <= now else due - timedelta(days=7)
+    raise ValueError(f"알 수 없는 주기: {every}")
+
+
+class SchedulerStore:
+    """임대/실행 이력/실행 요청 저장소 (웹 워커와 스케줄러 프로세스가 공유)"""
+
+    def __init__(self, path: str = SCHEDULER_DB_PATH):
+        self.db = SQLiteDatabase(path, SCHEDULER_SCHEMA)
+
+    def acquire_lease(self, owner: str, ttl: int = LEASE_TTL, name: str = LEASE_NAME) -> bool:
+        """임대 획득/갱신 (비어 있거나 만료됐거나 내 것일 때만)"""
+        now = time.time()
+        with self.db.transaction() as conn:
+            row = conn.execute("SELECT owner, expires_at FROM scheduler_lease WHERE name = ?",
+                               (name,)).fetchone()
+            if row and row[0] != owner and row[1] > now:
+                return False
+            conn.execute("INSERT OR REPLACE INTO scheduler_lease (name, owner, expires_at) VALUES (?, ?, ?)",
+                         (name, owner, now + ttl))
+            return True
+
+    def release_lease(self, owner: str, name: str = LEASE_NAME):
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM scheduler_lease WHERE name = ? AND owner = ?", (name, owner))
+
+    def leader(self, name: str = LEASE_NAME) -> Optional[Dict]:
+        row = self.db.connection().execute(
+            "SELECT owner, expires_at FROM scheduler_lease WHERE name = ? AND expires_at > ?",
+            (name, time.time())).fetchone()
+        if row is None:
+            return None
+        return {'owner': row[0], 'lease_expires_at': datetime.fromtimestamp(row[1]).isoformat()}
+
+    def start_run(self, job: str, trigger: str, owner: str) -> int:
+        with self.db.transaction() as conn:
+            return conn.execute(
+                "INSERT INTO job_runs (job, trigger, owner, status, started_at) VALUES (?, ?, ?, 'running', ?)",
+                (job, trigger, owner, time.time())).lastrowid
+
+    def finish_run(self, run_id: int, result=None, error: str = None):
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE job_runs SET status = ?, finished_at = ?, result = ?, error = ? WHERE id = ?",
+                ('failed' if error else 'done', time.time(),
+                 json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+                 error, run_id))
+
+    def record_skipped(self, job: str, owner: str) -> int:
+        """실행하지 않은 기록 남기기 (처음 등록된 작업의 기준 시각)"""
+        now = time.time()
+        with self.db.transaction() as conn:
+            return conn.execute(
+                """INSERT INTO job_runs (job, trigger, owner, status, started_at, finished_at)
+                   VALUES (?, 'schedule', ?, 'skipped', ?, ?)""",
+                (job, owner, now, now)).lastrowid
+
+    def last_started(self, job: str) -> Optional[float]:
+        """마지막 실행 시작 시각 (타임스탬프)"""
+        row = self.db.connection().execute(
+            "SELECT MAX(started_at) FROM job_runs WHERE job = ?", (job,)).fetchone()
+        return row[0]
+
+    def recent_runs(self, limit: int = 20) -> List[Dict]:
+        rows = self.db.connection().execute(
+            """SELECT job, trigger, status, started_at, finished_at, error FROM job_runs
+               ORDER BY started_at DESC LIMIT ?""", (limit,)).fetchall()
+        return [{
+            'job': job,
+            'trigger': trigger,
+            'status': status,
+            'started_at': datetime.fromtimestamp(started_at).isoformat(timespec='seconds'),
+            'duration': round(finished_at - started_at, 1) if finished_at else None,
+            'error': error
+        } for job, trigger, status, started_at, finished_at, error in rows]
+
+    def request_run(self, job: str) -> int:
+        """수동 실행 요청 등록 (같은 작업의 대기 중인 요청이 있으면 그 ID)"""
+        with self.db.transaction() as conn:
+            row = conn.execute("SELECT id FROM run_requests WHERE job = ? AND claimed_at IS NULL",
+                               (job,)).fetchone()
+            if row:
+                return row[0]
+            return conn.execute("INSERT INTO run_requests (job, requested_at) VALUES (?, ?)",
+                                (job, time.time())).lastrowid
+
+    def claim_requests(self) -> List[str]:
+        """대기 중인 실행 요청을 가져가고 작업 이름 목록 반환 (요청 순)"""
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, job FROM run_requests WHERE claimed_at IS NULL ORDER BY id").fetchall()
+            conn.execute("UPDATE run_requests SET claimed_at = ? WHERE claimed_at IS NULL", (time.time(),))
+        return list(dict.fromkeys(job for _, job in rows))
+
+    def pending_requests(self) -> List[str]:
+        rows = self.db.connection().execute(
+            "SELECT job FROM run_requests WHERE claimed_at IS NULL ORDER BY id").fetchall()
+        return [job for job, in rows]
+
+    def purge(self, retention: int = HISTORY_RETENTION) -> int:
+        """보관 기간이 지난 실행 이력/요청 삭제"""
+        cutoff = time.time() - retention
+        with self.db.transaction() as conn:
+            removed = conn.execute("DELETE FROM job_runs WHERE started_at < ?", (cutoff,)).rowcount
+            removed += conn.execute("DELETE FROM run_requests WHERE claimed_at < ?", (cutoff,)).rowcount
+            return removed
+
+    def status(self) -> Dict:
+        """관리자 상태 표시용"""
+        return {
+            'leader': self.leader(),
+            'pending_requests': self.pending_requests(),
+            'recent_runs': self.recent_runs(10)
+        }
+
+
+class JobScheduler:
+    """등록된 작업을 예정 시각마다 실행 (임대를 가진 프로세스만)"""
+
+    def __init__(self, store: SchedulerStore = None, lease_ttl: int = LEASE_TTL,
+                 poll_interval: int = POLL_INTERVAL):
+        self.store = store or scheduler_store
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.jobs = {}
+        self.is_leader = False
+        self._stop = threading.Event()
+        self._last_purge = 0.0
+
+    def register(self, name: str, func: Callable, every: str = None, at: str = None,
+                 weekday: int = None):
+        """작업 등록 (every가 없으면 수동 실행 요청으로만 실행)"""
+        if every:
+            previous_due(every, at, weekday, datetime.now())    # 잘못된 설정은 등록 시점에 오류
+        self.jobs[name] = {'func': func, 'every': every, 'at': at, 'weekday': weekday}
+
+    def due_jobs(self, now: datetime = None) -> List[str]:
+        """예정 시각이 지났는데 그 이후 실행 기록이 없는 작업 (놓친 실행 포함, 여러 번 놓쳐도 한 번만)
+
+        실행 기록이 전혀 없는 작업은 새 배포로 보고 'skipped' 기록만 남긴다
+        (배포할 때마다 모든 배치 작업이 한꺼번에 돌지 않도록).
+        """
+        now = now or datetime.now()
+        due = []
+        for name, job in self.jobs.items():
+            if not job['every']:
+                continue
+            scheduled = previous_due(job['every'], job['at'], job['weekday'], now).timestamp()
+            last = self.store.last_started(name)
+            if last is None:
+                self.store.record_skipped(name, self.owner)
+                logger.info(f"새 작업 등록: {name} (다음 예정 시각부터 실행)")
+            elif last < scheduled:
+                due.append(name)
+        return due
+
+    def run_job(self, name: str, trigger: str):
+        """작업 하나 실행 후 이력 기록"""
+        run_id = self.store.start_run(name, trigger, self.owner)
+        logger.info(f"작업 시작: {name} ({trigger})")
+        try:
+            result = self.jobs[name]['func']()
+            self.store.finish_run(run_id, result=result)
+            logger.info(f"작업 완료: {name}")
+        except Exception as e:
+            logger.error(f"작업 실패 '{name}': {e}")
+            self.store.finish_run(run_id, error=str(e))
+
+    def run_pending(self):
+        """수동 실행 요청과 예정 작업 실행 (리더일 때만 호출)"""
+        for name in self.store.claim_requests():
+            if name in self.jobs:
+                self.run_job(name, 'manual')
+            else:
+                logger.warning(f"알 수 없는 작업 요청 무시: {name}")
+            if self._stop.is_set() or not self.is_leader:
+                return
+
+        for name in self.due_jobs():
+            self.run_job(name, 'schedule')
+            if self._stop.is_set() or not self.is_leader:
+                return
+
+    def _renew_lease(self):
+        """임대 주기적 갱신 (긴 작업 실행 중에도 리더 유지)"""
+        while not self._stop.wait(self.lease_ttl / 3):
+            try:
+                renewed = self.store.acquire_lease(self.owner, self.lease_ttl)
+            except Exception as e:
+                logger.error(f"스케줄러 임대 갱신 실패: {e}")
+                renewed = False
+            if self.is_leader and not renewed:
+                logger.warning("스케줄러 리더 자격 상실")
+            self.is_leader = renewed
+
+    def run_forever(self):
+        """리더 선출 후 작업 실행 (종료 신호까지 반복)"""
+        logger.info(f"스케줄러 시작: {self.owner}, 작업 {list(self.jobs)}")
+        threading.Thread(target=self._renew_lease, daemon=True).start()
+        try:
+            while not self._stop.is_set():
+                if not self.is_leader:
+                    self.is_leader = self.store.acquire_lease(self.owner, self.lease_ttl)
+                    if self.is_leader:
+                        logger.info("스케줄러 리더로 선출됨")
+                if self.is_leader:
+                    self.run_pending()
+                    if time.time() - self._last_purge > 3600:
+                        self.store.purge()
+                        self._last_purge = time.time()
+                self._stop.wait(self.poll_interval)
+        finally:
+            if self.is_leader:
+                self.store.release_lease(self.owner)
+            logger.info("스케줄러 종료")
+
+    def stop(self):
+        self._stop.set()
+
+
+# 프로세스 공용 인스턴스
+scheduler_store = SchedulerStore()
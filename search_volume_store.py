@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+키워드별 검색 결과 수(total) 공용 저장소
+- 쇼핑/블로그/카페/뉴스 total 값을 키워드 단위로 보관 (TTL 이내면 API 호출 없이 재사용)
+- KeywordRefiner, SmartBlogAutomation, AdvancedKeywordAnalyzer 가 같은 값을 공유
+- SQLite 파일이라 gunicorn 워커와 배치 스크립트가 함께 사용
+"""
+import os
+import time
+from typing import Dict, Optional
+from sqlite_store import SQLiteDatabase
+from naver_client import naver_client, NaverSearchClient
+
+SEARCH_VOLUME_DB = os.getenv('SEARCH_VOLUME_DB', 'data/search_volume.db')
+SEARCH_VOLUME_TTL = int(os.getenv('SEARCH_VOLUME_TTL', 43200))   # 12시간
+
+# 저장 항목 → 검색 API 엔드포인트
+VOLUME_FIELDS = {
+    'shop_total': 'shop',
+    'blog_total': 'blog',
+    'cafe_total': 'cafearticle',
+    'news_total': 'news'
+}
+
+# 항목마다 조회 시각이 달라질 수 있어 (키워드, 항목) 단위로 저장
+SEARCH_VOLUME_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_volume (
+    keyword TEXT NOT NULL,
+    field TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (keyword, field)
+);
+CREATE INDEX IF NOT EXISTS idx_search_volume_fetched ON search_volume (fetched_at);
+"""
+
+
+class SearchVolumeStore:
+    def __init__(self, path: str = SEARCH_VOLUME_DB, ttl: int = SEARCH_VOLUME_TTL):
+        self.ttl = ttl
+        self.db = SQLiteDatabase(path, SEARCH_VOLUME_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, keyword: str) -> Dict:
+        """TTL 이내 항목만 반환 (예: {'shop_total': 1234, 'fetched_at': ...})"""
+        rows = self.db.connection().execute(
+            "SELECT field, total, fetched_at FROM search_volume WHERE keyword = ? AND fetched_at > ?",
+            (keyword, time.time() - self.ttl)).fetchall()
+        if not rows:
+            return {}
+
+        volumes = {field: total for field, total, _ in rows}
+        volumes['fetched_at'] = min(fetched_at for _, _, fetched_at in rows)
+        return volumes
+
+    def record(self, keyword: str, **totals: int):
+        """API 응답에서 얻은 total 값 저장 (예: record('캠핑텐트', shop_total=1234))"""
+        now = time.time()
+        with self.db.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO search_volume (keyword, field, total, fetched_at) VALUES (?, ?, ?, ?)",
+                [(keyword, field, int(total), now) for field, total in totals.items()
+                 if field in VOLUME_FIELDS])
+
+    def lookup(self, keyword: str, field: str) -> Optional[int]:
+        """TTL 이내에 저장된 값 (없으면 None)"""
+        row = self.db.connection().execute(
+            "SELECT total FROM search_volume WHERE keyword = ? AND field = ? AND fetched_at > ?",
+            (keyword, field, time.time() - self.ttl)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def get_total(self, keyword: str, field: str, client: Optional[NaverSearchClient] = None) -> int:
+        """저장된 값이 있으면 반환, 없으면 display=1 검색으로 조회 후 저장 (API 오류는 그대로 전달)"""
+        total = self.lookup(keyword, field)
+        if total is not None:
+            return total
+
+        client = client or naver_client
+        total = client.search(VOLUME_FIELDS[field], keyword, display=1).get('total', 0)
+        self.record(keyword, **{field: total})
+        return total
+
+    def clean_expired(self) -> int:
+        """TTL이 지난 항목 삭제 후 삭제 개수 반환"""
+        with self.db.transaction() as conn:
+            return conn.execute("DELETE FROM search_volume WHERE fetched_at <= ?",
+                                (time.time() - self.ttl,)).rowcount
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0
+        }
+
+
+# 프로세스 공용 인스턴스
+search_volumes = SearchVolumeStore()
@@ -0,0 +1,59 @@
+#!/bin/bash
+
+# 웹 서버와 배치 작업 스케줄러를 한 컨테이너/인스턴스에서 함께 실행하는 감독 스크립트
+# - 스케줄러가 종료되면 SCHEDULER_RESTART_DELAY초 후 재시작 (웹 서버는 계속 서비스)
+# - SIGTERM/SIGINT는 두 프로세스에 전달하고 종료를 기다림
+# - 웹 서버가 종료되면 스케줄러도 정리하고 웹 서버의 종료 코드로 끝남 (플랫폼이 재시작)
+#
+# 사용법: ./serve.sh [웹 서버 명령]   (기본: gunicorn, PORT/WEB_CONCURRENCY 환경 변수 사용)
+# data/를 공유하는 별도 서비스로 나눌 수 있으면(docker-compose, systemd) 각각 따로 실행하는 편이 낫다.
+
+PORT="${PORT:-8000}"
+RESTART_DELAY="${SCHEDULER_RESTART_DELAY:-10}"
+
+if [ "$#" -eq 0 ]; then
+    set -- gunicorn --bind "0.0.0.0:$PORT" --threads 2 wsgi:app
+fi
+
+stopping=0
+web_pid=""
+scheduler_pid=""
+
+start_scheduler() {
+    python -m auto_updater --scheduler &
+    scheduler_pid=$!
+}
+
+shutdown() {
+    stopping=1
+    kill -TERM $web_pid $scheduler_pid 2>/dev/null
+}
+trap shutdown TERM INT
+
+"$@" &
+web_pid=$!
+start_scheduler
+
+while [ "$stopping" -eq 0 ]; do
+    sleep "$RESTART_DELAY" &
+    wait $!
+
+    if [ "$stopping" -ne 0 ]; then
+        break
+    fi
+    if ! kill -0 "$web_pid" 2>/dev/null; then
+        echo "❌ 웹 서버 종료 - 스케줄러 정리 후 종료"
+        break
+    fi
+    if ! kill -0 "$scheduler_pid" 2>/dev/null; then
+        wait "$scheduler_pid"
+        echo "⚠️  스케줄러 종료 (코드 $?) - 재시작"
+        start_scheduler
+    fi
+done
+
+shutdown
+wait "$web_pid"
+status=$?
+wait "$scheduler_pid" 2>/dev/null
+exit $status
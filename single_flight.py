@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+동일 요청 병합 (single-flight)
+- 같은 키로 진행 중인 호출이 있으면 새로 호출하지 않고 그 결과를 함께 사용
+- 진행 중인 호출의 중간 결과를 같은 키를 기다리는 구독자에게 전달 (FlightProgress)
+"""
+import queue
+import threading
+from typing import Any, Callable, Hashable
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0  # 다른 호출 결과를 공유한 횟수
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """key 기준으로 fn 호출을 병합하여 실행
+
+        결과 객체는 대기 중이던 모든 호출자가 공유하므로 수정하지 않아야 한다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 호출 수"""
+        with self._lock:
+            return len(self._calls)
+
+
+class FlightProgress:
+    """진행 중인 호출이 발행한 중간 결과를 같은 키의 구독자에게 전달
+
+    실행 중인 호출이 이미 발행한 이벤트는 늦게 구독한 쪽에도 처음부터 전달한다.
+    최종 결과는 SingleFlight.do 반환값으로 받고, 여기서는 진행 상황만 다룬다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = {}        # key -> 실행 중인 호출이 발행한 이벤트
+        self._subscribers = {}   # key -> [queue.Queue]
+
+    def begin(self, key: Hashable):
+        """호출 시작 (SingleFlight 리더가 호출)"""
+        with self._lock:
+            self._events[key] = []
+
+    def publish(self, key: Hashable, event: Any):
+        with self._lock:
+            if key in self._events:
+                self._events[key].append(event)
+            for subscriber in self._subscribers.get(key, ()):
+                subscriber.put(event)
+
+    def end(self, key: Hashable):
+        with self._lock:
+            self._events.pop(key, None)
+
+    def subscribe(self, key: Hashable) -> queue.Queue:
+        """이벤트를 받을 큐 (실행 중인 호출이 있으면 지금까지의 이벤트가 들어 있음)"""
+        subscriber = queue.Queue()
+        with self._lock:
+            for event in self._events.get(key, ()):
+                subscriber.put(event)
+            self._subscribers.setdefault(key, []).append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, key: Hashable, subscriber: queue.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(key, [])
+            if subscriber in subscribers:
+                subscribers.remove(subscriber)
+            if not subscribers:
+                self._subscribers.pop(key, None)
@@ -7,11 +7,11 @@
 """
 import os
 import json
-import requests
 from datetime import datetime, timedelta
 from typing import List, Dict
 from dotenv import load_dotenv
-import time
+from naver_client import naver_client
+from search_volume_store import search_volumes
 
 load_dotenv()
 
@@ -22,6 +22,8 @@ class SmartBlogAutomation:
             'naver_client_secret': os.getenv('NAVER_CLIENT_SECRET'),
             'openai_api_key': os.getenv('OPENAI_API_KEY')
         }
+        self.client = naver_client
+        self.volumes = search_volumes
         
     def collect_trending_keywords(self) -> List[Dict]:
         """데이터랩 + 쇼핑 트렌드 통합 분석"""
@@ -89,19 +91,10 @@ class SmartBlogAutomation:
     
     def get_search_volume(self, keyword: str) -> float:
         """검색량 분석 (0-100)"""
-        url = "https://openapi.naver.com/v1/search/shop.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        params = {"query": keyword, "display": 1}
-        
         try:
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                total = response.json().get('total', 0)
-                # 정규화 (0-100)
-                return min(100, total / 10000)
+            total = self.volumes.get_total(keyword, 'shop_total', self.client)
+            # 정규화 (0-100)
+            return min(100, total / 10000)
         except:
             pass
         return 50  # 기본값
@@ -172,33 +165,20 @@ class SmartBlogAutomation:
         """인기 콘텐츠 분석"""
         print(f"\n📈 '{keyword}' 인기 콘텐츠 분석 중...")
         
-        # 블로그 검색 API로 인기글 수집
-        url = "https://openapi.naver.com/v1/search/blog.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        params = {
-            "query": keyword,
-            "display": 10,
-            "sort": "sim"  # 정확도순
-        }
-        
+        # 블로그 검색 API로 인기글 수집 (정확도순)
         try:
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                items = response.json().get('items', [])
-                
-                # 인기 콘텐츠 패턴 분석
-                titles = [item['title'] for item in items[:5]]
-                common_patterns = self.extract_content_patterns(titles)
-                
-                return {
-                    'keyword': keyword,
-                    'popular_titles': titles,
-                    'content_patterns': common_patterns,
-                    'recommended_style': self.recommend_content_style(common_patterns)
-                }
+            items = self.client.blog(keyword, display=10, sort="sim").get('items', [])
+            
+            # 인기 콘텐츠 패턴 분석
+            titles = [item['title'] for item in items[:5]]
+            common_patterns = self.extract_content_patterns(titles)
+            
+            return {
+                'keyword': keyword,
+                'popular_titles': titles,
+                'content_patterns': common_patterns,
+                'recommended_style': self.recommend_content_style(common_patterns)
+            }
         except Exception as e:
             print(f"❌ 분석 실패: {e}")
             
@@ -335,8 +315,6 @@ class SmartBlogAutomation:
                 self.generate_and_save_content(keyword, direction)
             else:
                 print(f"⏭️  '{keyword}' 건너뜁니다.")
-            
-            time.sleep(1)
         
         print("\n✅ 스마트 블로그 자동화 완료!")
     
@@ -353,26 +331,17 @@ class SmartBlogAutomation:
     
     def search_products(self, keyword: str) -> List[Dict]:
         """네이버 쇼핑 상품 검색"""
-        url = "https://openapi.naver.com/v1/search/shop.json"
-        headers = {
-            "X-Naver-Client-Id": self.config['naver_client_id'],
-            "X-Naver-Client-Secret": self.config['naver_client_secret']
-        }
-        params = {"query": keyword, "display": 10, "sort": "sim"}
-        
         try:
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                items = response.json().get('items', [])
-                products = []
-                for item in items[:5]:
-                    products.append({
-                        'title': item['title'].replace('<b>', '').replace('</b>', ''),
-                        'price': int(item['lprice']),
-                        'link': item['link'],
-                        'mall': item['mallName']
-                    })
-                return products
+            items = self.client.shop(keyword, display=10, sort="sim").get('items', [])
+            products = []
+            for item in items[:5]:
+                products.append({
+                    'title': item['title'].replace('<b>', '').replace('</b>', ''),
+                    'price': int(item['lprice']),
+                    'link': item['link'],
+                    'mall': item['mallName']
+                })
+            return products
         except:
             pass
         return []
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+SQLite 공용 연결 관리
+- 스레드별 연결, WAL 모드 (여러 gunicorn 워커가 같은 파일을 공유)
+- BEGIN IMMEDIATE 트랜잭션으로 쓰기 충돌 방지
+"""
+import os
+import sqlite3
+import threading
+
+
+class SQLiteDatabase:
+    def __init__(self, path: str, schema: str = ''):
+        self.path = path
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        if schema:
+            self.connection().executescript(schema)
+
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (없으면 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def transaction(self):
+        """쓰기 트랜잭션 컨텍스트"""
+        return _Transaction(self.connection())
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE 로 쓰기 잠금을 잡는 트랜잭션"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
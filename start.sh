@@ -33,13 +33,13 @@ if [ -z "$NAVER_CLIENT_ID" ] || [ -z "$NAVER_CLIENT_SECRET" ]; then
     exit 1
 fi
 
-# 개발/프로덕션 모드 선택
+# 개발/프로덕션 모드 선택 (배치 작업 스케줄러는 serve.sh가 함께 실행하고 감독)
 if [ "$1" == "production" ]; then
     echo "🌐 프로덕션 모드로 시작합니다..."
     export FLASK_ENV=production
-    gunicorn --bind 0.0.0.0:8000 --workers 4 --threads 2 wsgi:app
+    exec ./serve.sh gunicorn --bind 0.0.0.0:8000 --workers 4 --threads 2 wsgi:app
 else
     echo "🔧 개발 모드로 시작합니다..."
     export FLASK_ENV=development
-    python3 web_app.py
+    exec ./serve.sh python3 web_app.py
 fi
\ No newline at end of file
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+대량 분석 체크포인트 저널
+- 키워드 분석이 끝날 때마다 결과 한 줄(JSONL)을 바로 기록
+- 중단(오류, 429, 강제 종료) 후 --resume 으로 TTL 이내에 분석한 키워드는 건너뜀
+- 마지막 줄이 기록 도중 잘려도 나머지 기록은 그대로 사용
+- Parquet 데이터셋에 이미 추가한 키워드를 표시해 재개 시 같은 행을 다시 추가하지 않음
+"""
+import os
+import json
+import time
+import threading
+from typing import Dict, Iterable, Optional, Set
+
+JOURNAL_PATH = os.getenv('SWEEP_JOURNAL_PATH', 'data/sweep_journal.jsonl')
+RESUME_TTL = int(os.getenv('SWEEP_RESUME_TTL', 86400))   # 이 시간 안에 분석한 키워드는 재사용
+
+
+class SweepJournal:
+    def __init__(self, path: str = JOURNAL_PATH, ttl: int = RESUME_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def _entries(self) -> Iterable[Dict]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue    # 기록 도중 중단된 줄
+
+    def load(self, keywords: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """TTL 이내에 기록된 키워드별 최신 결과 (keywords가 주어지면 그 키워드만)"""
+        wanted = set(keywords) if keywords is not None else None
+        cutoff = time.time() - self.ttl
+        done = {}
+        for entry in self._entries():
+            keyword = entry.get('keyword')
+            if ('result' in entry and entry.get('recorded_at', 0) > cutoff
+                    and (wanted is None or keyword in wanted)):
+                done[keyword] = entry['result']
+        return done
+
+    def persisted(self, keywords: Optional[Iterable[str]] = None) -> Set[str]:
+        """TTL 이내 최신 결과가 Parquet 데이터셋에 이미 추가된 키워드"""
+        wanted = set(keywords) if keywords is not None else None
+        recorded, persisted_at = self._latest()
+        return {keyword for keyword, entry in recorded.items()
+                if keyword in persisted_at and persisted_at[keyword]['persisted_at'] >= entry['recorded_at']
+                and (wanted is None or keyword in wanted)}
+
+    def _latest(self):
+        """TTL 이내 키워드별 최신 결과 기록과 최신 Parquet 추가 표시"""
+        cutoff = time.time() - self.ttl
+        recorded, persisted_at = {}, {}
+        for entry in self._entries():
+            if 'result' in entry and entry.get('recorded_at', 0) > cutoff:
+                recorded[entry['keyword']] = entry
+            elif entry.get('persisted_at', 0) > cutoff:
+                persisted_at[entry['keyword']] = entry
+        return recorded, persisted_at
+
+    def _append(self, entries: Iterable[Dict]):
+        lines = ''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record(self, result: Dict):
+        """분석 결과 한 건 기록 (즉시 디스크에 반영)"""
+        self._append([{'keyword': result['keyword'], 'recorded_at': time.time(), 'result': result}])
+
+    def mark_persisted(self, keywords: Iterable[str]):
+        """Parquet 데이터셋에 추가한 키워드 표시 (재개 시 다시 추가하지 않음)"""
+        now = time.time()
+        self._append({'keyword': keyword, 'persisted_at': now} for keyword in keywords)
+
+    def compact(self) -> int:
+        """TTL이 지난 기록과 같은 키워드의 이전 기록을 지우고 남은 건수 반환"""
+        with self._lock:
+            recorded, persisted_at = self._latest()
+
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for keyword, entry in recorded.items():
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                    marker = persisted_at.get(keyword)
+                    if marker and marker['persisted_at'] >= entry['recorded_at']:
+                        f.write(json.dumps(marker, ensure_ascii=False) + '\n')
+            os.replace(temp_path, self.path)
+            return len(recorded)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+소스 수집 실패(429/할당량 초과) 처리 테스트
+- 실패한 소스는 failed_sources에 기록되어 캐시/이력/저널에 남지 않아야 한다
+"""
+import os
+import sys
+import time
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SOURCES = ['shopping_data', 'blog_data', 'cafe_data', 'news_data']
+
+
+class FakeClient:
+    """endpoint별로 지정한 오류를 내는 검색 클라이언트 (delays: endpoint별 응답 지연)"""
+
+    def __init__(self, errors, delays=None):
+        self.errors = errors
+        self.delays = delays or {}
+        self.calls = []
+
+    def search(self, endpoint, query, display=10, start=1, sort=None, **extra):
+        self.calls.append(endpoint)
+        time.sleep(self.delays.get(endpoint, 0))
+        error = self.errors.get(endpoint)
+        if error is not None:
+            raise error
+        return {'total': 1234, 'items': []}
+
+    def shop(self, query, display=10, start=1, sort=None, **extra):
+        return self.search('shop', query, display, start, sort)
+
+    def blog(self, query, display=10, start=1, sort=None):
+        return self.search('blog', query, display, start, sort)
+
+    def cafearticle(self, query, display=10, start=1, sort=None):
+        return self.search('cafearticle', query, display, start, sort)
+
+    def news(self, query, display=10, start=1, sort=None):
+        return self.search('news', query, display, start, sort)
+
+
+def setUpModule():
+    # 저장소(data/*.db)는 임시 디렉토리에 생성
+    global _workdir, _cwd
+    _cwd = os.getcwd()
+    _workdir = tempfile.TemporaryDirectory()
+    os.chdir(_workdir.name)
+
+
+def tearDownModule():
+    os.chdir(_cwd)
+    _workdir.cleanup()
+
+
+class SourceFailureTest(unittest.TestCase):
+    def make_analyzer(self, errors, delays=None):
+        from advanced_keyword_analyzer import AdvancedKeywordAnalyzer
+        return AdvancedKeywordAnalyzer(client=FakeClient(errors, delays))
+
+    def rate_limited(self):
+        from naver_client import NaverAPIError
+        return {endpoint: NaverAPIError(429) for endpoint in ('shop', 'blog', 'cafearticle', 'news')}
+
+    def test_429_marks_all_sources_failed(self):
+        analyzer = self.make_analyzer(self.rate_limited())
+        for concurrent in (True, False):
+            metrics = analyzer.analyze_keyword_metrics('테스트429', concurrent=concurrent)
+            self.assertEqual(sorted(metrics['failed_sources']), sorted(SOURCES))
+        # 실패한 결과는 이력에 저장하지 않음
+        self.assertIsNone(analyzer.history.get_snapshot('테스트429', date.today()))
+
+    def test_429_in_async_engine(self):
+        from async_keyword_analyzer import AsyncKeywordAnalyzer
+        analyzer = self.make_analyzer(self.rate_limited())
+        with AsyncKeywordAnalyzer(analyzer, concurrency=4) as engine:
+            results = engine.analyze_all(['비동기429'])
+        self.assertEqual(sorted(results[0]['failed_sources']), sorted(SOURCES))
+
+    def test_quota_exceeded_marks_only_that_source(self):
+        from rate_limiter import QuotaExceededError
+        analyzer = self.make_analyzer({'blog': QuotaExceededError("한도 초과")})
+        metrics = analyzer.analyze_keyword_metrics('할당량', concurrent=True)
+        self.assertEqual(metrics['failed_sources'], ['blog_data'])
+        self.assertEqual(metrics['shopping_data']['total_products'], 1234)
+
+    def test_success_has_no_failed_sources(self):
+        analyzer = self.make_analyzer({})
+        metrics = analyzer.analyze_keyword_metrics('정상', concurrent=True)
+        self.assertNotIn('failed_sources', metrics)
+
+
+class SourceTimeoutTest(unittest.TestCase):
+    """공용 스레드 풀이 바쁠 때 대기 시간은 소스 타임아웃에 포함되지 않아야 한다"""
+
+    def setUp(self):
+        from advanced_keyword_analyzer import AdvancedKeywordAnalyzer
+        self.saved_executor = AdvancedKeywordAnalyzer._executor
+        AdvancedKeywordAnalyzer._executor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self):
+        from advanced_keyword_analyzer import AdvancedKeywordAnalyzer
+        AdvancedKeywordAnalyzer._executor.shutdown(wait=True)
+        AdvancedKeywordAnalyzer._executor = self.saved_executor
+
+    def make_analyzer(self, delays):
+        from advanced_keyword_analyzer import AdvancedKeywordAnalyzer
+        return AdvancedKeywordAnalyzer(client=FakeClient({}, delays))
+
+    def test_queue_wait_not_charged_to_timeout(self):
+        # 소스당 0.2초, 한 번에 하나씩 실행 → 마지막 소스는 0.6초 대기하지만 타임아웃(0.5초)이 아님
+        delays = {endpoint: 0.2 for endpoint in ('shop', 'blog', 'cafearticle', 'news')}
+        metrics = self.make_analyzer(delays).analyze_keyword_metrics('대기열', concurrent=True, timeout=0.5)
+        self.assertNotIn('failed_sources', metrics)
+
+    def test_slow_source_times_out(self):
+        metrics = self.make_analyzer({'blog': 1.0}).analyze_keyword_metrics('느림', concurrent=True,
+                                                                            timeout=0.3)
+        self.assertEqual(metrics['failed_sources'], ['blog_data'])
+
+    def test_closing_early_cancels_queued_sources(self):
+        # 첫 결과만 받고 그만두면 아직 시작하지 않은 소스는 API를 호출하지 않음
+        analyzer = self.make_analyzer({'shop': 0.3, 'blog': 0.3})
+        results = analyzer.iter_source_metrics('취소', timeout=5)
+        next(results)
+        results.close()
+        type(analyzer)._executor.shutdown(wait=True)
+        self.assertNotIn('cafearticle', analyzer.client.calls)
+        self.assertNotIn('news', analyzer.client.calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
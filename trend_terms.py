@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+상품명 트렌드 단어 추출
+- 검색 결과 강조 태그(<b>)/HTML 엔티티 제거, NFKC 정규화 (전각 문자, 호환 자모 등 통일)
+- 한글/영문/숫자 토큰 단위 1-gram, 2-gram 집계 (상품명 하나에서 같은 단어는 한 번만)
+- 불용어(배송/할인 문구, 용량/수량 표기 등) 제외
+- 함께 자주 나오는 2-gram은 복합명사로 보고 구성 단어 대신 사용 (예: '무선 이어폰')
+"""
+import re
+import html
+import unicodedata
+from collections import Counter
+from typing import Iterable, List
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+TOKEN_PATTERN = re.compile(r'[0-9a-z가-힣]+')
+# 숫자만, 또는 숫자+단위 (500ml, 2개, 3p, 10kg ...)
+MEASURE_PATTERN = re.compile(r'\d+[a-z가-힣]{0,3}')
+
+STOPWORDS = frozenset([
+    '무료배송', '당일발송', '당일출고', '빠른배송', '오늘출발', '국내배송', '해외직구', '정품', '국내정품',
+    '공식', '공식판매', '본사', '최신', '신상', '신제품', '인기', '추천', '베스트', '할인', '특가', '세일',
+    '행사', '증정', '사은품', '이벤트', '한정', '단독', '선택', '옵션', '모음', '전용', '호환', '세트',
+    '대용량', '소용량', '고급', '프리미엄', '남녀공용', '남성', '여성', '남자', '여자', '및', '외',
+    'the', 'and', 'for', 'with', 'new', 'set'
+])
+
+# 2-gram 빈도가 구성 단어 빈도의 이 비율 이상이면 복합명사로 간주
+COMPOUND_RATIO = 0.5
+
+
+def normalize_title(title: str) -> str:
+    """태그/엔티티 제거 후 NFKC 정규화, 소문자 변환"""
+    return unicodedata.normalize('NFKC', html.unescape(TAG_PATTERN.sub(' ', title))).lower()
+
+
+def tokenize(title: str, stopwords: frozenset = STOPWORDS) -> List[str]:
+    """상품명 → 토큰 목록 (한 글자, 불용어, 수량/용량 표기 제외)"""
+    return [token for token in TOKEN_PATTERN.findall(normalize_title(title))
+            if len(token) > 1 and token not in stopwords and not MEASURE_PATTERN.fullmatch(token)]
+
+
+def count_terms(titles: Iterable[str], stopwords: frozenset = STOPWORDS,
+                counter: Counter = None) -> Counter:
+    """1-gram/2-gram('단어 단어')별 등장한 상품명 수 집계 (counter가 주어지면 이어서 집계)"""
+    counter = counter if counter is not None else Counter()
+    for title in titles:
+        tokens = tokenize(title, stopwords)
+        terms = set(tokens)
+        terms.update(f"{first} {second}" for first, second in zip(tokens, tokens[1:]) if first != second)
+        counter.update(terms)
+    return counter
+
+
+def top_terms(counter: Counter, n: int = 5, min_count: int = 2,
+              exclude: Iterable[str] = ()) -> List[str]:
+    """빈도 상위 트렌드 단어 (복합명사 2-gram은 구성 단어 대신 포함)"""
+    excluded = {normalize_title(term) for term in exclude}
+    candidates = Counter()
+    absorbed = set()
+    for term, count in counter.items():
+        if count < min_count or term in excluded:
+            continue
+        parts = term.split(' ')
+        if len(parts) == 1:
+            candidates[term] = count
+            continue
+        if count >= COMPOUND_RATIO * min(counter[part] for part in parts):
+            candidates[term] = count
+            absorbed.update(part for part in parts if count >= COMPOUND_RATIO * counter[part])
+
+    ranked = [(term, count) for term, count in candidates.items() if term not in absorbed]
+    ranked.sort(key=lambda item: (-item[1], item[0]))
+    return [term for term, _ in ranked[:n]]
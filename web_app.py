@@ -2,17 +2,26 @@
 """
 네이버 블로그 자동화 웹 인터페이스
 """
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, session, Response, stream_with_context
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from advanced_keyword_analyzer import AdvancedKeywordAnalyzer
 from expanded_keyword_list import KEYWORDS
-import requests
 from dotenv import load_dotenv
 import json
 from keyword_refiner import KeywordRefiner
 from auto_updater import updater
 from auth import requires_auth, handle_login, logout
+from naver_client import naver_client, NaverAPIError
+from rate_limiter import QuotaExceededError
+from product_catalog import search_product_listing
+from job_queue import JobQueue
+from search_volume_store import search_volumes
+from cache_warmer import is_complete_analysis, has_refined_volume, ESTIMATED_CALLS
+from single_flight import SingleFlight, FlightProgress
+from scheduler import scheduler_store
 
 load_dotenv()
 
@@ -21,9 +30,33 @@ app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-producti
 analyzer = AdvancedKeywordAnalyzer()
 refiner = KeywordRefiner()
 
-# 자동 업데이트 스케줄러 시작 (개발 환경에서만)
-if os.environ.get('FLASK_ENV') != 'production':
-    updater.start_scheduler()
+# 오래 걸리는 분석/세분화용 백그라운드 작업 큐 (결과는 data/jobs.db에 저장되어 워커 간 공유)
+jobs = JobQueue()
+jobs.register('analyze', lambda params, progress: run_analysis(params['keyword']))
+jobs.register('refine', lambda params, progress: run_refine(params['keyword'], progress))
+# 재시작 등으로 끝나지 못한 작업 이어서 실행
+jobs.recover()
+
+# 일괄 분석 요청당 최대 키워드 수 / 워커 프로세스당 동시 분석 키워드 수 (모든 요청 공용)
+# 일괄 분석이 남겨둘 일일 할당량 - 남은 할당량이 이보다 적으면 캐시에 없는 키워드는 분석하지 않음
+BATCH_MAX_KEYWORDS = int(os.getenv('ANALYZE_BATCH_MAX', 300))
+BATCH_CONCURRENCY = int(os.getenv('ANALYZE_BATCH_CONCURRENCY', 8))
+BATCH_QUOTA_RESERVE = int(os.getenv('ANALYZE_BATCH_QUOTA_RESERVE', 5000))
+
+# 일괄 분석 전용 스레드 풀 - 동시에 들어온 요청이 많아도 분석은 BATCH_CONCURRENCY개씩만 진행
+# 소스는 이 스레드에서 순차 수집하므로 단건/스트리밍 분석의 소스 수집 풀을 차지하지 않음
+batch_executor = ThreadPoolExecutor(max_workers=max(1, BATCH_CONCURRENCY), thread_name_prefix='batch')
+# 같은 키워드를 여러 요청이 동시에 분석하면 한 번만 분석하고 결과 공유
+# 진행 중인 분석의 소스별 결과는 같은 키워드를 기다리는 스트리밍 요청에 전달
+analysis_flight = SingleFlight()
+analysis_progress = FlightProgress()
+
+# 스트리밍 분석에서 분석을 기다리는 스레드 (요청 스레드는 진행 상황을 보내는 동안 분석 완료를 기다리지 않음)
+STREAM_WORKERS = int(os.getenv('ANALYZE_STREAM_WORKERS', 16))
+stream_executor = ThreadPoolExecutor(max_workers=max(1, STREAM_WORKERS), thread_name_prefix='stream')
+
+# 배치 작업(트렌드/인기 키워드/예열/캐시 정리)은 별도 스케줄러 프로세스에서 실행
+# (python -m auto_updater --scheduler) - 웹 워커는 실행 요청만 등록
 
 # 전역 변수로 분석 결과 저장 (이제 updater의 캐시 사용)
 cached_analysis = {}
@@ -56,7 +89,8 @@ def get_trends():
     """트렌드 키워드 가져오기"""
     category = request.args.get('category', 'all')
     
-    # 자동 업데이트된 트렌드 키워드 사용
+    # 자동 업데이트된 트렌드 키워드 사용 (다른 워커가 갱신했으면 다시 읽음)
+    updater.reload_if_changed()
     trend_keywords = updater.trend_keywords
     
     if category == 'all':
@@ -94,10 +128,25 @@ def refine_keyword():
     if not keyword:
         return jsonify({'error': '키워드가 필요합니다'}), 400
     
-    # 세분화된 키워드 가져오기
-    refined_data = refiner.get_related_keywords(keyword)
+    # 캐시에 없는 키워드를 async로 요청하면 작업 ID만 반환 (GET /api/jobs/<id> 로 진행률/결과 조회)
+    if data.get('async') and updater.get_with_staleness(f'refine_{keyword}') is None:
+        return submit_job('refine', keyword)
     
-    return jsonify(refined_data)
+    # 세분화된 키워드 가져오기
+    return jsonify(run_refine(keyword))
+
+def run_refine(keyword, progress=None):
+    """키워드 세분화 (캐시 우선, 예열된 결과가 있으면 바로 반환)"""
+    cache_key = f'refine_{keyword}'
+    # 진행률은 새로 계산할 때만 보고 (stale 항목의 백그라운드 갱신은 작업이 끝난 뒤에 실행됨)
+    if updater.get_with_staleness(cache_key) is not None:
+        progress = None
+    refined, is_stale = updater.get_or_revalidate(
+        cache_key,
+        lambda: refiner.get_related_keywords(keyword, progress=progress),
+        cacheable=has_refined_volume
+    )
+    return dict(refined, is_stale=is_stale)
 
 @app.route('/api/analyze', methods=['POST'])
 def analyze_keyword():
@@ -108,36 +157,260 @@ def analyze_keyword():
     if not keyword:
         return jsonify({'error': '키워드가 필요합니다'}), 400
     
-    # updater의 캐시 먼저 확인 (24시간 자동 만료)
-    cached_data = updater.get_from_cache(f'analysis_{keyword}')
-    if cached_data:
-        metrics = cached_data
-    else:
-        # 새로 분석
-        metrics = analyzer.analyze_keyword_metrics(keyword)
-        # updater 캐시에 저장
-        updater.add_to_cache(f'analysis_{keyword}', metrics)
-    
-    # 결과 정리
-    posts_7d = metrics['blog_data']['recent_posts_7d']
-    # 문자열("100+")이면 그대로, 숫자면 숫자로
-    if isinstance(posts_7d, str):
-        blog_posts_7d_display = posts_7d
-    else:
-        blog_posts_7d_display = posts_7d
-    
-    result = {
-        'keyword': keyword,
-        'total_products': metrics['shopping_data']['total_products'],
-        'avg_price': int(metrics['shopping_data']['avg_price']),
-        'blog_posts_7d': blog_posts_7d_display,
-        'posting_frequency': metrics['blog_data']['posting_frequency'],
-        'community_interest': metrics['cafe_data']['community_interest'],
+    # 캐시에 없는 키워드를 async로 요청하면 백그라운드 작업으로 분석
+    if data.get('async') and updater.get_with_staleness(f'analysis_{keyword}') is None:
+        return submit_job('analyze', keyword)
+    
+    return jsonify(run_analysis(keyword))
+
+def run_analysis(keyword):
+    """키워드 분석 후 화면 표시용 결과 반환"""
+    metrics, is_stale = load_analysis(keyword)
+    return format_analysis(keyword, metrics, is_stale)
+
+def load_analysis(keyword):
+    """분석 메트릭과 stale 여부 반환"""
+    # updater의 캐시 먼저 확인 (24시간 만료, stale 항목은 즉시 반환 후 백그라운드 갱신)
+    # 새로 분석할 때는 소스 병렬 수집, 일부 소스가 실패한 부분 결과는 캐시하지 않음
+    return updater.get_or_revalidate(
+        f'analysis_{keyword}',
+        lambda: analyze_fresh(keyword),
+        cacheable=is_complete_analysis
+    )
+
+def analyze_fresh(keyword, concurrent=True):
+    """키워드 새로 분석 (같은 키워드를 분석 중이면 그 결과 공유 - 수정 금지)
+
+    concurrent=False 이면 호출한 스레드에서 소스를 순차 수집한다 (일괄 분석용).
+    """
+    return analysis_flight.do(keyword, run_fresh_analysis, keyword, concurrent)
+
+def run_fresh_analysis(keyword, concurrent):
+    """분석 실행 (single-flight 리더만) - 소스별 결과를 analysis_progress 구독자에게 전달"""
+    analysis_progress.begin(keyword)
+    try:
+        return analyzer.analyze_keyword_metrics(
+            keyword, concurrent=concurrent,
+            on_source=lambda source, data, ok: analysis_progress.publish(keyword, (source, data, ok)))
+    finally:
+        analysis_progress.end(keyword)
+
+def format_source_fields(source, data):
+    """소스 하나의 메트릭을 화면 표시 항목으로 변환"""
+    if source == 'shopping_data':
+        return {
+            'total_products': data['total_products'],
+            'avg_price': int(data['avg_price'])
+        }
+    if source == 'blog_data':
+        # 예전 캐시 항목("100+" 문자열)도 숫자로 변환
+        data = analyzer.normalize_blog_metrics(data)
+        return {
+            'blog_posts_7d': data['recent_posts_7d'],
+            'blog_posts_lower_bound': data['is_lower_bound'],
+            'posts_per_day': data['posts_per_day'],
+            'posting_frequency': data['posting_frequency']
+        }
+    if source == 'cafe_data':
+        return {'community_interest': data['community_interest']}
+    return {}
+
+def format_analysis(keyword, metrics, is_stale=False):
+    """분석 메트릭을 화면 표시용 결과로 정리"""
+    result = {'keyword': keyword}
+    for source in analyzer.source_fetchers:
+        result.update(format_source_fields(source, metrics[source]))
+    result.update({
         'total_score': metrics['total_score'],
-        'recommendation': get_recommendation_text(metrics['total_score'])
-    }
+        'recommendation': get_recommendation_text(metrics['total_score']),
+        'is_stale': is_stale
+    })
+    return result
+
+@app.route('/api/analyze/stream', methods=['GET'])
+def analyze_keyword_stream():
+    """키워드 분석 (Server-Sent Events)
+    
+    소스별 결과를 수집되는 즉시 'source' 이벤트로 보내고, 마지막에 종합 점수를 'done' 이벤트로 보낸다.
+    캐시된 결과는 모든 이벤트를 한 번에 보낸다.
+    같은 키워드를 이미 분석 중이면 새로 분석하지 않고 그 분석의 진행 상황을 받아서 보낸다.
+    """
+    keyword = request.args.get('keyword')
+    
+    if not keyword:
+        return jsonify({'error': '키워드가 필요합니다'}), 400
+    
+    cache_key = f'analysis_{keyword}'
+    loader = lambda: analyze_fresh(keyword)
+    
+    def generate():
+        cached = updater.get_with_staleness(cache_key)
+        if cached is not None:
+            metrics, is_stale = cached
+            if is_stale:
+                updater.schedule_revalidation(cache_key, loader, is_complete_analysis)
+            for source in analyzer.source_fetchers:
+                yield sse_event('source', {'source': source, 'ok': True,
+                                           'fields': format_source_fields(source, metrics[source])})
+            yield sse_event('done', format_analysis(keyword, metrics, is_stale))
+            return
+        
+        # 분석(또는 진행 중인 같은 키워드 분석에 합류)은 별도 스레드에서, 여기서는 진행 상황 전달
+        updates = analysis_progress.subscribe(keyword)
+        try:
+            future = stream_executor.submit(load_analysis, keyword)
+            future.add_done_callback(lambda _: updates.put(None))
+            
+            sent = set()
+            for source, data, ok in iter(updates.get, None):
+                if source not in sent:
+                    sent.add(source)
+                    yield sse_event('source', {'source': source, 'ok': ok,
+                                               'fields': format_source_fields(source, data)})
+            
+            # 늦게 합류해 받지 못한 소스는 최종 결과로 채움
+            metrics, is_stale = future.result()
+            failed_sources = metrics.get('failed_sources', [])
+            for source in analyzer.source_fetchers:
+                if source not in sent:
+                    yield sse_event('source', {'source': source, 'ok': source not in failed_sources,
+                                               'fields': format_source_fields(source, metrics[source])})
+            yield sse_event('done', format_analysis(keyword, metrics, is_stale))
+        except Exception as e:
+            print(f"❌ 스트리밍 분석 실패: {e}")
+            yield sse_event('error', {'error': str(e)})
+        finally:
+            analysis_progress.unsubscribe(keyword, updates)
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+def sse_event(event, data):
+    """Server-Sent Events 메시지 한 건"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.route('/api/analyze/batch', methods=['POST'])
+def analyze_batch():
+    """여러 키워드 일괄 분석
+    
+    캐시된 키워드는 바로 응답하고, 없는 키워드는 일괄 분석 전용 스레드 풀에서 분석한다 (공용 속도 제한 적용).
+    일일 할당량이 여유분(ANALYZE_BATCH_QUOTA_RESERVE) 아래로 내려가면 남은 키워드는 오류 항목으로 반환한다.
+    stream=true 이면 결과를 끝나는 순서대로 NDJSON(한 줄에 결과 하나)으로 보낸다.
+    """
+    data = request.json or {}
+    keywords = data.get('keywords')
+    
+    if not isinstance(keywords, list) or not keywords:
+        return jsonify({'error': '키워드 목록이 필요합니다'}), 400
+    keywords = list(dict.fromkeys(
+        keyword.strip() for keyword in keywords if isinstance(keyword, str) and keyword.strip()))
+    if not keywords:
+        return jsonify({'error': '키워드 목록이 필요합니다'}), 400
+    if len(keywords) > BATCH_MAX_KEYWORDS:
+        return jsonify({'error': f'한 번에 최대 {BATCH_MAX_KEYWORDS}개 키워드까지 분석할 수 있습니다'}), 400
+    
+    # 캐시 조회 (stale 항목은 바로 반환하고 백그라운드 갱신)
+    cached = []
+    pending = []
+    for keyword in keywords:
+        cache_key = f'analysis_{keyword}'
+        hit = updater.get_with_staleness(cache_key)
+        if hit is None:
+            pending.append(keyword)
+            continue
+        metrics, is_stale = hit
+        if is_stale:
+            updater.schedule_revalidation(
+                cache_key, lambda keyword=keyword: analyze_fresh(keyword), is_complete_analysis)
+        cached.append(format_analysis(keyword, metrics, is_stale))
+    
+    analyzed = analyze_uncached(pending) if pending else iter(())
+    
+    if data.get('stream'):
+        def generate():
+            for result in cached:
+                yield json.dumps(result, ensure_ascii=False) + '\n'
+            for result in analyzed:
+                yield json.dumps(result, ensure_ascii=False) + '\n'
+        
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    
+    results = {result['keyword']: result for result in cached}
+    results.update((result['keyword'], result) for result in analyzed)
+    over_budget = sum(1 for result in results.values() if result.get('over_budget'))
+    return jsonify({
+        'results': [results[keyword] for keyword in keywords],
+        'cached': len(cached),
+        'analyzed': len(pending) - over_budget,
+        'over_budget': over_budget
+    })
+
+def analyze_uncached(keywords):
+    """캐시에 없는 키워드를 일괄 분석 전용 스레드 풀에서 분석하여 끝나는 순서대로 결과 반환
+    
+    분석은 요청 스레드 밖에서 진행되므로 스트리밍 클라이언트가 끊겨도 끝까지 분석해 캐시에 저장한다.
+    실패한 키워드는 {'keyword', 'error'} 항목으로, 할당량 여유가 없어 건너뛴 키워드는
+    over_budget=True 를 붙여 반환한다.
+    """
+    finished = queue.Queue()
+    
+    def analyze(keyword):
+        # 실행 직전에 공용 일일 할당량 확인 (모든 요청/워커가 같은 사용량을 보므로 요청 수와 무관하게 제한)
+        # 동시에 실행 중인 분석만큼은 여유분을 조금 넘을 수 있음
+        if naver_client.rate_limiter.remaining_quota() - BATCH_QUOTA_RESERVE < ESTIMATED_CALLS['analysis']:
+            finished.put({'keyword': keyword, 'over_budget': True,
+                          'error': '일일 API 할당량 여유 부족 - 내일 다시 요청해주세요'})
+            return
+        try:
+            metrics = analyze_fresh(keyword, concurrent=False)
+            if is_complete_analysis(metrics):
+                updater.add_to_cache(f'analysis_{keyword}', metrics)
+            finished.put(format_analysis(keyword, metrics))
+        except Exception as e:
+            print(f"❌ '{keyword}' 일괄 분석 실패: {e}")
+            finished.put({'keyword': keyword, 'error': '분석 중 오류가 발생했습니다'})
+    
+    # 캐시된 결과를 보내는 동안에도 분석이 진행되도록 바로 시작
+    for keyword in keywords:
+        batch_executor.submit(analyze, keyword)
     
-    return jsonify(result)
+    def drain():
+        for _ in keywords:
+            yield finished.get()
+    
+    return drain()
+
+def submit_job(job_type, keyword):
+    """백그라운드 작업 등록 후 202 응답"""
+    job_id = jobs.submit(job_type, {'keyword': keyword})
+    return jsonify({
+        'job_id': job_id,
+        'status': 'queued',
+        'status_url': f'/api/jobs/{job_id}'
+    }), 202
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """백그라운드 작업 등록 (type: analyze | refine)"""
+    data = request.json or {}
+    job_type = data.get('type')
+    keyword = data.get('keyword')
+    
+    if job_type not in jobs.handlers:
+        return jsonify({'error': f'지원하지 않는 작업 유형입니다: {job_type}'}), 400
+    if not keyword:
+        return jsonify({'error': '키워드가 필요합니다'}), 400
+    
+    return submit_job(job_type, keyword)
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """작업 상태/진행률/결과 조회"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다'}), 404
+    return jsonify(job)
 
 @app.route('/api/products', methods=['POST'])
 def search_products():
@@ -150,64 +423,15 @@ def search_products():
     
     print(f"\n🔍 상품 검색 요청: {keyword}")
     
-    # 네이버 쇼핑 API 호출
-    headers = {
-        "X-Naver-Client-Id": os.getenv('NAVER_CLIENT_ID'),
-        "X-Naver-Client-Secret": os.getenv('NAVER_CLIENT_SECRET')
-    }
-    
-    url = "https://openapi.naver.com/v1/search/shop.json"
-    params = {
-        "query": keyword,
-        "display": 20,  # 더 많이 가져와서 선별
-        "sort": "sim"
-    }
-    
+    # 캐시 우선 (stale 항목은 즉시 반환하고 백그라운드 갱신)
     try:
-        response = requests.get(url, headers=headers, params=params)
-        print(f"API 응답 코드: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            total = data.get('total', 0)
-            items = data.get('items', [])
-            
-            print(f"검색 결과: 총 {total}개, 받은 항목: {len(items)}개")
-            
-            products = []
-            
-            # 가격이 있는 상품만 필터링
-            valid_items = [item for item in items if item.get('lprice') and int(item['lprice']) > 0]
-            
-            for item in valid_items[:8]:
-                try:
-                    product = {
-                        'title': item['title'].replace('<b>', '').replace('</b>', ''),
-                        'price': f"{int(item['lprice']):,}",
-                        'link': item['link'],
-                        'image': item.get('image', ''),
-                        'mall': item.get('mallName', '네이버쇼핑'),
-                        'category': item.get('category1', '')
-                    }
-                    products.append(product)
-                except Exception as e:
-                    print(f"상품 처리 오류: {e}")
-                    continue
-            
-            if not products and total > 0:
-                # 상품은 있지만 처리할 수 없는 경우
-                print("⚠️ 상품은 있지만 유효한 데이터가 없습니다.")
-                return jsonify({
-                    'products': [],
-                    'message': '상품 정보를 불러올 수 없습니다. 다른 키워드를 시도해보세요.'
-                })
-            
-            return jsonify({'products': products})
-        else:
-            error_msg = f"API 오류: {response.status_code}"
-            print(f"❌ {error_msg}")
-            return jsonify({'error': error_msg, 'products': []}), 200
+        listing, is_stale = updater.get_or_revalidate(
+            f'products_{keyword}', lambda: search_product_listing(keyword))
+        return jsonify(dict(listing, is_stale=is_stale))
             
+    except (NaverAPIError, QuotaExceededError) as e:
+        print(f"❌ {e}")
+        return jsonify({'error': str(e), 'products': []}), 200
     except Exception as e:
         print(f"❌ 상품 검색 실패: {str(e)}")
         return jsonify({'error': '상품 검색 중 오류가 발생했습니다', 'products': []}), 200
@@ -243,28 +467,14 @@ def generate_content():
 
 def collect_blog_reviews(keyword):
     """블로그 후기 수집"""
-    headers = {
-        "X-Naver-Client-Id": os.getenv('NAVER_CLIENT_ID'),
-        "X-Naver-Client-Secret": os.getenv('NAVER_CLIENT_SECRET')
-    }
-    
-    url = "https://openapi.naver.com/v1/search/blog.json"
-    params = {
-        "query": f"{keyword} 후기",
-        "display": 5,
-        "sort": "sim"
-    }
-    
     reviews = []
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            items = response.json().get('items', [])
-            for item in items:
-                reviews.append({
-                    'title': item['title'].replace('<b>', '').replace('</b>', ''),
-                    'description': item['description'].replace('<b>', '').replace('</b>', '')[:200]
-                })
+        items = naver_client.blog(f"{keyword} 후기", display=5, sort="sim").get('items', [])
+        for item in items:
+            reviews.append({
+                'title': item['title'].replace('<b>', '').replace('</b>', ''),
+                'description': item['description'].replace('<b>', '').replace('</b>', '')[:200]
+            })
     except:
         pass
     
@@ -345,32 +555,37 @@ def get_recommendation_text(score):
 @requires_auth
 def admin_status():
     """관리자 상태 확인"""
+    updater.reload_if_changed()
     status = {
         'trend_keywords_count': len(updater.trend_keywords),
         'popular_keywords_count': len(updater.popular_keywords.get('keywords', {})),
-        'cache_entries': len(updater.cache_data),
+        'cache_entries': len(updater.cache),
+        'local_cache': updater.local_cache.stats(),
         'last_trend_update': updater.trend_keywords.get('updated_at', 'N/A'),
-        'last_popular_update': updater.popular_keywords.get('updated_at', 'N/A')
+        'last_popular_update': updater.popular_keywords.get('updated_at', 'N/A'),
+        'api_quota': naver_client.rate_limiter.status(),
+        'coalesced_requests': naver_client.single_flight.coalesced,
+        'search_volume_store': search_volumes.stats(),
+        'jobs': jobs.stats(),
+        'scheduler': scheduler_store.status()
     }
     return jsonify(status)
 
 @app.route('/api/admin/force-update', methods=['POST'])
 @requires_auth
 def admin_force_update():
-    """강제 업데이트"""
+    """강제 업데이트 요청 (스케줄러 프로세스가 다음 확인 주기에 실행)"""
     update_type = request.json.get('type', 'all')
+    if update_type not in ('trends', 'popular', 'cache', 'warm'):
+        update_type = 'all'
     
     try:
-        if update_type == 'trends':
-            updater.update_trend_keywords()
-        elif update_type == 'popular':
-            updater.update_popular_keywords()
-        elif update_type == 'cache':
-            updater.clean_expired_cache()
-        else:
-            updater.force_update_all()
+        scheduler_store.request_run(update_type)
         
-        return jsonify({'success': True, 'message': f'{update_type} 업데이트 완료'})
+        message = f'{update_type} 업데이트 요청 등록'
+        if scheduler_store.leader() is None:
+            message += ' (실행 중인 스케줄러가 없습니다: python -m auto_updater --scheduler)'
+        return jsonify({'success': True, 'queued': True, 'message': message}), 202
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 